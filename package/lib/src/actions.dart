@@ -7,6 +7,7 @@ import 'protocol/app_become_inactive_payload.dart';
 import 'protocol/append_control_props_request.dart';
 import 'protocol/clean_control_payload.dart';
 import 'protocol/invoke_method_payload.dart';
+import 'protocol/move_control_payload.dart';
 import 'protocol/page_controls_batch_payload.dart';
 import 'protocol/register_webclient_response.dart';
 import 'protocol/remove_control_payload.dart';
@@ -111,3 +112,8 @@ class RemoveControlAction {
   final RemoveControlPayload payload;
   RemoveControlAction(this.payload);
 }
+
+class MoveControlAction {
+  final MoveControlPayload payload;
+  MoveControlAction(this.payload);
+}
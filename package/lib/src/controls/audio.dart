@@ -7,6 +7,7 @@ import 'package:flutter/foundation.dart';
 import 'package:flutter/widgets.dart';
 
 import '../models/control.dart';
+import '../utils/uri.dart';
 import 'error.dart';
 
 class AudioControl extends StatefulWidget {
@@ -75,6 +76,13 @@ class _AudioControlState extends State<AudioControl> {
 
     var src = widget.control.attrString("src", "")!;
     var srcBase64 = widget.control.attrString("srcBase64", "")!;
+    // base64 data uploaded by host to the blob store
+    var srcBlob = widget.control.attrString("srcBlob", "")!;
+    if (srcBlob != "") {
+      src = getAssetUri(
+              FletAppServices.of(context).store.state.pageUri!, srcBlob)
+          .toString();
+    }
     if (src == "" && srcBase64 == "") {
       return const ErrorControl(
           "Audio must have either \"src\" or \"src_base64\" specified.");
@@ -182,7 +190,7 @@ class _AudioControlState extends State<AudioControl> {
         sendResult(Object? result, String? error) {
           ws.pageEventFromWeb(
               eventTarget: widget.control.id,
-              eventName: "result",
+              eventName: "method_result",
               eventData: json.encode({
                 "i": i,
                 "r": result != null ? json.encode(result) : null,
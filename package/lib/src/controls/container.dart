@@ -55,6 +55,10 @@ class ContainerControl extends StatelessWidget {
 
     var imageSrc = control.attrString("imageSrc", "")!;
     var imageSrcBase64 = control.attrString("imageSrcBase64", "")!;
+    var imageSrcBlob = control.attrString("imageSrcBlob", "")!;
+    if (imageSrcBlob != "") {
+      imageSrc = imageSrcBlob;
+    }
     var imageRepeat = parseImageRepeat(control, "imageRepeat");
     var imageFit = parseBoxFit(control, "imageFit");
     var imageOpacity = control.attrDouble("imageOpacity", 1)!;
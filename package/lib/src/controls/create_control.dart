@@ -45,10 +45,12 @@ import 'radio.dart';
 import 'radio_group.dart';
 import 'row.dart';
 import 'semantics.dart';
+import 'series_chart.dart';
 import 'shader_mask.dart';
 import 'slider.dart';
 import 'snack_bar.dart';
 import 'stack.dart';
+import 'streaming_chart.dart';
 import 'switch.dart';
 import 'tabs.dart';
 import 'text.dart';
@@ -110,6 +112,12 @@ Widget createControl(Control? parent, String id, bool parentDisabled) {
         case "progressring":
           return ProgressRingControl(
               parent: parent, control: controlView.control);
+        case "serieschart":
+          return SeriesChartControl(
+              parent: parent, control: controlView.control);
+        case "streamingchart":
+          return StreamingChartControl(
+              parent: parent, control: controlView.control);
         case "progressbar":
           return ProgressBarControl(
               parent: parent, control: controlView.control);
@@ -3,8 +3,9 @@ import 'package:flutter/widgets.dart';
 import '../models/control.dart';
 import '../utils/edge_insets.dart';
 import 'create_control.dart';
+import 'virtual_items.dart';
 
-class GridViewControl extends StatelessWidget {
+class GridViewControl extends StatefulWidget {
   final Control? parent;
   final Control control;
   final bool parentDisabled;
@@ -19,10 +20,18 @@ class GridViewControl extends StatelessWidget {
       : super(key: key);
 
   @override
+  State<GridViewControl> createState() => _GridViewControlState();
+}
+
+class _GridViewControlState extends State<GridViewControl>
+    with VirtualItemsStateMixin {
+  @override
   Widget build(BuildContext context) {
+    var control = widget.control;
+    var children = widget.children;
     debugPrint("GridViewControl build: ${control.id}");
 
-    bool disabled = control.isDisabled || parentDisabled;
+    bool disabled = control.isDisabled || widget.parentDisabled;
 
     final horizontal = control.attrBool("horizontal", false)!;
     final runsCount = control.attrInt("runsCount", 1)!;
@@ -34,6 +43,8 @@ class GridViewControl extends StatelessWidget {
 
     List<Control> visibleControls = children.where((c) => c.isVisible).toList();
 
+    final virtual = isVirtual(control);
+
     var gridView = LayoutBuilder(
       builder: (BuildContext context, BoxConstraints constraints) {
         debugPrint("constraints.maxWidth: ${constraints.maxWidth}");
@@ -60,14 +71,19 @@ class GridViewControl extends StatelessWidget {
           shrinkWrap: shrinkWrap,
           padding: padding,
           gridDelegate: gridDelegate,
-          itemCount: visibleControls.length,
+          itemCount:
+              virtual ? virtualItemCount(control) : visibleControls.length,
           itemBuilder: (context, index) {
+            if (virtual) {
+              return buildVirtualItem(
+                  control, children, index, disabled, const SizedBox.shrink());
+            }
             return createControl(control, visibleControls[index].id, disabled);
           },
         );
       },
     );
 
-    return constrainedControl(context, gridView, parent, control);
+    return constrainedControl(context, gridView, widget.parent, control);
   }
 }
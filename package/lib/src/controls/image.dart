@@ -31,6 +31,11 @@ class ImageControl extends StatelessWidget {
 
     var src = control.attrString("src", "")!;
     var srcBase64 = control.attrString("srcBase64", "")!;
+    // base64 data uploaded by host to the blob store
+    var srcBlob = control.attrString("srcBlob", "")!;
+    if (srcBlob != "") {
+      src = srcBlob;
+    }
     if (src == "" && srcBase64 == "") {
       return const ErrorControl(
           "Image must have either \"src\" or \"src_base64\" specified.");
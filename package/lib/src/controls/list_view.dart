@@ -3,14 +3,15 @@ import 'package:flutter/material.dart';
 import '../models/control.dart';
 import '../utils/edge_insets.dart';
 import 'create_control.dart';
+import 'virtual_items.dart';
 
-class ListViewControl extends StatelessWidget {
+class ListViewControl extends StatefulWidget {
   final Control? parent;
   final Control control;
   final bool parentDisabled;
   final List<Control> children;
 
-  ListViewControl(
+  const ListViewControl(
       {Key? key,
       this.parent,
       required this.control,
@@ -18,8 +19,20 @@ class ListViewControl extends StatelessWidget {
       required this.parentDisabled})
       : super(key: key);
 
+  @override
+  State<ListViewControl> createState() => _ListViewControlState();
+}
+
+class _ListViewControlState extends State<ListViewControl>
+    with VirtualItemsStateMixin {
   final ScrollController _controller = ScrollController();
 
+  @override
+  void dispose() {
+    _controller.dispose();
+    super.dispose();
+  }
+
   void _scrollDown() {
     _controller.animateTo(
       _controller.position.maxScrollExtent,
@@ -30,9 +43,11 @@ class ListViewControl extends StatelessWidget {
 
   @override
   Widget build(BuildContext context) {
+    var control = widget.control;
+    var children = widget.children;
     debugPrint("ListViewControl build: ${control.id}");
 
-    bool disabled = control.isDisabled || parentDisabled;
+    bool disabled = control.isDisabled || widget.parentDisabled;
 
     final horizontal = control.attrBool("horizontal", false)!;
     final autoScroll = control.attrBool("autoScroll", false)!;
@@ -44,6 +59,21 @@ class ListViewControl extends StatelessWidget {
 
     List<Control> visibleControls = children.where((c) => c.isVisible).toList();
 
+    final virtual = isVirtual(control);
+    final itemCount =
+        virtual ? virtualItemCount(control) : visibleControls.length;
+
+    Widget buildItem(int index) {
+      if (virtual) {
+        var placeholder = horizontal
+            ? SizedBox(width: itemExtent ?? 50)
+            : SizedBox(height: itemExtent ?? 50);
+        return buildVirtualItem(
+            control, children, index, disabled, placeholder);
+      }
+      return createControl(control, visibleControls[index].id, disabled);
+    }
+
     if (autoScroll) {
       WidgetsBinding.instance.addPostFrameCallback((_) {
         _scrollDown();
@@ -65,11 +95,8 @@ class ListViewControl extends StatelessWidget {
                 scrollDirection: horizontal ? Axis.horizontal : Axis.vertical,
                 shrinkWrap: shrinkWrap,
                 padding: padding,
-                itemCount: children.length,
-                itemBuilder: (context, index) {
-                  return createControl(
-                      control, visibleControls[index].id, disabled);
-                },
+                itemCount: itemCount,
+                itemBuilder: (context, index) => buildItem(index),
                 separatorBuilder: (context, index) {
                   return horizontal
                       ? dividerThickness == 0
@@ -87,19 +114,17 @@ class ListViewControl extends StatelessWidget {
                 scrollDirection: horizontal ? Axis.horizontal : Axis.vertical,
                 shrinkWrap: shrinkWrap,
                 padding: padding,
-                itemCount: children.length,
+                itemCount: itemCount,
                 itemExtent: itemExtent,
-                itemBuilder: (context, index) {
-                  return createControl(
-                      control, visibleControls[index].id, disabled);
-                },
-                prototypeItem: firstItemPrototype && children.isNotEmpty
+                itemBuilder: (context, index) => buildItem(index),
+                prototypeItem: firstItemPrototype &&
+                        visibleControls.isNotEmpty
                     ? createControl(control, visibleControls[0].id, disabled)
                     : null,
               );
       },
     );
 
-    return constrainedControl(context, listView, parent, control);
+    return constrainedControl(context, listView, widget.parent, control);
   }
 }
@@ -0,0 +1,170 @@
+import 'dart:math';
+
+import 'package:flutter/material.dart';
+
+import '../flet_app_services.dart';
+import '../models/control.dart';
+import '../utils/colors.dart';
+import 'create_control.dart';
+
+class SeriesChartControl extends StatefulWidget {
+  final Control? parent;
+  final Control control;
+
+  const SeriesChartControl(
+      {Key? key, required this.parent, required this.control})
+      : super(key: key);
+
+  @override
+  State<SeriesChartControl> createState() => _SeriesChartControlState();
+}
+
+class _SeriesChartControlState extends State<SeriesChartControl> {
+  String? _points;
+  List<double> _values = [];
+  int? _reportedWidth;
+
+  // the host downsamples the series to the width of the chart
+  void _reportWidth(double width) {
+    var w = width.round();
+    if (!width.isFinite || w <= 0 || w == _reportedWidth) {
+      return;
+    }
+    _reportedWidth = w;
+    WidgetsBinding.instance.addPostFrameCallback((_) {
+      if (mounted) {
+        FletAppServices.of(context).ws.pageEventFromWeb(
+            eventTarget: widget.control.id,
+            eventName: "resize",
+            eventData: w.toString());
+      }
+    });
+  }
+
+  @override
+  Widget build(BuildContext context) {
+    debugPrint("SeriesChart build: ${widget.control.id}");
+
+    // "x y x y..."
+    var points = widget.control.attrString("points", "")!;
+    if (points != _points) {
+      _points = points;
+      _values = points == ""
+          ? []
+          : points
+              .split(" ")
+              .map((s) => double.tryParse(s) ?? double.nan)
+              .toList();
+    }
+
+    var color = HexColor.fromString(
+            Theme.of(context), widget.control.attrString("color", "")!) ??
+        Theme.of(context).colorScheme.primary;
+    var bgColor = HexColor.fromString(
+        Theme.of(context), widget.control.attrString("bgColor", "")!);
+
+    return constrainedControl(
+        context,
+        Container(
+            color: bgColor,
+            child: LayoutBuilder(builder: (context, constraints) {
+              _reportWidth(constraints.maxWidth);
+              return CustomPaint(
+                  size: Size.infinite,
+                  painter: _SeriesChartPainter(
+                      values: _values,
+                      color: color,
+                      strokeWidth:
+                          widget.control.attrDouble("strokeWidth", 1)!,
+                      minX: widget.control.attrDouble("minX"),
+                      maxX: widget.control.attrDouble("maxX"),
+                      minY: widget.control.attrDouble("minY"),
+                      maxY: widget.control.attrDouble("maxY")));
+            })),
+        widget.parent,
+        widget.control);
+  }
+}
+
+class _SeriesChartPainter extends CustomPainter {
+  final List<double> values;
+  final Color color;
+  final double strokeWidth;
+  final double? minX;
+  final double? maxX;
+  final double? minY;
+  final double? maxY;
+
+  _SeriesChartPainter(
+      {required this.values,
+      required this.color,
+      required this.strokeWidth,
+      required this.minX,
+      required this.maxX,
+      required this.minY,
+      required this.maxY});
+
+  @override
+  void paint(Canvas canvas, Size size) {
+    var n = values.length ~/ 2;
+    if (n == 0) {
+      return;
+    }
+    var xs = [for (var i = 0; i < n; i++) values[2 * i]];
+    var ys = [
+      for (var i = 0; i < n; i++)
+        if (values[2 * i + 1].isFinite) values[2 * i + 1]
+    ];
+    if (ys.isEmpty) {
+      return;
+    }
+    var x0 = minX ?? xs.first;
+    var x1 = maxX ?? xs.last;
+    var y0 = minY ?? ys.reduce(min);
+    var y1 = maxY ?? ys.reduce(max);
+    if (x1 <= x0) {
+      x1 = x0 + 1;
+    }
+    if (y1 <= y0) {
+      y1 = y0 + 1;
+    }
+
+    var path = Path();
+    var drawing = false;
+    for (var i = 0; i < n; i++) {
+      var y = values[2 * i + 1];
+      if (!y.isFinite) {
+        // gap in the series
+        drawing = false;
+        continue;
+      }
+      var px = (xs[i] - x0) / (x1 - x0) * size.width;
+      var py = size.height - (y.clamp(y0, y1) - y0) / (y1 - y0) * size.height;
+      if (drawing) {
+        path.lineTo(px, py);
+      } else {
+        path.moveTo(px, py);
+        drawing = true;
+      }
+    }
+    canvas.clipRect(Offset.zero & size);
+    canvas.drawPath(
+        path,
+        Paint()
+          ..color = color
+          ..strokeWidth = strokeWidth
+          ..style = PaintingStyle.stroke
+          ..strokeJoin = StrokeJoin.round);
+  }
+
+  @override
+  bool shouldRepaint(_SeriesChartPainter oldDelegate) {
+    return oldDelegate.values != values ||
+        oldDelegate.color != color ||
+        oldDelegate.strokeWidth != strokeWidth ||
+        oldDelegate.minX != minX ||
+        oldDelegate.maxX != maxX ||
+        oldDelegate.minY != minY ||
+        oldDelegate.maxY != maxY;
+  }
+}
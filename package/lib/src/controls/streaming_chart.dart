@@ -0,0 +1,181 @@
+import 'dart:collection';
+import 'dart:math';
+
+import 'package:flutter/material.dart';
+
+import '../models/control.dart';
+import '../utils/colors.dart';
+import 'create_control.dart';
+
+class StreamingChartControl extends StatefulWidget {
+  final Control? parent;
+  final Control control;
+
+  const StreamingChartControl(
+      {Key? key, required this.parent, required this.control})
+      : super(key: key);
+
+  @override
+  State<StreamingChartControl> createState() => _StreamingChartControlState();
+}
+
+class _StreamingChartControlState extends State<StreamingChartControl> {
+  final ListQueue<double> _values = ListQueue<double>();
+  int _count = 0;
+  String? _data;
+  String? _append;
+
+  // applies "<start> <value> <value>..." series; values the chart
+  // already has are skipped, so the same series can be applied twice
+  void _applyValues(String s, int capacity) {
+    var parts = s.split(" ");
+    var start = int.tryParse(parts[0]) ?? 0;
+    if (start > _count) {
+      // some values were not received
+      _count = start;
+    }
+    for (var i = 1; i < parts.length; i++) {
+      if (start + i - 1 < _count) {
+        continue;
+      }
+      _values.add(double.tryParse(parts[i]) ?? double.nan);
+      _count++;
+    }
+    while (_values.length > capacity) {
+      _values.removeFirst();
+    }
+  }
+
+  @override
+  Widget build(BuildContext context) {
+    debugPrint("StreamingChart build: ${widget.control.id}");
+
+    var capacity = max(widget.control.attrInt("capacity", 1000)!, 1);
+
+    var data = widget.control.attrString("data", "")!;
+    if (data != _data) {
+      _data = data;
+      _values.clear();
+      _count = 0;
+      _applyValues(data, capacity);
+    }
+
+    var append = widget.control.attrString("append", "")!;
+    if (append != "" && append != _append) {
+      _append = append;
+      _applyValues(append, capacity);
+    }
+
+    var color = HexColor.fromString(
+            Theme.of(context), widget.control.attrString("color", "")!) ??
+        Theme.of(context).colorScheme.primary;
+    var bgColor = HexColor.fromString(
+        Theme.of(context), widget.control.attrString("bgColor", "")!);
+
+    return constrainedControl(
+        context,
+        Container(
+            color: bgColor,
+            child: CustomPaint(
+                size: Size.infinite,
+                painter: _StreamingChartPainter(
+                    values: List<double>.from(_values),
+                    count: _count,
+                    capacity: capacity,
+                    bar: widget.control.attrString("chartType", "")!
+                            .toLowerCase() ==
+                        "bar",
+                    color: color,
+                    strokeWidth:
+                        widget.control.attrDouble("strokeWidth", 2)!,
+                    minY: widget.control.attrDouble("minY"),
+                    maxY: widget.control.attrDouble("maxY")))),
+        widget.parent,
+        widget.control);
+  }
+}
+
+class _StreamingChartPainter extends CustomPainter {
+  final List<double> values;
+  final int count;
+  final int capacity;
+  final bool bar;
+  final Color color;
+  final double strokeWidth;
+  final double? minY;
+  final double? maxY;
+
+  _StreamingChartPainter(
+      {required this.values,
+      required this.count,
+      required this.capacity,
+      required this.bar,
+      required this.color,
+      required this.strokeWidth,
+      required this.minY,
+      required this.maxY});
+
+  @override
+  void paint(Canvas canvas, Size size) {
+    var finite = values.where((v) => v.isFinite);
+    if (finite.isEmpty) {
+      return;
+    }
+    var lo = minY ?? finite.reduce(min);
+    var hi = maxY ?? finite.reduce(max);
+    if (hi <= lo) {
+      hi = lo + 1;
+    }
+
+    double y(double v) =>
+        size.height - (v.clamp(lo, hi) - lo) / (hi - lo) * size.height;
+
+    var paint = Paint()
+      ..color = color
+      ..strokeWidth = strokeWidth;
+
+    if (bar) {
+      var w = size.width / capacity;
+      paint.style = PaintingStyle.fill;
+      for (var i = 0; i < values.length; i++) {
+        if (values[i].isFinite) {
+          canvas.drawRect(
+              Rect.fromLTRB(i * w, y(values[i]), (i + 1) * w - w * 0.1,
+                  size.height),
+              paint);
+        }
+      }
+    } else {
+      var step = capacity > 1 ? size.width / (capacity - 1) : size.width;
+      var path = Path();
+      var drawing = false;
+      for (var i = 0; i < values.length; i++) {
+        if (!values[i].isFinite) {
+          // gap in the series
+          drawing = false;
+        } else if (drawing) {
+          path.lineTo(i * step, y(values[i]));
+        } else {
+          path.moveTo(i * step, y(values[i]));
+          drawing = true;
+        }
+      }
+      paint
+        ..style = PaintingStyle.stroke
+        ..strokeJoin = StrokeJoin.round;
+      canvas.drawPath(path, paint);
+    }
+  }
+
+  @override
+  bool shouldRepaint(_StreamingChartPainter oldDelegate) {
+    return oldDelegate.count != count ||
+        oldDelegate.values.length != values.length ||
+        oldDelegate.capacity != capacity ||
+        oldDelegate.bar != bar ||
+        oldDelegate.color != color ||
+        oldDelegate.strokeWidth != strokeWidth ||
+        oldDelegate.minY != minY ||
+        oldDelegate.maxY != maxY;
+  }
+}
@@ -0,0 +1,53 @@
+import 'package:flutter/widgets.dart';
+
+import '../flet_app_services.dart';
+import '../models/control.dart';
+import 'create_control.dart';
+
+// Builds items of a list or grid with "itemCount" set. Only a window of
+// items starting at "firstItemIndex" is loaded; items outside of it are
+// rendered as placeholders and requested from the host after the frame.
+mixin VirtualItemsStateMixin<T extends StatefulWidget> on State<T> {
+  int? _requestFirst;
+  int? _requestLast;
+  String? _lastRequest;
+
+  bool isVirtual(Control control) => control.attrInt("itemCount") != null;
+
+  int virtualItemCount(Control control) => control.attrInt("itemCount", 0)!;
+
+  Widget buildVirtualItem(Control control, List<Control> children, int index,
+      bool disabled, Widget placeholder) {
+    var firstItemIndex = control.attrInt("firstItemIndex", 0)!;
+    var i = index - firstItemIndex;
+    if (i >= 0 && i < children.length) {
+      return createControl(control, children[i].id, disabled);
+    }
+    _requestItem(control.id, firstItemIndex, index);
+    return placeholder;
+  }
+
+  void _requestItem(String controlId, int firstItemIndex, int index) {
+    if (_requestFirst == null) {
+      _requestFirst = index;
+      _requestLast = index;
+      WidgetsBinding.instance.addPostFrameCallback((_) {
+        var data = "$_requestFirst $_requestLast";
+        var request = "$firstItemIndex:$data";
+        _requestFirst = null;
+        _requestLast = null;
+        // don't repeat the request until the host has moved the window
+        if (request != _lastRequest && mounted) {
+          _lastRequest = request;
+          FletAppServices.of(context).ws.pageEventFromWeb(
+              eventTarget: controlId,
+              eventName: "request_items",
+              eventData: data);
+        }
+      });
+    } else {
+      if (index < _requestFirst!) _requestFirst = index;
+      if (index > _requestLast!) _requestLast = index;
+    }
+  }
+}
@@ -11,7 +11,8 @@ enum MessageAction {
   pageControlsBatch,
   appendControlProps,
   cleanControl,
-  removeControl
+  removeControl,
+  moveControl
 }
 
 class Message {
@@ -0,0 +1,9 @@
+class MoveControlPayload {
+  final List<String> ids;
+  final int at;
+
+  MoveControlPayload({required this.ids, required this.at});
+
+  factory MoveControlPayload.fromJson(Map<String, dynamic> json) =>
+      MoveControlPayload(ids: List<String>.from(json['ids']), at: json['at']);
+}
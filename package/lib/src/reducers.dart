@@ -10,6 +10,7 @@ import 'models/window_media_data.dart';
 import 'protocol/add_page_controls_payload.dart';
 import 'protocol/clean_control_payload.dart';
 import 'protocol/message.dart';
+import 'protocol/move_control_payload.dart';
 import 'protocol/remove_control_payload.dart';
 import 'protocol/update_control_props_payload.dart';
 import 'utils/desktop.dart';
@@ -259,6 +260,9 @@ AppState appReducer(AppState state, dynamic action) {
       } else if (message.action == MessageAction.removeControl) {
         var payload = RemoveControlPayload.fromJson(message.payload);
         removeControls(controls, payload.ids);
+      } else if (message.action == MessageAction.moveControl) {
+        var payload = MoveControlPayload.fromJson(message.payload);
+        moveControls(controls, payload.ids, payload.at);
       }
     }
     return state.copyWith(controls: controls);
@@ -290,6 +294,13 @@ AppState appReducer(AppState state, dynamic action) {
     var controls = Map.of(state.controls);
     removeControls(controls, action.payload.ids);
     return state.copyWith(controls: controls);
+  } else if (action is MoveControlAction) {
+    //
+    // move controls
+    //
+    var controls = Map.of(state.controls);
+    moveControls(controls, action.payload.ids, action.payload.at);
+    return state.copyWith(controls: controls);
   }
 
   return state;
@@ -421,6 +432,21 @@ removeControls(Map<String, Control> controls, List<String> ids) {
   }
 }
 
+moveControls(Map<String, Control> controls, List<String> ids, int at) {
+  if (ids.isEmpty) {
+    return;
+  }
+
+  // all moved controls share the same parent
+  final parentCtrl = controls[controls[ids[0]]!.pid]!;
+  final movedIds = ids.toSet();
+  final childIds = parentCtrl.childIds
+      .where((childId) => !movedIds.contains(childId))
+      .toList();
+  childIds.insertAll(at < childIds.length ? at : childIds.length, ids);
+  controls[parentCtrl.id] = parentCtrl.copyWith(childIds: childIds);
+}
+
 List<String> getAllDescendantIds(Map<String, Control> controls, String id) {
   if (controls[id] != null) {
     List<String> childIds = [];
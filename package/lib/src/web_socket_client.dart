@@ -13,6 +13,7 @@ import 'protocol/append_control_props_request.dart';
 import 'protocol/clean_control_payload.dart';
 import 'protocol/invoke_method_payload.dart';
 import 'protocol/message.dart';
+import 'protocol/move_control_payload.dart';
 import 'protocol/page_controls_batch_payload.dart';
 import 'protocol/page_event_from_web_request.dart';
 import 'protocol/register_webclient_request.dart';
@@ -186,6 +187,10 @@ class WebSocketClient {
         _store.dispatch(
             RemoveControlAction(RemoveControlPayload.fromJson(msg.payload)));
         break;
+      case MessageAction.moveControl:
+        _store.dispatch(
+            MoveControlAction(MoveControlPayload.fromJson(msg.payload)));
+        break;
       case MessageAction.pageControlsBatch:
         _store.dispatch(PageControlsBatchAction(
             PageControlsBatchPayload.fromJson(msg.payload)));
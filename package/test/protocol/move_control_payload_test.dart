@@ -0,0 +1,16 @@
+import 'dart:convert';
+import 'package:flutter_test/flutter_test.dart';
+import 'package:flet/src/protocol/move_control_payload.dart';
+
+void main() {
+  test("MoveControlPayload payload deserialized", () {
+    const myJsonAsString = '''{
+    "ids": ["c1", "c2"],
+    "at": 3
+    }''';
+
+    final s = MoveControlPayload.fromJson(json.decode(myJsonAsString));
+    expect(s.ids.length, 2);
+    expect(s.at, 3);
+  });
+}
@@ -1,79 +1,222 @@
-from flet.alert_dialog import AlertDialog
-from flet.alignment import Alignment
-from flet.animated_switcher import AnimatedSwitcher
-from flet.app_bar import AppBar
-from flet.audio import Audio
-from flet.banner import Banner
-from flet.buttons import ButtonStyle, OutlinedBorder
-from flet.card import Card
-from flet.checkbox import Checkbox
-from flet.circle_avatar import CircleAvatar
-from flet.column import Column
-from flet.container import Container, ContainerTapEvent
-from flet.control import Control
-from flet.divider import Divider
-from flet.drag_target import DragTarget, DragTargetAcceptEvent
-from flet.draggable import Draggable
-from flet.dropdown import Dropdown
-from flet.elevated_button import ElevatedButton
-from flet.file_picker import (
-    FilePicker,
-    FilePickerResultEvent,
-    FilePickerUploadEvent,
-    FilePickerUploadFile,
-)
-from flet.filled_button import FilledButton
-from flet.filled_tonal_button import FilledTonalButton
+import importlib
+from types import ModuleType as _ModuleType
+from typing import TYPE_CHECKING
+
+# controls and other classes are imported on first use, so importing flet
+# doesn't import every control module
+_lazy_names = {
+    "AlertDialog": "flet.alert_dialog",
+    "Alignment": "flet.alignment",
+    "AnimatedSwitcher": "flet.animated_switcher",
+    "AppBar": "flet.app_bar",
+    "Audio": "flet.audio",
+    "Banner": "flet.banner",
+    "ButtonStyle": "flet.buttons",
+    "OutlinedBorder": "flet.buttons",
+    "Card": "flet.card",
+    "Checkbox": "flet.checkbox",
+    "CircleAvatar": "flet.circle_avatar",
+    "Column": "flet.column",
+    "Container": "flet.container",
+    "ContainerTapEvent": "flet.container",
+    "Control": "flet.control",
+    "Divider": "flet.divider",
+    "DragTarget": "flet.drag_target",
+    "DragTargetAcceptEvent": "flet.drag_target",
+    "Draggable": "flet.draggable",
+    "Dropdown": "flet.dropdown",
+    "ElevatedButton": "flet.elevated_button",
+    "FilePicker": "flet.file_picker",
+    "FilePickerResultEvent": "flet.file_picker",
+    "FilePickerUploadEvent": "flet.file_picker",
+    "FilePickerUploadFile": "flet.file_picker",
+    "FilledButton": "flet.filled_button",
+    "FilledTonalButton": "flet.filled_tonal_button",
+    "FloatingActionButton": "flet.floating_action_button",
+    "DragEndEvent": "flet.gesture_detector",
+    "DragStartEvent": "flet.gesture_detector",
+    "DragUpdateEvent": "flet.gesture_detector",
+    "GestureDetector": "flet.gesture_detector",
+    "HoverEvent": "flet.gesture_detector",
+    "LongPressEndEvent": "flet.gesture_detector",
+    "LongPressStartEvent": "flet.gesture_detector",
+    "MouseCursor": "flet.gesture_detector",
+    "ScaleEndEvent": "flet.gesture_detector",
+    "ScaleStartEvent": "flet.gesture_detector",
+    "ScaleUpdateEvent": "flet.gesture_detector",
+    "TapEvent": "flet.gesture_detector",
+    "LinearGradient": "flet.gradients",
+    "RadialGradient": "flet.gradients",
+    "SweepGradient": "flet.gradients",
+    "GridView": "flet.grid_view",
+    "Icon": "flet.icon",
+    "IconButton": "flet.icon_button",
+    "Image": "flet.image",
+    "ListTile": "flet.list_tile",
+    "ListView": "flet.list_view",
+    "Markdown": "flet.markdown",
+    "NavigationRail": "flet.navigation_rail",
+    "NavigationRailDestination": "flet.navigation_rail",
+    "OutlinedButton": "flet.outlined_button",
+    "KeyboardEvent": "flet.page",
+    "LoginEvent": "flet.page",
+    "Page": "flet.page",
+    "RouteChangeEvent": "flet.page",
+    "ViewPopEvent": "flet.page",
+    "PopupMenuButton": "flet.popup_menu_button",
+    "PopupMenuItem": "flet.popup_menu_button",
+    "ProgressBar": "flet.progress_bar",
+    "ProgressRing": "flet.progress_ring",
+    "PubSub": "flet.pubsub",
+    "QueryString": "flet.querystring",
+    "Radio": "flet.radio",
+    "RadioGroup": "flet.radio_group",
+    "Ref": "flet.ref",
+    "Row": "flet.row",
+    "Semantics": "flet.semantics",
+    "SeriesChart": "flet.series_chart",
+    "ShaderMask": "flet.shader_mask",
+    "Slider": "flet.slider",
+    "SnackBar": "flet.snack_bar",
+    "Stack": "flet.stack",
+    "StreamingChart": "flet.streaming_chart",
+    "Switch": "flet.switch",
+    "Tab": "flet.tabs",
+    "Tabs": "flet.tabs",
+    "TemplateRoute": "flet.template_route",
+    "Text": "flet.text",
+    "TextButton": "flet.text_button",
+    "TextStyle": "flet.text_style",
+    "TextField": "flet.textfield",
+    "PageTransitionsTheme": "flet.theme",
+    "Theme": "flet.theme",
+    "UserControl": "flet.user_control",
+    "VerticalDivider": "flet.vertical_divider",
+    "View": "flet.view",
+    "WindowDragArea": "flet.window_drag_area",
+}
+
+
+def __getattr__(name):
+    module = _lazy_names.get(name)
+    if module is None:
+        if name.startswith("__"):
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        # submodules, e.g. flet.colors and flet.icons
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *_lazy_names])
+
+
 from flet.flet import *
-from flet.floating_action_button import FloatingActionButton
-from flet.gesture_detector import (
-    DragEndEvent,
-    DragStartEvent,
-    DragUpdateEvent,
-    GestureDetector,
-    HoverEvent,
-    LongPressEndEvent,
-    LongPressStartEvent,
-    MouseCursor,
-    ScaleEndEvent,
-    ScaleStartEvent,
-    ScaleUpdateEvent,
-    TapEvent,
-)
-from flet.gradients import LinearGradient, RadialGradient, SweepGradient
-from flet.grid_view import GridView
-from flet.icon import Icon
-from flet.icon_button import IconButton
-from flet.image import Image
-from flet.list_tile import ListTile
-from flet.list_view import ListView
-from flet.markdown import Markdown
-from flet.navigation_rail import NavigationRail, NavigationRailDestination
-from flet.outlined_button import OutlinedButton
-from flet.page import KeyboardEvent, LoginEvent, Page, RouteChangeEvent, ViewPopEvent
-from flet.popup_menu_button import PopupMenuButton, PopupMenuItem
-from flet.progress_bar import ProgressBar
-from flet.progress_ring import ProgressRing
-from flet.pubsub import PubSub
-from flet.querystring import QueryString
-from flet.radio import Radio
-from flet.radio_group import RadioGroup
-from flet.ref import Ref
-from flet.row import Row
-from flet.semantics import Semantics
-from flet.shader_mask import ShaderMask
-from flet.slider import Slider
-from flet.snack_bar import SnackBar
-from flet.stack import Stack
-from flet.switch import Switch
-from flet.tabs import Tab, Tabs
-from flet.template_route import TemplateRoute
-from flet.text import Text
-from flet.text_button import TextButton
-from flet.text_style import TextStyle
-from flet.textfield import TextField
-from flet.theme import PageTransitionsTheme, Theme
-from flet.user_control import UserControl
-from flet.vertical_divider import VerticalDivider
-from flet.view import View
-from flet.window_drag_area import WindowDragArea
+
+# names exported by "from flet import *"
+__all__ = [
+    name
+    for name, value in list(globals().items())
+    if not name.startswith("_")
+    and name != "TYPE_CHECKING"
+    and name not in _lazy_names
+    and not isinstance(value, _ModuleType)
+] + list(_lazy_names)
+
+
+if TYPE_CHECKING:
+    from flet.alert_dialog import AlertDialog
+    from flet.alignment import Alignment
+    from flet.animated_switcher import AnimatedSwitcher
+    from flet.app_bar import AppBar
+    from flet.audio import Audio
+    from flet.banner import Banner
+    from flet.buttons import ButtonStyle, OutlinedBorder
+    from flet.card import Card
+    from flet.checkbox import Checkbox
+    from flet.circle_avatar import CircleAvatar
+    from flet.column import Column
+    from flet.container import Container, ContainerTapEvent
+    from flet.control import Control
+    from flet.divider import Divider
+    from flet.drag_target import DragTarget, DragTargetAcceptEvent
+    from flet.draggable import Draggable
+    from flet.dropdown import Dropdown
+    from flet.elevated_button import ElevatedButton
+    from flet.file_picker import (
+        FilePicker,
+        FilePickerResultEvent,
+        FilePickerUploadEvent,
+        FilePickerUploadFile,
+    )
+    from flet.filled_button import FilledButton
+    from flet.filled_tonal_button import FilledTonalButton
+    from flet.floating_action_button import FloatingActionButton
+    from flet.gesture_detector import (
+        DragEndEvent,
+        DragStartEvent,
+        DragUpdateEvent,
+        GestureDetector,
+        HoverEvent,
+        LongPressEndEvent,
+        LongPressStartEvent,
+        MouseCursor,
+        ScaleEndEvent,
+        ScaleStartEvent,
+        ScaleUpdateEvent,
+        TapEvent,
+    )
+    from flet.gradients import LinearGradient, RadialGradient, SweepGradient
+    from flet.grid_view import GridView
+    from flet.icon import Icon
+    from flet.icon_button import IconButton
+    from flet.image import Image
+    from flet.list_tile import ListTile
+    from flet.list_view import ListView
+    from flet.markdown import Markdown
+    from flet.navigation_rail import NavigationRail, NavigationRailDestination
+    from flet.outlined_button import OutlinedButton
+    from flet.page import (
+        KeyboardEvent,
+        LoginEvent,
+        Page,
+        RouteChangeEvent,
+        ViewPopEvent,
+    )
+    from flet.popup_menu_button import PopupMenuButton, PopupMenuItem
+    from flet.progress_bar import ProgressBar
+    from flet.progress_ring import ProgressRing
+    from flet.pubsub import PubSub
+    from flet.querystring import QueryString
+    from flet.radio import Radio
+    from flet.radio_group import RadioGroup
+    from flet.ref import Ref
+    from flet.row import Row
+    from flet.semantics import Semantics
+    from flet.series_chart import SeriesChart
+    from flet.shader_mask import ShaderMask
+    from flet.slider import Slider
+    from flet.snack_bar import SnackBar
+    from flet.stack import Stack
+    from flet.streaming_chart import StreamingChart
+    from flet.switch import Switch
+    from flet.tabs import Tab, Tabs
+    from flet.template_route import TemplateRoute
+    from flet.text import Text
+    from flet.text_button import TextButton
+    from flet.text_style import TextStyle
+    from flet.textfield import TextField
+    from flet.theme import PageTransitionsTheme, Theme
+    from flet.user_control import UserControl
+    from flet.vertical_divider import VerticalDivider
+    from flet.view import View
+    from flet.window_drag_area import WindowDragArea
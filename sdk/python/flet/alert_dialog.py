@@ -8,12 +8,22 @@ from flet.types import PaddingValue
 
 
 class AlertDialog(Control):
+    __slots__ = (
+        "__title",
+        "__content",
+        "__actions",
+        "__title_padding",
+        "__content_padding",
+        "__actions_padding",
+    )
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
         disabled: Optional[bool] = None,
         visible: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -35,6 +45,7 @@ class AlertDialog(Control):
             disabled=disabled,
             visible=visible,
             data=data,
+            key=key,
         )
 
         self.__title: Optional[Control] = None
@@ -10,6 +10,8 @@ from flet.types import AnimationValue, OffsetValue, RotateValue, ScaleValue
 
 
 class AnimatedSwitcher(ConstrainedControl):
+    __slots__ = ("__content",)
+
     def __init__(
         self,
         content: Optional[Control] = None,
@@ -37,6 +39,7 @@ class AnimatedSwitcher(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -72,6 +75,7 @@ class AnimatedSwitcher(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.content = content
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Optional
 
 from beartype import beartype
 from beartype.typing import List
@@ -8,6 +8,8 @@ from flet.ref import Ref
 
 
 class AppBar(Control):
+    __slots__ = ("__leading", "__title", "__actions")
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
@@ -21,8 +23,9 @@ class AppBar(Control):
         bgcolor: Optional[str] = None,
         elevation: OptionalNumber = None,
         actions: Optional[List[Control]] = None,
+        key: Any = None,
     ):
-        Control.__init__(self, ref=ref)
+        Control.__init__(self, ref=ref, key=key)
 
         self.__leading: Optional[Control] = None
         self.__title: Optional[Control] = None
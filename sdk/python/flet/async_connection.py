@@ -0,0 +1,415 @@
+import asyncio
+import itertools
+import logging
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple
+
+from flet.blob_store import BlobStore
+from flet.connection import (
+    _REPLY_EVENTS,
+    RequestMetrics,
+    _command_result,
+    _commands_result,
+)
+from flet.event_dispatcher import AsyncEventDispatcher
+from flet.protocol import *
+from flet.protocol import _get_msgpack
+from flet.pubsub import PubSubHub
+from flet.utils import is_localhost_url
+
+try:
+    import websockets
+    from websockets.extensions import Extension
+    from websockets.extensions.permessage_deflate import (
+        ClientPerMessageDeflateFactory,
+    )
+    from websockets.frames import Opcode
+except ImportError:
+    raise Exception('Install "websockets" Python package to use asyncio mode.')
+
+
+class _ThresholdDeflate(Extension):
+    """permessage-deflate which sends messages smaller than `threshold`
+    bytes uncompressed, like the sync connection does."""
+
+    def __init__(self, deflate, threshold: int):
+        self.name = deflate.name
+        self.__deflate = deflate
+        self.__threshold = threshold
+
+    def encode(self, frame):
+        if (
+            frame.opcode in (Opcode.TEXT, Opcode.BINARY)
+            and frame.fin
+            and len(frame.data) < self.__threshold
+        ):
+            return frame
+        return self.__deflate.encode(frame)
+
+    def decode(self, frame, *, max_size=None):
+        return self.__deflate.decode(frame, max_size=max_size)
+
+
+class _ThresholdDeflateFactory(ClientPerMessageDeflateFactory):
+    def __init__(self, threshold: int):
+        # the settings of websockets' compression="deflate"
+        super().__init__(compress_settings={"memLevel": 5})
+        self.__threshold = threshold
+
+    def process_response_params(self, params, accepted_extensions):
+        deflate = super().process_response_params(params, accepted_extensions)
+        return _ThresholdDeflate(deflate, self.__threshold)
+
+
+class AsyncConnection:
+    """Connection to Flet server running on asyncio event loop.
+
+    Events are dispatched as tasks on the loop instead of threads.
+    Sync `send_command()` and `send_commands()` can be called from worker
+    threads, so sync handlers keep working in a thread pool of
+    `event_workers` threads.
+
+    The connection is re-established when it's lost; `on_connect` coroutine
+    is called then to register the host client again.
+
+    `compression_threshold` enables permessage-deflate compression of
+    messages of at least that many bytes."""
+
+    def __init__(
+        self,
+        url: str,
+        request_timeout: Optional[float] = None,
+        framing: Optional[str] = None,
+        compression_threshold: Optional[int] = None,
+        attr_table: bool = True,
+        blobs: bool = True,
+        event_workers: Optional[int] = None,
+    ):
+        if framing == MSGPACK_FRAMING:
+            _get_msgpack()
+        elif framing not in [None, "json"]:
+            raise ValueError(f"Unsupported framing: {framing}")
+        self._url = url
+        self._compression_threshold = compression_threshold
+        self._ws = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id = None
+        self._receive_task = None
+        self._ws_callbacks: Dict[str, Tuple[asyncio.Future, float]] = {}
+        self._next_msg_id = itertools.count(1)
+        self.request_timeout = request_timeout
+        self.request_metrics = RequestMetrics()
+        self.framing = framing
+        self.__msgpack = False
+        self.attr_table = attr_table
+        self.__attr_table: Optional[AttrNameTable] = None
+        self.blobs = blobs
+        self.__blob_store: Optional[BlobStore] = None
+        self.__send_lock = asyncio.Lock()
+        self._tasks = set()
+        self._on_event = None
+        self._on_session_created = None
+        self._on_connect = None
+        self.__closed: Optional[asyncio.Event] = None
+        self.event_dispatcher = AsyncEventDispatcher()
+        self.executor = (
+            ThreadPoolExecutor(
+                max_workers=event_workers, thread_name_prefix="flet_event"
+            )
+            if event_workers is not None
+            else None
+        )
+        self.host_client_id: Optional[str] = None
+        self.page_name: Optional[str] = None
+        self.page_url: Optional[str] = None
+        self.sessions = {}
+        self.pubsubhub = PubSubHub()
+
+    @property
+    def on_event(self):
+        return self._on_event
+
+    @on_event.setter
+    def on_event(self, handler):
+        self._on_event = handler
+
+    @property
+    def on_session_created(self):
+        return self._on_session_created
+
+    @on_session_created.setter
+    def on_session_created(self, handler):
+        self._on_session_created = handler
+
+    @property
+    def on_connect(self):
+        return self._on_connect
+
+    @on_connect.setter
+    def on_connect(self, handler):
+        self._on_connect = handler
+
+    async def connect(self):
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self.__closed = asyncio.Event()
+        await self.__connect_ws()
+        self._receive_task = asyncio.create_task(self.__receive_loop())
+
+    async def __connect_ws(self):
+        extensions = None
+        if self._compression_threshold is not None:
+            extensions = [_ThresholdDeflateFactory(self._compression_threshold)]
+        self._ws = await websockets.connect(
+            self._url,
+            max_size=None,
+            compression=None,
+            extensions=extensions,
+        )
+        logging.info(f"Successfully connected to {self._url}")
+
+    async def __receive_loop(self):
+        while True:
+            assert self._ws is not None
+            try:
+                async for data in self._ws:
+                    self._on_message(data)
+            except websockets.ConnectionClosed:
+                pass
+            logging.info(f"Connection to {self._url} closed")
+            for fut, _ in self._ws_callbacks.values():
+                if not fut.done():
+                    fut.set_exception(ConnectionError("Connection closed"))
+            self._ws_callbacks.clear()
+            if not await self.__reconnect():
+                return
+
+    async def __reconnect(self):
+        assert self.__closed is not None
+        retry = 0
+        while True:
+            sleep = 0.1
+            if not is_localhost_url(self._url):
+                sleep = 2**retry + random.uniform(0, 1)
+            logging.info(f"Reconnecting Flet Server in {sleep} seconds")
+            try:
+                await asyncio.wait_for(self.__closed.wait(), sleep)
+                return False
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self.__connect_ws()
+            except (OSError, asyncio.TimeoutError, websockets.WebSocketException):
+                retry += 1
+                continue
+            if self.__closed.is_set():
+                await self._ws.close()
+                return False
+            if self._on_connect is not None:
+                # the response is received by the receive loop
+                self.__start_task(self._on_connect())
+            return True
+
+    def _on_message(self, data):
+        logging.debug(f"_on_message: {data}")
+        msg = decode_message(data)
+        if msg.id:
+            # response to a request
+            entry = self._ws_callbacks.pop(msg.id, None)
+            if entry is None:
+                # the request has timed out or been cancelled
+                return
+            fut, started = entry
+            self.request_metrics.finish(started)
+            if not fut.done():
+                fut.set_result(msg.payload)
+        elif msg.action == Actions.PAGE_EVENT_TO_HOST:
+            if self._on_event is not None:
+                payload = PageEventPayload(**msg.payload)
+                if payload.eventName in _REPLY_EVENTS:
+                    self.__start_task(self._on_event(self, payload))
+                else:
+                    # events of the same session are handled in arrival order
+                    page = self.sessions.get(payload.sessionID)
+                    mailbox = (
+                        page._get_control_event_mailbox(
+                            payload.eventTarget, payload.eventName
+                        )
+                        if page is not None
+                        else None
+                    )
+                    self.event_dispatcher.dispatch(
+                        payload.sessionID,
+                        self._on_event,
+                        self,
+                        payload,
+                        mailbox=mailbox,
+                    )
+        elif msg.action == Actions.SESSION_CREATED:
+            if self._on_session_created is not None:
+                self.__start_task(
+                    self._on_session_created(
+                        self, PageSessionCreatedPayload(**msg.payload)
+                    )
+                )
+        else:
+            # it's something else
+            logging.warning(f"Unexpected message: {msg.action} {msg.payload}")
+
+    def __start_task(self, coro):
+        # keep a reference to running tasks, so they are not garbage collected
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def register_host_client_async(
+        self,
+        host_client_id: Optional[str],
+        page_name: str,
+        is_app: bool,
+        update: bool,
+        auth_token: Optional[str],
+        permissions: Optional[str],
+    ):
+        payload = RegisterHostClientRequestPayload(
+            host_client_id,
+            page_name,
+            is_app,
+            update,
+            auth_token,
+            permissions,
+            self.framing if self.framing == MSGPACK_FRAMING else None,
+            self.attr_table,
+            self.blobs,
+        )
+        self.__msgpack = False
+        self.__attr_table = None
+        blob_store, self.__blob_store = self.__blob_store, None
+        response = await self._send_message_with_result_async(
+            Actions.REGISTER_HOST_CLIENT, payload
+        )
+        result = RegisterHostClientResponsePayload(**response)
+        self.__msgpack = result.framing == MSGPACK_FRAMING
+        self.__attr_table = AttrNameTable() if result.attrTable else None
+        if result.blobs:
+            # the server keeps blobs of the host client until it expires
+            self.__blob_store = blob_store or BlobStore()
+            self.__blob_store.invalidate()
+        return result
+
+    async def send_command_async(
+        self, session_id: str, command: Command, timeout: Optional[float] = None
+    ):
+        assert self.page_name is not None
+        payload = PageCommandRequestPayload(self.page_name, session_id, command)
+        response = await self._send_message_with_result_async(
+            Actions.PAGE_COMMAND_FROM_HOST, payload, timeout
+        )
+        return _command_result(response)
+
+    async def send_commands_async(
+        self,
+        session_id: str,
+        commands: List[Command],
+        timeout: Optional[float] = None,
+    ):
+        assert self.page_name is not None
+        payload = PageCommandsBatchRequestPayload(self.page_name, session_id, commands)
+        response = await self._send_message_with_result_async(
+            Actions.PAGE_COMMANDS_BATCH_FROM_HOST, payload, timeout
+        )
+        return _commands_result(response)
+
+    def send_command(
+        self, session_id: str, command: Command, timeout: Optional[float] = None
+    ):
+        return self.__run_sync(self.send_command_async(session_id, command, timeout))
+
+    def send_commands(
+        self,
+        session_id: str,
+        commands: List[Command],
+        timeout: Optional[float] = None,
+    ):
+        return self.__run_sync(self.send_commands_async(session_id, commands, timeout))
+
+    def __run_sync(self, coro):
+        assert self._loop is not None
+        if threading.get_ident() == self._loop_thread_id:
+            coro.close()
+            raise RuntimeError(
+                "Sync page methods cannot be called from a coroutine, "
+                "use their *_async() counterparts instead."
+            )
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def __encode_message(self, msg_id, action_name, payload):
+        if self.__attr_table is not None and isinstance(
+            payload, (PageCommandRequestPayload, PageCommandsBatchRequestPayload)
+        ):
+            payload = self.__attr_table.encode_payload(payload)
+        msg = Message(msg_id, action_name, payload)
+        j = encode_message_msgpack(msg) if self.__msgpack else encode_message(msg)
+        logging.debug(f"_send_message_with_result_async: {j}")
+        return j
+
+    async def _send_message_with_result_async(self, action_name, payload, timeout=None):
+        assert self._ws is not None
+        assert self._loop is not None
+        msg_id = str(next(self._next_msg_id))
+        fut = self._loop.create_future()
+        self._ws_callbacks[msg_id] = (fut, self.request_metrics.start())
+        if timeout is None:
+            timeout = self.request_timeout
+        try:
+            # names and blobs must reach the server before commands using them
+            async with self.__send_lock:
+                messages = []
+                if self.__blob_store is not None:
+                    # responses to blob commands sent ahead are not waited for
+                    *blob_payloads, payload = self.__blob_store.encode_payload(payload)
+                    for p in blob_payloads:
+                        messages.append(
+                            self.__encode_message(
+                                str(next(self._next_msg_id)),
+                                Actions.PAGE_COMMANDS_BATCH_FROM_HOST,
+                                p,
+                            )
+                        )
+                messages.append(self.__encode_message(msg_id, action_name, payload))
+                try:
+                    for j in messages:
+                        await self._ws.send(j)
+                except BaseException:
+                    # the server may have missed new names and blobs
+                    self.__attr_table = None
+                    if self.__blob_store is not None:
+                        self.__blob_store.invalidate()
+                    raise
+            return await asyncio.wait_for(fut, timeout)
+        except asyncio.TimeoutError:
+            entry = self._ws_callbacks.pop(msg_id, None)
+            if entry is not None:
+                self.request_metrics.finish(entry[1], timed_out=True)
+            raise TimeoutError(
+                f"No response to {action_name} request in {timeout} seconds."
+            )
+        finally:
+            # cancelled or failed to send
+            entry = self._ws_callbacks.pop(msg_id, None)
+            if entry is not None:
+                self.request_metrics.finish(entry[1], cancelled=True)
+
+    async def close_async(self):
+        logging.debug("Closing connection...")
+        if self.__closed is not None:
+            self.__closed.set()
+        if self._ws is not None:
+            await self._ws.close()
+        if self._receive_task is not None:
+            await self._receive_task
+        await self.event_dispatcher.shutdown()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
@@ -31,11 +31,16 @@ class AudioMethodResults:
 
 
 class Audio(Control):
+    __slots__ = ("__call_counter", "__calls", "__results")
+
+    _coalesced_events = ("position_changed",)
+
     def __init__(
         self,
         src: Optional[str] = None,
         ref: Optional[Ref] = None,
         data: Any = None,
+        key: Any = None,
         # specific
         src_base64: Optional[str] = None,
         autoplay: Optional[bool] = None,
@@ -54,12 +59,13 @@ class Audio(Control):
             self,
             ref=ref,
             data=data,
+            key=key,
         )
 
         self.__call_counter = 0
         self.__calls: Dict[int, threading.Event] = {}
         self.__results: Dict[threading.Event, tuple[Optional[str], Optional[str]]] = {}
-        self._add_event_handler("result", self._on_result)
+        self._add_event_handler("method_result", self._on_result)
         self.src = src
         self.src_base64 = src_base64
         self.autoplay = autoplay
@@ -8,12 +8,21 @@ from flet.types import PaddingValue
 
 
 class Banner(Control):
+    __slots__ = (
+        "__leading",
+        "__content",
+        "__actions",
+        "__leading_padding",
+        "__content_padding",
+    )
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
         disabled: Optional[bool] = None,
         visible: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -33,6 +42,7 @@ class Banner(Control):
             disabled=disabled,
             visible=visible,
             data=data,
+            key=key,
         )
 
         self.__leading: Optional[Control] = None
@@ -0,0 +1,150 @@
+import base64
+import hashlib
+from collections import OrderedDict
+from typing import List
+
+from flet.protocol import (
+    Command,
+    PageCommandRequestPayload,
+    PageCommandsBatchRequestPayload,
+)
+
+# attribute names are sent lowercased, e.g. "srcbase64" and "srcblob"
+BASE64_SUFFIX = "base64"
+BLOB_SUFFIX = "blob"
+
+# total size of blobs of a host client the server keeps
+DEFAULT_MAX_SIZE = 32 * 1024 * 1024
+
+# smaller data is cheaper to send inline
+MIN_BLOB_SIZE = 1024
+
+
+class BlobStore:
+    """Tracks blobs uploaded to Flet server.
+
+    Base64 attributes (`srcBase64`, `imageSrcBase64`) of commands are
+    replaced with URLs of blobs (`srcBlob`, `imageSrcBlob`); blobs the server
+    doesn't have yet are uploaded with `putblob` commands in the same batch.
+    The server keeps blobs until the host releases them, so the least
+    recently used ones are released with `delblob` commands."""
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self.__blobs: OrderedDict = OrderedDict()  # hash -> [size, url, uploaded]
+        self.__size = 0
+
+    @property
+    def size(self) -> int:
+        """Total size of uploaded blobs in bytes."""
+        return self.__size
+
+    def __len__(self):
+        return len(self.__blobs)
+
+    def encode_commands(self, commands: List[Command]) -> List[Command]:
+        puts = []
+        used = set()
+        result = [self.__encode_command(cmd, puts, used) for cmd in commands]
+
+        # blobs used by the commands are the most recently used ones
+        released = []
+        while self.__size > self.max_size and next(iter(self.__blobs)) not in used:
+            hash, (size, _, _) = self.__blobs.popitem(last=False)
+            self.__size -= size
+            released.append(hash)
+        if released:
+            puts.insert(0, Command(0, "delblob", released))
+        return puts + result
+
+    def encode_payload(self, payload) -> list:
+        """Returns page command(s) request payload with blobs encoded.
+
+        A single command can't carry blob commands, so they are returned
+        in a batch payload to be sent before it."""
+        if isinstance(payload, PageCommandsBatchRequestPayload):
+            commands = self.encode_commands(payload.commands)
+            if all(a is b for a, b in zip(commands, payload.commands)):
+                return [payload]
+            return [
+                PageCommandsBatchRequestPayload(
+                    payload.pageName, payload.sessionID, commands
+                )
+            ]
+        if isinstance(payload, PageCommandRequestPayload):
+            *blob_commands, command = self.encode_commands([payload.command])
+            if command is payload.command and not blob_commands:
+                return [payload]
+            result = [
+                PageCommandRequestPayload(payload.pageName, payload.sessionID, command)
+            ]
+            if blob_commands:
+                result.insert(
+                    0,
+                    PageCommandsBatchRequestPayload(
+                        payload.pageName, payload.sessionID, blob_commands
+                    ),
+                )
+            return result
+        return [payload]
+
+    def invalidate(self):
+        """Uploads blobs again when they are used next time.
+
+        The server may have missed uploads, e.g. when the connection is lost,
+        while the blobs it has are still released."""
+        for blob in self.__blobs.values():
+            blob[2] = False
+
+    def __encode_command(self, cmd: Command, puts: List[Command], used) -> Command:
+        attrs = None
+        for name, value in cmd.attrs.items():
+            if not name.lower().endswith(BASE64_SUFFIX):
+                continue
+            if attrs is None:
+                attrs = dict(cmd.attrs)
+            blob_name = name[: -len(BASE64_SUFFIX)] + BLOB_SUFFIX
+            # both attributes are sent to replace the previous value
+            if value and len(value) >= MIN_BLOB_SIZE:
+                attrs[name] = ""
+                attrs[blob_name] = self.__put(value, puts, used)
+            else:
+                attrs[blob_name] = ""
+
+        commands = cmd.commands
+        if commands:
+            commands = [self.__encode_command(c, puts, used) for c in commands]
+            if all(a is b for a, b in zip(commands, cmd.commands)):
+                commands = cmd.commands
+
+        if attrs is None and commands is cmd.commands:
+            return cmd
+        return Command(
+            cmd.indent,
+            cmd.name,
+            cmd.values,
+            attrs if attrs is not None else cmd.attrs,
+            commands,
+        )
+
+    def __put(self, value: str, puts: List[Command], used) -> str:
+        hash = hashlib.sha256(value.encode()).hexdigest()
+        used.add(hash)
+        blob = self.__blobs.get(hash)
+        if blob is not None:
+            self.__blobs.move_to_end(hash)
+            if not blob[2]:
+                puts.append(Command(0, "putblob", [hash], {"data": value}))
+                blob[2] = True
+            return blob[1]
+
+        data = base64.b64decode(value)
+        url = f"/api/blob/{hash}"
+        if b"<svg" in data:
+            # the client tells SVG images by extension
+            url += ".svg"
+        puts.append(Command(0, "putblob", [hash], {"data": value}))
+
+        self.__blobs[hash] = [len(data), url, True]
+        self.__size += len(data)
+        return url
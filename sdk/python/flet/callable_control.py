@@ -24,16 +24,20 @@ class ControlMethodResults:
 
 
 class CallableControl(Control):
+    __slots__ = ("__call_counter", "__calls", "__results")
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
         data: Any = None,
+        key: Any = None,
     ):
 
         Control.__init__(
             self,
             ref=ref,
             data=data,
+            key=key,
         )
 
         self.__call_counter = 0
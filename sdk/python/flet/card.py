@@ -9,6 +9,8 @@ from flet.types import AnimationValue, MarginValue, OffsetValue, RotateValue, Sc
 
 
 class Card(ConstrainedControl):
+    __slots__ = ("__margin", "__content")
+
     def __init__(
         self,
         content: Optional[Control] = None,
@@ -36,6 +38,7 @@ class Card(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -68,6 +71,7 @@ class Card(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.content = content
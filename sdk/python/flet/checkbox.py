@@ -19,6 +19,8 @@ LabelPosition = Literal[None, "right", "left"]
 
 
 class Checkbox(ConstrainedControl):
+    __slots__ = ("__fill_color",)
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
@@ -45,6 +47,7 @@ class Checkbox(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -85,6 +88,7 @@ class Checkbox(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
         self.value = value
         self.tristate = tristate
@@ -9,6 +9,8 @@ from flet.types import AnimationValue, OffsetValue, RotateValue, ScaleValue
 
 
 class CircleAvatar(ConstrainedControl):
+    __slots__ = ("__content",)
+
     def __init__(
         self,
         icon: Optional[str] = None,
@@ -36,6 +38,7 @@ class CircleAvatar(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -74,6 +77,7 @@ class CircleAvatar(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.foreground_image_url = foreground_image_url
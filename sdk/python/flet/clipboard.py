@@ -15,16 +15,20 @@ class ClipboardData:
 
 
 class Clipboard(CallableControl):
+    __slots__ = ()
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
         data: Any = None,
+        key: Any = None,
     ):
 
         CallableControl.__init__(
             self,
             ref=ref,
             data=data,
+            key=key,
         )
 
     def _get_control_name(self):
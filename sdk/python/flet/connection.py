@@ -1,17 +1,116 @@
+import asyncio
+import itertools
 import logging
 import threading
-import uuid
+import time
+from collections import deque
+from concurrent import futures
+from concurrent.futures import Future
+from typing import Any, Dict, Tuple
 
+from flet.blob_store import BlobStore
+from flet.event_dispatcher import EventDispatcher
 from flet.protocol import *
+from flet.protocol import _get_msgpack
 from flet.pubsub import PubSubHub
 from flet.reconnecting_websocket import ReconnectingWebSocket
 
+# dedicated events delivering results of method calls made from event
+# handlers; they must not wait in the session queue behind a handler which
+# is waiting for them
+_REPLY_EVENTS = {"invoke_method_result", "method_result"}
+
+
+class RequestMetrics:
+    """In-flight count and response latency of requests to Flet server."""
+
+    def __init__(self, window=1000):
+        self.__lock = threading.Lock()
+        self.__in_flight = 0
+        self.__requests = 0
+        self.__timeouts = 0
+        self.__cancelled = 0
+        self.__latencies = deque(maxlen=window)
+
+    @property
+    def in_flight(self) -> int:
+        return self.__in_flight
+
+    def start(self) -> float:
+        with self.__lock:
+            self.__in_flight += 1
+            self.__requests += 1
+        return time.monotonic()
+
+    def finish(self, started: float, timed_out=False, cancelled=False):
+        with self.__lock:
+            self.__in_flight -= 1
+            if timed_out:
+                self.__timeouts += 1
+            elif cancelled:
+                self.__cancelled += 1
+            else:
+                self.__latencies.append(time.monotonic() - started)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Returns counters and latencies (ms) of the recent responses."""
+        with self.__lock:
+            latencies = sorted(self.__latencies)
+            metrics: Dict[str, Any] = {
+                "in_flight": self.__in_flight,
+                "requests": self.__requests,
+                "timeouts": self.__timeouts,
+                "cancelled": self.__cancelled,
+            }
+        if latencies:
+            metrics["avg_latency_ms"] = sum(latencies) / len(latencies) * 1000
+            metrics["p50_latency_ms"] = latencies[len(latencies) // 2] * 1000
+            metrics["p99_latency_ms"] = latencies[len(latencies) * 99 // 100] * 1000
+            metrics["max_latency_ms"] = latencies[-1] * 1000
+        return metrics
+
+
+def _command_result(response):
+    result = PageCommandResponsePayload(**response)
+    if result.error:
+        raise Exception(result.error)
+    return result
+
+
+def _commands_result(response):
+    result = PageCommandsBatchResponsePayload(**response)
+    if result.error:
+        raise Exception(result.error)
+    return result
+
 
 class Connection:
-    def __init__(self, ws: ReconnectingWebSocket):
+    def __init__(
+        self,
+        ws: ReconnectingWebSocket,
+        event_workers: Optional[int] = None,
+        request_timeout: Optional[float] = None,
+        framing: Optional[str] = None,
+        attr_table: bool = True,
+        blobs: bool = True,
+    ):
+        if framing == MSGPACK_FRAMING:
+            _get_msgpack()
+        elif framing not in [None, "json"]:
+            raise ValueError(f"Unsupported framing: {framing}")
         self._ws = ws
         self._ws.on_message = self._on_message
-        self._ws_callbacks = {}
+        self._ws_callbacks: Dict[str, Tuple[Future, float]] = {}
+        self._next_msg_id = itertools.count(1)
+        self.request_timeout = request_timeout
+        self.request_metrics = RequestMetrics()
+        self.framing = framing
+        self.__msgpack = False
+        self.attr_table = attr_table
+        self.__attr_table: Optional[AttrNameTable] = None
+        self.blobs = blobs
+        self.__blob_store: Optional[BlobStore] = None
+        self.__send_lock = threading.Lock()
         self._on_event = None
         self._on_session_created = None
         self.host_client_id: Optional[str] = None
@@ -19,6 +118,7 @@ class Connection:
         self.page_url: Optional[str] = None
         self.sessions = {}
         self.pubsubhub = PubSubHub()
+        self.event_dispatcher = EventDispatcher(event_workers)
 
     @property
     def on_event(self):
@@ -38,25 +138,46 @@ class Connection:
 
     def _on_message(self, data):
         logging.debug(f"_on_message: {data}")
-        msg_dict = json.loads(data)
-        msg = Message(**msg_dict)
+        msg = decode_message(data)
         if msg.id:
-            # callback
-            evt = self._ws_callbacks[msg.id][0]
-            self._ws_callbacks[msg.id] = (None, msg.payload)
-            evt.set()
+            # response to a request
+            entry = self._ws_callbacks.pop(msg.id, None)
+            if entry is None:
+                # the request has timed out or been cancelled
+                return
+            fut, started = entry
+            self.request_metrics.finish(started)
+            try:
+                fut.set_result(msg.payload)
+            except futures.InvalidStateError:
+                pass
         elif msg.action == Actions.PAGE_EVENT_TO_HOST:
             if self._on_event is not None:
-                th = threading.Thread(
-                    target=self._on_event,
-                    args=(
+                payload = PageEventPayload(**msg.payload)
+                if payload.eventName in _REPLY_EVENTS:
+                    th = threading.Thread(
+                        target=self._on_event,
+                        args=(self, payload),
+                        daemon=True,
+                    )
+                    th.start()
+                else:
+                    # events of the same session are handled in arrival order
+                    page = self.sessions.get(payload.sessionID)
+                    mailbox = (
+                        page._get_control_event_mailbox(
+                            payload.eventTarget, payload.eventName
+                        )
+                        if page is not None
+                        else None
+                    )
+                    self.event_dispatcher.dispatch(
+                        payload.sessionID,
+                        self._on_event,
                         self,
-                        PageEventPayload(**msg.payload),
-                    ),
-                    daemon=True,
-                )
-                th.start()
-                # self._on_event(self, PageEventPayload(**msg.payload))
+                        payload,
+                        mailbox=mailbox,
+                    )
         elif msg.action == Actions.SESSION_CREATED:
             if self._on_session_created is not None:
                 th = threading.Thread(
@@ -70,7 +191,7 @@ class Connection:
                 th.start()
         else:
             # it's something else
-            print(msg.payload)
+            logging.warning(f"Unexpected message: {msg.action} {msg.payload}")
 
     def register_host_client(
         self,
@@ -82,45 +203,164 @@ class Connection:
         permissions: Optional[str],
     ):
         payload = RegisterHostClientRequestPayload(
-            host_client_id, page_name, is_app, update, auth_token, permissions
+            host_client_id,
+            page_name,
+            is_app,
+            update,
+            auth_token,
+            permissions,
+            self.framing if self.framing == MSGPACK_FRAMING else None,
+            self.attr_table,
+            self.blobs,
         )
+        # new connection starts with JSON and an empty name table
+        self.__msgpack = False
+        self.__attr_table = None
+        blob_store, self.__blob_store = self.__blob_store, None
         response = self._send_message_with_result(Actions.REGISTER_HOST_CLIENT, payload)
-        return RegisterHostClientResponsePayload(**response)
+        result = RegisterHostClientResponsePayload(**response)
+        self.__msgpack = result.framing == MSGPACK_FRAMING
+        self.__attr_table = AttrNameTable() if result.attrTable else None
+        if result.blobs:
+            # the server keeps blobs of the host client until it expires
+            self.__blob_store = blob_store or BlobStore()
+            self.__blob_store.invalidate()
+        return result
 
-    def send_command(self, session_id: str, command: Command):
+    def send_command(
+        self, session_id: str, command: Command, timeout: Optional[float] = None
+    ):
         assert self.page_name is not None
         payload = PageCommandRequestPayload(self.page_name, session_id, command)
         response = self._send_message_with_result(
-            Actions.PAGE_COMMAND_FROM_HOST, payload
+            Actions.PAGE_COMMAND_FROM_HOST, payload, timeout
         )
-        result = PageCommandResponsePayload(**response)
-        if result.error:
-            raise Exception(result.error)
-        return result
+        return _command_result(response)
 
-    def send_commands(self, session_id: str, commands: List[Command]):
+    def send_commands(
+        self,
+        session_id: str,
+        commands: List[Command],
+        timeout: Optional[float] = None,
+    ):
         assert self.page_name is not None
         payload = PageCommandsBatchRequestPayload(self.page_name, session_id, commands)
         response = self._send_message_with_result(
-            Actions.PAGE_COMMANDS_BATCH_FROM_HOST, payload
+            Actions.PAGE_COMMANDS_BATCH_FROM_HOST, payload, timeout
         )
-        result = PageCommandsBatchResponsePayload(**response)
-        if result.error:
-            raise Exception(result.error)
-        return result
+        return _commands_result(response)
+
+    async def send_command_async(
+        self, session_id: str, command: Command, timeout: Optional[float] = None
+    ):
+        assert self.page_name is not None
+        payload = PageCommandRequestPayload(self.page_name, session_id, command)
+        response = await self.__wait_async(
+            self._send_message(Actions.PAGE_COMMAND_FROM_HOST, payload), timeout
+        )
+        return _command_result(response)
+
+    async def send_commands_async(
+        self,
+        session_id: str,
+        commands: List[Command],
+        timeout: Optional[float] = None,
+    ):
+        assert self.page_name is not None
+        payload = PageCommandsBatchRequestPayload(self.page_name, session_id, commands)
+        response = await self.__wait_async(
+            self._send_message(Actions.PAGE_COMMANDS_BATCH_FROM_HOST, payload),
+            timeout,
+        )
+        return _commands_result(response)
+
+    def _send_message(self, action_name, payload) -> Future:
+        """Sends a request without waiting for the response.
 
-    def _send_message_with_result(self, action_name, payload):
-        msg_id = uuid.uuid4().hex
+        The returned future is resolved with the response payload; cancelling
+        it stops waiting for the response."""
+        msg_id = str(next(self._next_msg_id))
+        fut = Future()
+        fut.msg_id = msg_id  # type: ignore
+        # names and blobs must reach the server before commands using them
+        with self.__send_lock:
+            messages = []
+            if self.__blob_store is not None:
+                # responses to blob commands sent ahead are not waited for
+                *blob_payloads, payload = self.__blob_store.encode_payload(payload)
+                for p in blob_payloads:
+                    messages.append(
+                        self.__encode_message(
+                            str(next(self._next_msg_id)),
+                            Actions.PAGE_COMMANDS_BATCH_FROM_HOST,
+                            p,
+                        )
+                    )
+            messages.append(self.__encode_message(msg_id, action_name, payload))
+            self._ws_callbacks[msg_id] = (fut, self.request_metrics.start())
+            fut.add_done_callback(self.__on_request_done)
+            try:
+                for j in messages:
+                    self._ws.send(j)
+            except Exception:
+                # the server may have missed new names and blobs
+                self.__attr_table = None
+                if self.__blob_store is not None:
+                    self.__blob_store.invalidate()
+                entry = self._ws_callbacks.pop(msg_id, None)
+                if entry is not None:
+                    self.request_metrics.finish(entry[1], cancelled=True)
+                raise
+        return fut
+
+    def __encode_message(self, msg_id, action_name, payload):
+        if self.__attr_table is not None and isinstance(
+            payload, (PageCommandRequestPayload, PageCommandsBatchRequestPayload)
+        ):
+            payload = self.__attr_table.encode_payload(payload)
         msg = Message(msg_id, action_name, payload)
-        j = json.dumps(msg, cls=CommandEncoder, separators=(",", ":"))
-        logging.debug(f"_send_message_with_result: {j}")
-        evt = threading.Event()
-        self._ws_callbacks[msg_id] = (evt, None)
-        self._ws.send(j)
-        evt.wait()
-        return self._ws_callbacks.pop(msg_id)[1]
+        j = encode_message_msgpack(msg) if self.__msgpack else encode_message(msg)
+        logging.debug(f"_send_message: {j}")
+        return j
+
+    def _send_message_with_result(self, action_name, payload, timeout=None):
+        fut = self._send_message(action_name, payload)
+        if timeout is None:
+            timeout = self.request_timeout
+        try:
+            return fut.result(timeout)
+        except futures.TimeoutError:
+            self.__abort_request(fut)
+            raise TimeoutError(
+                f"No response to {action_name} request in {timeout} seconds."
+            )
+
+    async def __wait_async(self, fut: Future, timeout):
+        if timeout is None:
+            timeout = self.request_timeout
+        # unlike wait_for(), wait() doesn't cancel the future on timeout
+        done, _ = await asyncio.wait({asyncio.wrap_future(fut)}, timeout=timeout)
+        if not done:
+            self.__abort_request(fut)
+            raise TimeoutError(f"No response to request in {timeout} seconds.")
+        return done.pop().result()
+
+    def __abort_request(self, fut: Future):
+        entry = self._ws_callbacks.pop(fut.msg_id, None)  # type: ignore
+        if entry is not None:
+            self.request_metrics.finish(entry[1], timed_out=True)
+        fut.cancel()
+
+    def __on_request_done(self, fut: Future):
+        if fut.cancelled():
+            entry = self._ws_callbacks.pop(fut.msg_id, None)  # type: ignore
+            if entry is not None:
+                self.request_metrics.finish(entry[1], cancelled=True)
 
     def close(self):
         logging.debug("Closing connection...")
         if self._ws is not None:
             self._ws.close()
+        self.event_dispatcher.shutdown(wait=False)
+        for fut, _ in list(self._ws_callbacks.values()):
+            fut.cancel()
@@ -2,3 +2,4 @@ INDEX_PAGE = "p/index"
 HOSTED_SERVICE_URL = "https://app.flet.dev"
 CONNECT_TIMEOUT_SECONDS = 30
 ZERO_SESSION = "0"
+WS_COMPRESSION_THRESHOLD = 1024
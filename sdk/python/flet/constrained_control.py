@@ -8,6 +8,18 @@ from flet.types import AnimationValue, OffsetValue, RotateValue, ScaleValue
 
 
 class ConstrainedControl(Control):
+    __slots__ = (
+        "__rotate",
+        "__scale",
+        "__offset",
+        "__animate_opacity",
+        "__animate_size",
+        "__animate_position",
+        "__animate_rotation",
+        "__animate_scale",
+        "__animate_offset",
+    )
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
@@ -17,6 +29,7 @@ class ConstrainedControl(Control):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # ConstrainedControl specific
         #
@@ -47,6 +60,7 @@ class ConstrainedControl(Control):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.width = width
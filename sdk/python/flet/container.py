@@ -40,6 +40,18 @@ class Container(ConstrainedControl):
     Online docs: https://flet.dev/docs/controls/container
     """
 
+    __slots__ = (
+        "__on_click",
+        "__alignment",
+        "__padding",
+        "__margin",
+        "__gradient",
+        "__border",
+        "__border_radius",
+        "__content",
+        "__animate",
+    )
+
     def __init__(
         self,
         content: Optional[Control] = None,
@@ -67,6 +79,7 @@ class Container(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -117,6 +130,7 @@ class Container(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         def convert_container_tap_event_data(e):
@@ -1,13 +1,17 @@
 import datetime as dt
-import json
+import enum
+import functools
+import os
 import threading
-from difflib import SequenceMatcher
-from typing import TYPE_CHECKING, Any, Union
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Tuple, Union
 
 from beartype import beartype
-from beartype.typing import List, Optional
+from beartype.typing import Dict, List, Optional
 
-from flet.embed_json_encoder import EmbedJsonEncoder
+from flet.embed_json_encoder import embed_json_dumps
+from flet.event_dispatcher import EventMailbox
 from flet.protocol import Command
 from flet.ref import Ref
 
@@ -90,6 +94,35 @@ ClipBehavior = Literal[None, "none", "antiAlias", "antiAliasWithSaveLayer", "har
 
 
 class Control:
+    __slots__ = (
+        "__dict__",
+        "__weakref__",
+        "__page",
+        "__attrs",
+        "__dirty_attrs",
+        "__previous_children",
+        "__uid",
+        "__expand",
+        "__data",
+        "__key",
+        "__event_handlers",
+        "__lock",
+        "__parent",
+        "__subtree_dirty",
+        "__holds_mutable",
+        "__subtree_mutable",
+        "__event_mailboxes",
+    )
+
+    # high-frequency events delivering absolute values, so only the latest
+    # of them needs to be handled
+    _coalesced_events: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.__members = _get_wrapped_members(cls)
+        _wrap_members(cls)
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
@@ -99,11 +132,20 @@ class Control:
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
     ):
         super().__init__()
+        self.__parent: Optional[Control] = None
+        self.__subtree_dirty = True
+        self.__holds_mutable = False
+        self.__subtree_mutable = False
         self.__page: Optional[Page] = None
         self.__attrs = {}
-        self.__previous_children = []
+        self.__dirty_attrs = 0  # bitset, see _get_attr_bit()
+        self.__previous_children: Optional[List[Control]] = None
+        self.__event_handlers: Optional[Dict[str, Any]] = None
+        self.__event_mailboxes: Optional[Dict[str, Optional[EventMailbox]]] = None
+        self.__lock: Optional[threading.Lock] = None
         self._id = None
         self.__uid: Optional[str] = None
         self.expand = expand
@@ -113,8 +155,8 @@ class Control:
         self.disabled = disabled
         self.__data: Any = None
         self.data = data
-        self.__event_handlers = {}
-        self._lock = threading.Lock()
+        self.__key: Any = None
+        self.key = key
         if ref:
             ref.current = self
 
@@ -140,17 +182,50 @@ class Control:
         raise Exception("_getControlName must be overridden in inherited class")
 
     def _add_event_handler(self, event_name, handler):
+        if self.__event_handlers is None:
+            if handler is None:
+                return
+            self.__event_handlers = {}
         self.__event_handlers[event_name] = handler
 
     def _get_event_handler(self, event_name):
+        if self.__event_handlers is None:
+            return None
         return self.__event_handlers.get(event_name)
 
+    def set_event_policy(
+        self,
+        event_name: str,
+        coalesce: bool = True,
+        throttle_ms: Optional[int] = None,
+    ):
+        """Sets how frequent `event_name` events are delivered to the handler.
+
+        With `coalesce` only the latest of the events which arrived while the
+        handler was busy is delivered. `throttle_ms` limits handler calls
+        to one per interval, delivering the latest event."""
+        if self.__event_mailboxes is None:
+            self.__event_mailboxes = {}
+        self.__event_mailboxes[event_name] = (
+            EventMailbox(throttle_ms) if coalesce or throttle_ms else None
+        )
+
+    def _get_event_mailbox(self, event_name):
+        mailboxes = self.__event_mailboxes
+        if mailboxes is not None and event_name in mailboxes:
+            return mailboxes[event_name]
+        if event_name in self._coalesced_events:
+            if mailboxes is None:
+                mailboxes = self.__event_mailboxes = {}
+            return mailboxes.setdefault(event_name, EventMailbox())
+        return None
+
     def _get_attr(self, name, def_value=None, data_type="string"):
         name = name.lower()
         if name not in self.__attrs:
             return def_value
 
-        s_val = self.__attrs[name][0]
+        s_val = self.__attrs[name]
         if data_type == "bool" and s_val is not None and isinstance(s_val, str):
             return s_val.lower() == "true"
         elif data_type == "bool?" and isinstance(s_val, str):
@@ -191,8 +266,19 @@ class Control:
         if value is None:
             value = ""
 
-        if orig_val is None or orig_val[0] != value:
-            self.__attrs[name] = (value, dirty)
+        if orig_val is None or orig_val != value:
+            self.__attrs[name] = value
+            if dirty:
+                self.__dirty_attrs |= _get_attr_bit(name)
+                self._mark_dirty()
+            elif self.__dirty_attrs:
+                self.__dirty_attrs &= ~_get_attr_bit(name)
+
+    def _mark_dirty(self):
+        ctrl = self
+        while ctrl is not None and not ctrl.__subtree_dirty:
+            ctrl.__subtree_dirty = True
+            ctrl = ctrl.__parent
 
     def _set_attr_json(self, name, value):
         ov = self._get_attr(name)
@@ -201,22 +287,31 @@ class Control:
             self._set_attr(name, nv)
 
     def _convert_attr_json(self, value):
-        return (
-            json.dumps(value, cls=EmbedJsonEncoder, separators=(",", ":"))
-            if value is not None
-            else None
-        )
+        return embed_json_dumps(value) if value is not None else None
 
     # event_handlers
     @property
     def event_handlers(self):
+        if self.__event_handlers is None:
+            return {}
         return self.__event_handlers
 
     # _previous_children
     @property
     def _previous_children(self):
+        if self.__previous_children is None:
+            self.__previous_children = []
         return self.__previous_children
 
+    # _lock
+    @property
+    def _lock(self):
+        if self.__lock is None:
+            with _control_lock_init:
+                if self.__lock is None:
+                    self.__lock = threading.Lock()
+        return self.__lock
+
     # _id
     @property
     def _id(self):
@@ -300,12 +395,53 @@ class Control:
     def data(self, value):
         self.__data = value
 
+    # key
+    @property
+    def key(self):
+        """Identifies the control among its siblings: a new control with
+        the same key and type takes place of the previous one on the client,
+        which gets only attributes and children that differ."""
+        return self.__key
+
+    @key.setter
+    def key(self, value):
+        self.__key = value
+        self._mark_dirty()
+
     # public methods
     def update(self):
+        """Sends changes of the control and its descendants to the client.
+
+        Controls changed by property setters are sent, as well as controls
+        holding objects which could be changed in place (`controls` list,
+        `padding`, etc.), so unchanged controls with plain property values
+        are skipped."""
         if not self.__page:
+            if self.__defer_unattached_update():
+                return
             raise Exception("Control must be added to the page first.")
         self.__page.update(self)
 
+    async def update_async(self):
+        if not self.__page:
+            if self.__defer_unattached_update():
+                return
+            raise Exception("Control must be added to the page first.")
+        await self.__page.update_async(self)
+
+    def __defer_unattached_update(self):
+        # in a batch the control may have been added to the page,
+        # which is checked when the batch is sent
+        unattached = _batch_unattached_controls.get()
+        if unattached is None:
+            return False
+        unattached.append(self)
+        return True
+
+    def _check_attached(self):
+        if not self.__page:
+            raise Exception("Control must be added to the page first.")
+
     def clean(self):
         with self._lock:
             self._previous_children.clear()
@@ -316,6 +452,7 @@ class Control:
             return self.__page._send_command("clean", [self.uid])
 
     def build_update_commands(self, index, added_controls, commands, isolated=False):
+        self.__subtree_dirty = False
         update_cmd = self._build_command(update=True)
 
         if len(update_cmd.attrs) > 0:
@@ -323,88 +460,152 @@ class Control:
             commands.append(update_cmd)
 
         if isolated:
+            self.__subtree_mutable = self.__holds_mutable
             return
 
         # go through children
-        previous_children = self.__previous_children
+        previous_children = self.__previous_children or []
         current_children = self._get_children()
 
-        hashes = {}
-        previous_ints = []
-        current_ints = []
-
-        for ctrl in previous_children:
-            hashes[hash(ctrl)] = ctrl
-            previous_ints.append(hash(ctrl))
-
-        for ctrl in current_children:
-            hashes[hash(ctrl)] = ctrl
-            current_ints.append(hash(ctrl))
-
-        sm = SequenceMatcher(None, previous_ints, current_ints)
-
-        n = 0
-        for tag, a1, a2, b1, b2 in sm.get_opcodes():
-            if tag == "delete":
-                # deleted controls
-                ids = []
-                for h in previous_ints[a1:a2]:
-                    ctrl = hashes[h]
-                    self._remove_control_recursively(index, ctrl)
-                    ids.append(ctrl.__uid)
-                commands.append(Command(0, "remove", ids))
-            elif tag == "equal":
-                # unchanged control
-                for h in previous_ints[a1:a2]:
-                    ctrl = hashes[h]
+        # fast path: children list hasn't changed
+        if len(previous_children) == len(current_children) and all(
+            p is c for p, c in zip(previous_children, current_children)
+        ):
+            for ctrl in current_children:
+                if ctrl.__subtree_dirty or ctrl.__subtree_mutable:
                     ctrl.build_update_commands(
                         index, added_controls, commands, isolated=ctrl._is_isolated()
                     )
-                    n += 1
-            elif tag == "replace":
-                ids = []
-                for h in previous_ints[a1:a2]:
-                    # delete
-                    ctrl = hashes[h]
-                    self._remove_control_recursively(index, ctrl)
-                    ids.append(ctrl.__uid)
-                commands.append(Command(0, "remove", ids))
-                for h in current_ints[b1:b2]:
-                    # add
-                    ctrl = hashes[h]
-                    innerCmds = ctrl._build_add_commands(
-                        index=index, added_controls=added_controls
-                    )
-                    assert self.__uid is not None
-                    commands.append(
-                        Command(
-                            indent=0,
-                            name="add",
-                            attrs={"to": self.__uid, "at": str(n)},
-                            commands=innerCmds,
-                        )
-                    )
-                    n += 1
-            elif tag == "insert":
-                # add
-                for h in current_ints[b1:b2]:
-                    ctrl = hashes[h]
-                    innerCmds = ctrl._build_add_commands(
-                        index=index, added_controls=added_controls
-                    )
-                    assert self.__uid is not None
-                    commands.append(
-                        Command(
-                            indent=0,
-                            name="add",
-                            attrs={"to": self.__uid, "at": str(n)},
-                            commands=innerCmds,
-                        )
+            self.__subtree_mutable = self.__holds_mutable or any(
+                ctrl.__subtree_mutable for ctrl in current_children
+            )
+            return
+
+        previous_keys = {}
+        removed = []
+        for i, ctrl in enumerate(previous_children):
+            key = ctrl._get_reconcile_key()
+            if key in previous_keys:
+                removed.append(i)
+            else:
+                previous_keys[key] = i
+
+        # match current children to previous positions by key
+        matches = []
+        for ctrl in current_children:
+            i = previous_keys.pop(ctrl._get_reconcile_key(), None)
+            if (
+                i is not None
+                and previous_children[i] is not ctrl
+                and type(previous_children[i]) is not type(ctrl)
+            ):
+                # same key, but another type of control: re-created
+                removed.append(i)
+                i = None
+            matches.append(i)
+
+        # matched controls which keep their relative order stay in place,
+        # everything else is moved
+        stable = _longest_increasing_subsequence(matches)
+
+        # deleted and re-created controls
+        ids = []
+        for i in sorted([*previous_keys.values(), *removed]):
+            ctrl = previous_children[i]
+            self._remove_control_recursively(index, ctrl)
+            ids.append(ctrl.__uid)
+        if len(ids) > 0:
+            commands.append(Command(0, "remove", ids))
+
+        # Each inserted or moved control is placed on the client right after
+        # the previous current child, so the controls placed so far follow
+        # their stable predecessor. Moved controls not placed yet are still
+        # at their previous positions, and those before the last stable
+        # control shift "at" of the controls placed after it.
+        not_placed = sorted(
+            i for n, i in enumerate(matches) if i is not None and n not in stable
+        )
+        last_stable = -1  # previous position of the last stable control
+
+        assert self.__uid is not None
+        move_cmd = None
+        for n, ctrl in enumerate(current_children):
+            i = matches[n]
+            if n in stable:
+                last_stable = i
+                move_cmd = None
+            elif i is not None:
+                del not_placed[bisect_left(not_placed, i)]
+                at = n + bisect_left(not_placed, last_stable)
+                uid = previous_children[i].__uid
+                if move_cmd is not None:
+                    # consecutive moves are sent as a single command placing
+                    # all its controls one after another starting at "at",
+                    # which is counted with all of them removed
+                    move_cmd.attrs["at"] = str(at - len(move_cmd.values))
+                    move_cmd.values.append(uid)
+                else:
+                    move_cmd = Command(0, "move", [uid], {"at": str(at)})
+                    commands.append(move_cmd)
+            else:
+                # inserted or re-created control
+                move_cmd = None
+                at = n + bisect_left(not_placed, last_stable)
+                ctrl.__parent = self
+                innerCmds = ctrl._build_add_commands(
+                    index=index, added_controls=added_controls
+                )
+                commands.append(
+                    Command(
+                        indent=0,
+                        name="add",
+                        attrs={"to": self.__uid, "at": str(at)},
+                        commands=innerCmds,
                     )
-                    n += 1
+                )
+                continue
+
+            if previous_children[i] is not ctrl:
+                # same key and type: takes place of the previous control
+                move_cmd = None
+                ctrl.__parent = self
+                ctrl._adopt(previous_children[i], index, added_controls, commands)
+            elif ctrl.__subtree_dirty or ctrl.__subtree_mutable:
+                ctrl.build_update_commands(
+                    index, added_controls, commands, isolated=ctrl._is_isolated()
+                )
+
+        self.__previous_children = list(current_children) if current_children else None
+        self.__subtree_mutable = self.__holds_mutable or any(
+            ctrl.__subtree_mutable for ctrl in current_children
+        )
 
-        self.__previous_children.clear()
-        self.__previous_children.extend(current_children)
+    def _get_reconcile_key(self):
+        if self.__key is not None:
+            return ("key", self.__key)
+        return ("id", id(self))
+
+    def _adopt(self, control, index, added_controls, commands):
+        """Takes place of `control` with the same key and type on the client,
+        sending only attributes and children which differ."""
+        self._build()
+        self._before_build_command()
+        attrs = {}
+        for name in {**control.__attrs, **self.__attrs}:
+            val = self.__attrs.get(name)
+            if name != "id" and val != control.__attrs.get(name):
+                attrs[name] = _format_attr(val) if val is not None else ""
+        self.__dirty_attrs = 0
+
+        self.__uid = control.__uid
+        self.__previous_children = control.__previous_children
+        control.will_unmount()
+        index[self.__uid] = self
+        added_controls.append(self)
+
+        if len(attrs) > 0:
+            commands.append(Command(0, "set", [self.__uid], attrs))
+        self.build_update_commands(index, added_controls, commands)
 
     def _remove_control_recursively(self, index, control):
         for child in control._get_children():
@@ -418,6 +619,7 @@ class Control:
     def _build_add_commands(self, indent=0, index=None, added_controls=None):
 
         self._build()
+        self.__subtree_dirty = False
 
         # remove control from index
         if self.__uid and index is not None and self.__uid in index:
@@ -437,13 +639,16 @@ class Control:
         # controls
         children = self._get_children()
         for control in children:
+            control.__parent = self
             childCmd = control._build_add_commands(
                 indent=indent + 2, index=index, added_controls=added_controls
             )
             commands.extend(childCmd)
 
-        self.__previous_children.clear()
-        self.__previous_children.extend(children)
+        self.__previous_children = list(children) if children else None
+        self.__subtree_mutable = self.__holds_mutable or any(
+            control.__subtree_mutable for control in children
+        )
 
         return commands
 
@@ -455,25 +660,23 @@ class Control:
 
         self._before_build_command()
 
-        for attrName in sorted(self.__attrs):
-            attrName = attrName.lower()
-            dirty = self.__attrs[attrName][1]
+        if update:
+            # visit changed attributes only
+            attr_names = _get_attr_names(self.__dirty_attrs)
+        else:
+            attr_names = sorted(self.__attrs)
 
-            if (update and not dirty) or attrName == "id":
+        for attrName in attr_names:
+            bit = _get_attr_bit(attrName)
+            if attrName == "id":
+                self.__dirty_attrs &= ~bit
                 continue
 
-            val = self.__attrs[attrName][0]
-            sval = ""
+            val = self.__attrs.get(attrName)
             if val is None:
                 continue
-            elif isinstance(val, bool):
-                sval = str(val).lower()
-            elif isinstance(val, dt.datetime) or isinstance(val, dt.date):
-                sval = val.isoformat()
-            else:
-                sval = str(val)
-            command.attrs[attrName] = sval
-            self.__attrs[attrName] = (val, False)
+            command.attrs[attrName] = _format_attr(val)
+            self.__dirty_attrs &= ~bit
 
         id = self.__attrs.get("id")
         if not update and id is not None:
@@ -483,3 +686,157 @@ class Control:
             command.values.append(self.__uid)
 
         return command
+
+
+def _format_attr(val) -> str:
+    if isinstance(val, bool):
+        return str(val).lower()
+    elif isinstance(val, dt.datetime) or isinstance(val, dt.date):
+        return val.isoformat()
+    return str(val)
+
+
+# runtime type checks of property setters and methods decorated with
+# @beartype, can be disabled with FLET_VALIDATE=false or flet.app(validate=False)
+_validation_enabled = os.getenv("FLET_VALIDATE", "true").lower() not in [
+    "false",
+    "0",
+]
+
+
+def set_validation(enabled: bool):
+    global _validation_enabled
+    if _validation_enabled == enabled:
+        return
+    _validation_enabled = enabled
+    classes = [Control]
+    for cls in classes:
+        _wrap_members(cls)
+        classes.extend(cls.__subclasses__())
+
+
+def _get_wrapped_members(cls):
+    return {
+        name: value
+        for name, value in cls.__dict__.items()
+        if isinstance(value, property) or _is_validated(value)
+    }
+
+
+def _wrap_members(cls):
+    for name, value in cls._Control__members.items():
+        if isinstance(value, property):
+            value = property(
+                value.fget,
+                _with_validation(value.fset),
+                value.fdel,
+                value.__doc__,
+            )
+            if cls is not Control and not name.startswith("_"):
+                value = _track_property_changes(value)
+        else:
+            value = _with_validation(value)
+        setattr(cls, name, value)
+
+
+def _is_validated(fn):
+    # beartype marks its wrappers with this attribute since 0.9.1, the
+    # minimum supported version; test_validation_can_be_disabled() fails
+    # if a newer beartype stops doing so
+    return getattr(fn, "__beartype_wrapper", False) is True
+
+
+def _with_validation(fn):
+    if fn is not None and not _validation_enabled and _is_validated(fn):
+        return fn.__wrapped__
+    return fn
+
+
+Control._Control__members = _get_wrapped_members(Control)
+_wrap_members(Control)
+
+
+# attribute names shared by all controls mapped to bits of dirty attrs bitset
+_attr_bits: Dict[str, int] = {}
+_attr_names: List[str] = []
+_attr_bits_lock = threading.Lock()
+_control_lock_init = threading.Lock()
+
+# controls updated in a batch before being added to the page
+_batch_unattached_controls: ContextVar[Optional[List[Control]]] = ContextVar(
+    "flet_batch_unattached_controls", default=None
+)
+
+
+def _get_attr_bit(name: str) -> int:
+    bit = _attr_bits.get(name)
+    if bit is None:
+        with _attr_bits_lock:
+            bit = _attr_bits.get(name)
+            if bit is None:
+                bit = 1 << len(_attr_names)
+                _attr_bits[name] = bit
+                _attr_names.append(name)
+    return bit
+
+
+# returns names of attributes set in bitset, in the order of their bits
+def _get_attr_names(bits: int) -> List[str]:
+    names = []
+    while bits:
+        low_bit = bits & -bits
+        names.append(_attr_names[low_bit.bit_length() - 1])
+        bits ^= low_bit
+    return names
+
+
+# returns positions of the longest strictly increasing subsequence
+# of non-None items in seq
+def _longest_increasing_subsequence(seq):
+    tails = []  # smallest tail value of a subsequence of each length
+    tail_positions = []
+    predecessors = [-1] * len(seq)
+    for pos, v in enumerate(seq):
+        if v is None:
+            continue
+        k = bisect_left(tails, v)
+        if k == len(tails):
+            tails.append(v)
+            tail_positions.append(pos)
+        else:
+            tails[k] = v
+            tail_positions[k] = pos
+        predecessors[pos] = tail_positions[k - 1] if k > 0 else -1
+
+    result = set()
+    pos = tail_positions[-1] if tail_positions else -1
+    while pos != -1:
+        result.add(pos)
+        pos = predecessors[pos]
+    return result
+
+
+# wraps public property setter of Control subclass, so that setting it marks
+# control's subtree as dirty for the next update; controls holding objects
+# which could be changed in place (list of child controls, padding, border,
+# etc.) are visited by every update of their ancestors
+def _track_property_changes(prop: property):
+    if prop.fset is None or getattr(prop.fset, "_tracks_changes", False):
+        return prop
+
+    @functools.wraps(prop.fset)
+    def fset(self, value):
+        prop.fset(self, value)
+        if prop.fget is not None:
+            # setters may store a new object, e.g. an empty list for None
+            value = prop.fget(self)
+        if not (
+            value is None
+            or callable(value)
+            or isinstance(value, (str, int, float, tuple, dt.date, enum.Enum, Control))
+        ):
+            self._Control__holds_mutable = True
+        self._mark_dirty()
+
+    fset._tracks_changes = True
+    return property(prop.fget, fset, prop.fdel, prop.__doc__)
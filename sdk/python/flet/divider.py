@@ -7,12 +7,15 @@ from flet.ref import Ref
 
 
 class Divider(Control):
+    __slots__ = ()
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
         opacity: OptionalNumber = None,
         visible: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -27,6 +30,7 @@ class Divider(Control):
             opacity=opacity,
             visible=visible,
             data=data,
+            key=key,
         )
 
         self.height = height
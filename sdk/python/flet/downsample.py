@@ -0,0 +1,73 @@
+from typing import Any, Tuple
+
+
+def _get_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise Exception('Install "numpy" Python package to downsample chart data.')
+    return numpy
+
+
+def lttb(x, y, threshold: int) -> Tuple[Any, Any]:
+    """Reduces series to `threshold` points with Largest-Triangle-Three-Buckets.
+
+    The first and last points are kept; from each bucket in between the point
+    forming the largest triangle with the previously selected point and the
+    average of the next bucket is selected."""
+    np = _get_numpy()
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return x, y
+
+    # bucket boundaries of the points between the first and the last one
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    # averages of the buckets, the last point being the "bucket" after the last
+    counts = np.diff(edges)
+    avg_x = np.append(np.add.reduceat(x[1:-1], edges[:-1] - 1) / counts, x[-1])
+    avg_y = np.append(np.add.reduceat(y[1:-1], edges[:-1] - 1) / counts, y[-1])
+
+    selected = np.empty(threshold, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        ax, ay = x[a], y[a]
+        # doubled areas of the triangles, sign doesn't matter
+        areas = np.abs(
+            (ax - avg_x[i + 1]) * (y[start:end] - ay)
+            - (ax - x[start:end]) * (avg_y[i + 1] - ay)
+        )
+        a = start + int(np.argmax(areas))
+        selected[i + 1] = a
+    return x[selected], y[selected]
+
+
+def min_max(x, y, buckets: int) -> Tuple[Any, Any]:
+    """Reduces series to the minimum and maximum of each of `buckets` buckets.
+
+    Unlike `lttb()`, spikes are never lost, which suits noisy signals drawn
+    with one bucket per pixel."""
+    np = _get_numpy()
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if 2 * buckets >= n or buckets < 1:
+        return x, y
+
+    starts = np.linspace(0, n, buckets + 1).astype(int)[:-1]
+    sizes = np.diff(np.append(starts, n))
+    idx = np.arange(n)
+    selected = []
+    for reduce in [np.minimum, np.maximum]:
+        values = np.repeat(reduce.reduceat(y, starts), sizes)
+        # position of the first minimum (maximum) of each bucket;
+        # buckets of NaNs have none
+        pos = np.minimum.reduceat(np.where(y == values, idx, n), starts)
+        selected.append(np.where(pos < n, pos, starts))
+    # both points of a bucket in their original order
+    selected = np.unique(np.concatenate(selected))
+    return x[selected], y[selected]
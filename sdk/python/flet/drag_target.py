@@ -10,12 +10,15 @@ from flet.ref import Ref
 
 
 class DragTarget(Control):
+    __slots__ = ("__on_accept", "__content")
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
         disabled: Optional[bool] = None,
         visible: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -32,6 +35,7 @@ class DragTarget(Control):
             disabled=disabled,
             visible=visible,
             data=data,
+            key=key,
         )
 
         def convert_accept_event_data(e):
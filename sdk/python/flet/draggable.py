@@ -7,12 +7,15 @@ from flet.ref import Ref
 
 
 class Draggable(Control):
+    __slots__ = ("__content", "__content_when_dragging", "__content_feedback")
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
         disabled: Optional[bool] = None,
         visible: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -28,6 +31,7 @@ class Draggable(Control):
             disabled=disabled,
             visible=visible,
             data=data,
+            key=key,
         )
 
         self.__content: Optional[Control] = None
@@ -18,6 +18,8 @@ from flet.types import (
 
 
 class Dropdown(FormFieldControl):
+    __slots__ = ("__options",)
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
@@ -40,6 +42,7 @@ class Dropdown(FormFieldControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # FormField specific
         #
@@ -107,6 +110,7 @@ class Dropdown(FormFieldControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
             #
             # FormField specific
             #
@@ -221,6 +225,8 @@ class Dropdown(FormFieldControl):
 
 
 class Option(Control):
+    __slots__ = ()
+
     def __init__(self, key=None, text=None, disabled=None, ref=None):
         Control.__init__(self, ref=ref, disabled=disabled)
         assert key is not None or text is not None, "key or text must be specified"
@@ -231,9 +237,17 @@ class Option(Control):
     def _get_control_name(self):
         return "dropdownoption"
 
+    def _get_reconcile_key(self):
+        # options are told apart by their keys (values)
+        if self.key is not None:
+            return ("key", self.key)
+        return super()._get_reconcile_key()
+
     # key
     @property
     def key(self):
+        """Value of the option, which also identifies it among options
+        of the dropdown like `Control.key` does."""
         return self._get_attr("key")
 
     @key.setter
@@ -10,6 +10,8 @@ from flet.types import AnimationValue, OffsetValue, RotateValue, ScaleValue
 
 
 class ElevatedButton(ConstrainedControl):
+    __slots__ = ("__color", "__bgcolor", "__elevation", "__style", "__content")
+
     def __init__(
         self,
         text: Optional[str] = None,
@@ -37,6 +39,7 @@ class ElevatedButton(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -78,6 +81,7 @@ class ElevatedButton(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.__color = None
@@ -1,6 +1,7 @@
 import json
-from typing import Dict
+from typing import Any, Dict
 
+from flet import json_codec
 from flet.border import Border, BorderSide
 from flet.border_radius import BorderRadius
 from flet.buttons import ButtonStyle
@@ -47,3 +48,45 @@ class EmbedJsonEncoder(json.JSONEncoder):
 
     def _cleanup_dict(self, d):
         return dict(filter(lambda item: item[1] is not None, d.items()))
+
+
+_encoder = EmbedJsonEncoder()
+
+# JSON of value objects (padding, border, gradient, theme, animation, etc.)
+# keyed by their frozen state
+_json_cache: Dict[Any, str] = {}
+_JSON_CACHE_MAX_SIZE = 4096
+
+
+def embed_json_dumps(value):
+    try:
+        key = _freeze(value)
+        j = _json_cache.get(key)
+    except TypeError:
+        # unhashable value
+        key = None
+        j = None
+
+    if j is None:
+        j = json_codec.dumps(value, _encoder.default)
+        if key is not None:
+            if len(_json_cache) >= _JSON_CACHE_MAX_SIZE:
+                _json_cache.clear()
+            _json_cache[key] = j
+    return j
+
+
+def _freeze(value):
+    t = value.__class__
+    if value is None or t is str:
+        return value
+    elif t is bool or t is int or t is float:
+        # 1, 1.0 and True are equal, but encoded differently
+        return (t, value)
+    elif t is list or t is tuple:
+        return (list, tuple(map(_freeze, value)))
+    elif t is dict:
+        return (dict, tuple([(k, _freeze(v)) for k, v in value.items()]))
+    elif hasattr(value, "__dict__"):
+        return (t, tuple(value.__dict__), tuple(map(_freeze, value.__dict__.values())))
+    return (t, value)
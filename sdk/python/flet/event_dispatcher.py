@@ -0,0 +1,204 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Deque, Dict, Optional
+
+
+class EventMailbox:
+    """Latest-value-wins slot for one event of one control.
+
+    While an event is waiting to run, newer events replace its data instead
+    of being queued. With `throttle_ms` set, the handler is called at most
+    once per that interval with the latest event."""
+
+    __slots__ = ("throttle_ms", "pending", "last_run")
+
+    def __init__(self, throttle_ms: Optional[int] = None):
+        self.throttle_ms = throttle_ms
+        self.pending: Optional[list] = None
+        self.last_run = 0.0
+
+
+class EventDispatcher:
+    """Runs event callbacks on a bounded thread pool.
+
+    Callbacks dispatched with the same key (session ID) run one at a time
+    in the order they were dispatched; different keys run in parallel."""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.__executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="flet_event"
+        )
+        self.__lock = threading.Lock()
+        self.__queues: Dict[Any, Deque] = {}
+        self.__queue_depth = 0
+        self.__max_queue_depth = 0
+        self.__processed = 0
+        self.__coalesced = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of callbacks waiting to run."""
+        return self.__queue_depth
+
+    @property
+    def max_queue_depth(self) -> int:
+        return self.__max_queue_depth
+
+    def get_metrics(self) -> Dict[str, int]:
+        with self.__lock:
+            return {
+                "queue_depth": self.__queue_depth,
+                "max_queue_depth": self.__max_queue_depth,
+                "active_keys": len(self.__queues),
+                "processed": self.__processed,
+                "coalesced": self.__coalesced,
+            }
+
+    def dispatch(self, key, fn, *args, mailbox: Optional[EventMailbox] = None):
+        entry = [fn, args, mailbox]
+        with self.__lock:
+            if mailbox is not None:
+                if mailbox.pending is not None:
+                    # the previous event hasn't started yet, replace its data
+                    mailbox.pending[1] = args
+                    self.__coalesced += 1
+                    return
+                mailbox.pending = entry
+
+            self.__queue_depth += 1
+            if self.__queue_depth > self.__max_queue_depth:
+                self.__max_queue_depth = self.__queue_depth
+
+            if mailbox is not None and mailbox.throttle_ms:
+                delay = mailbox.last_run + mailbox.throttle_ms / 1000 - time.monotonic()
+                if delay > 0:
+                    timer = threading.Timer(delay, self.__enqueue, (key, entry))
+                    timer.daemon = True
+                    timer.start()
+                    return
+
+        self.__enqueue(key, entry)
+
+    def __enqueue(self, key, entry):
+        with self.__lock:
+            queue = self.__queues.get(key)
+            if queue is not None:
+                # a worker is already draining this key
+                queue.append(entry)
+                return
+            self.__queues[key] = deque([entry])
+        self.__executor.submit(self.__run, key)
+
+    def __run(self, key):
+        while True:
+            with self.__lock:
+                queue = self.__queues[key]
+                if len(queue) == 0:
+                    del self.__queues[key]
+                    return
+                fn, args, mailbox = queue.popleft()
+                self.__queue_depth -= 1
+                if mailbox is not None:
+                    mailbox.pending = None
+                    mailbox.last_run = time.monotonic()
+            try:
+                fn(*args)
+            except Exception:
+                logging.exception("Unhandled error in event handler")
+            with self.__lock:
+                self.__processed += 1
+
+    def shutdown(self, wait=True):
+        self.__executor.shutdown(wait=wait)
+
+
+class AsyncEventDispatcher:
+    """Runs event coroutines on asyncio event loop.
+
+    Coroutines dispatched with the same key (session ID) run one at a time
+    in the order they were dispatched; different keys run concurrently.
+    Must be called from the event loop thread."""
+
+    def __init__(self):
+        self.__queues: Dict[Any, Deque] = {}
+        self.__tasks = set()
+        self.__queue_depth = 0
+        self.__max_queue_depth = 0
+        self.__processed = 0
+        self.__coalesced = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of coroutines waiting to run."""
+        return self.__queue_depth
+
+    @property
+    def max_queue_depth(self) -> int:
+        return self.__max_queue_depth
+
+    def get_metrics(self) -> Dict[str, int]:
+        return {
+            "queue_depth": self.__queue_depth,
+            "max_queue_depth": self.__max_queue_depth,
+            "active_keys": len(self.__queues),
+            "processed": self.__processed,
+            "coalesced": self.__coalesced,
+        }
+
+    def dispatch(self, key, fn, *args, mailbox: Optional[EventMailbox] = None):
+        entry = [fn, args, mailbox]
+        if mailbox is not None:
+            if mailbox.pending is not None:
+                # the previous event hasn't started yet, replace its data
+                mailbox.pending[1] = args
+                self.__coalesced += 1
+                return
+            mailbox.pending = entry
+
+        self.__queue_depth += 1
+        if self.__queue_depth > self.__max_queue_depth:
+            self.__max_queue_depth = self.__queue_depth
+
+        if mailbox is not None and mailbox.throttle_ms:
+            delay = mailbox.last_run + mailbox.throttle_ms / 1000 - time.monotonic()
+            if delay > 0:
+                asyncio.get_running_loop().call_later(delay, self.__enqueue, key, entry)
+                return
+
+        self.__enqueue(key, entry)
+
+    def __enqueue(self, key, entry):
+        queue = self.__queues.get(key)
+        if queue is not None:
+            # a task is already draining this key
+            queue.append(entry)
+            return
+        self.__queues[key] = deque([entry])
+        # keep a reference to running tasks, so they are not garbage collected
+        task = asyncio.get_running_loop().create_task(self.__run(key))
+        self.__tasks.add(task)
+        task.add_done_callback(self.__tasks.discard)
+
+    async def __run(self, key):
+        queue = self.__queues[key]
+        while len(queue) > 0:
+            fn, args, mailbox = queue.popleft()
+            self.__queue_depth -= 1
+            if mailbox is not None:
+                mailbox.pending = None
+                mailbox.last_run = time.monotonic()
+            try:
+                await fn(*args)
+            except Exception:
+                logging.exception("Unhandled error in event handler")
+            self.__processed += 1
+        del self.__queues[key]
+
+    async def shutdown(self):
+        for task in list(self.__tasks):
+            task.cancel()
+        await asyncio.gather(*self.__tasks, return_exceptions=True)
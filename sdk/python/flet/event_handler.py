@@ -1,21 +1,40 @@
+import asyncio
+
+
 class EventHandler:
     def __init__(self, result_converter=None) -> None:
         self.__handlers = {}
         self.__result_converter = result_converter
 
     def handler(self, e):
-        for h in self.__handlers.keys():
-            if self.__result_converter is not None:
-                r = self.__result_converter(e)
-                if r is not None:
-                    r.target = e.target
-                    r.name = e.name
-                    r.data = e.data
-                    r.control = e.control
-                    r.page = e.page
+        for h in list(self.__handlers.keys()):
+            r = self.__convert(e)
+            if r is not None:
+                if asyncio.iscoroutinefunction(h):
+                    asyncio.run(h(r))
+                else:
                     h(r)
-            else:
-                h(e)
+
+    async def handler_async(self, e):
+        for h in list(self.__handlers.keys()):
+            r = self.__convert(e)
+            if r is not None:
+                if asyncio.iscoroutinefunction(h):
+                    await h(r)
+                else:
+                    await asyncio.get_running_loop().run_in_executor(None, h, r)
+
+    def __convert(self, e):
+        if self.__result_converter is None:
+            return e
+        r = self.__result_converter(e)
+        if r is not None:
+            r.target = e.target
+            r.name = e.name
+            r.data = e.data
+            r.control = e.control
+            r.page = e.page
+        return r
 
     def subscribe(self, handler):
         if handler is not None:
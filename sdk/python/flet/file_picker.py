@@ -52,12 +52,21 @@ class FilePickerUploadEvent(ControlEvent):
 
 
 class FilePicker(Control):
+    __slots__ = (
+        "__on_result",
+        "__on_upload",
+        "__result",
+        "__upload",
+        "__allowed_extensions",
+    )
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -71,6 +80,7 @@ class FilePicker(Control):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         def convert_result_event_data(e):
@@ -7,6 +7,8 @@ from flet.ref import Ref
 
 
 class FilledTonalButton(ElevatedButton):
+    __slots__ = ()
+
     def __init__(
         self,
         text: Optional[str] = None,
@@ -19,6 +21,7 @@ class FilledTonalButton(ElevatedButton):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -42,6 +45,7 @@ class FilledTonalButton(ElevatedButton):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
             #
             # Specific
             #
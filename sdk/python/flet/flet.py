@@ -1,24 +1,21 @@
-import argparse
+import asyncio
 import json
 import logging
+import multiprocessing.spawn
 import signal
 import socket
 import subprocess
-import tarfile
+import sys
 import tempfile
 import threading
 import time
 import traceback
-import urllib.request
-import zipfile
 from pathlib import Path
 from time import sleep
 
-from watchdog.events import FileSystemEventHandler
-from watchdog.observers import Observer
-
 from flet import constants, version
 from flet.connection import Connection
+from flet.control import set_validation
 from flet.event import Event
 from flet.page import Page
 from flet.reconnecting_websocket import ReconnectingWebSocket
@@ -49,7 +46,14 @@ def page(
     upload_dir=None,
     web_renderer="canvaskit",
     route_url_strategy="hash",
+    validate=True,
+    event_workers=None,
+    framing=None,
+    compression=None,
 ):
+    if not validate:
+        set_validation(False)
+
     conn = _connect_internal(
         page_name=name,
         host=host,
@@ -60,6 +64,9 @@ def page(
         upload_dir=upload_dir,
         web_renderer=web_renderer,
         route_url_strategy=route_url_strategy,
+        event_workers=event_workers,
+        framing=framing,
+        compression=compression,
     )
     url_prefix = os.getenv("FLET_DISPLAY_URL_PREFIX")
     if url_prefix is not None:
@@ -87,10 +94,40 @@ def app(
     upload_dir=None,
     web_renderer="canvaskit",
     route_url_strategy="hash",
+    validate=True,
+    event_workers=None,
+    framing=None,
+    compression=None,
 ):
     if target is None:
         raise Exception("target argument is not specified")
 
+    if _is_main_reimported():
+        return
+
+    if asyncio.iscoroutinefunction(target):
+        return asyncio.run(
+            app_async(
+                name=name,
+                host=host,
+                port=port,
+                target=target,
+                permissions=permissions,
+                view=view,
+                assets_dir=assets_dir,
+                upload_dir=upload_dir,
+                web_renderer=web_renderer,
+                route_url_strategy=route_url_strategy,
+                validate=validate,
+                event_workers=event_workers,
+                framing=framing,
+                compression=compression,
+            )
+        )
+
+    if not validate:
+        set_validation(False)
+
     conn = _connect_internal(
         page_name=name,
         host=host,
@@ -102,6 +139,9 @@ def app(
         upload_dir=upload_dir,
         web_renderer=web_renderer,
         route_url_strategy=route_url_strategy,
+        event_workers=event_workers,
+        framing=framing,
+        compression=compression,
     )
 
     url_prefix = os.getenv("FLET_DISPLAY_URL_PREFIX")
@@ -153,6 +193,81 @@ def app(
             pass
 
 
+async def app_async(
+    name="",
+    host=None,
+    port=0,
+    target=None,
+    permissions=None,
+    view: AppViewer = FLET_APP,
+    assets_dir=None,
+    upload_dir=None,
+    web_renderer="canvaskit",
+    route_url_strategy="hash",
+    validate=True,
+    event_workers=None,
+    framing=None,
+    compression=None,
+):
+    if target is None:
+        raise Exception("target argument is not specified")
+
+    if _is_main_reimported():
+        return
+
+    if not validate:
+        set_validation(False)
+
+    conn = await _connect_internal_async(
+        page_name=name,
+        host=host,
+        port=port,
+        is_app=True,
+        permissions=permissions,
+        session_handler=target,
+        assets_dir=assets_dir,
+        upload_dir=upload_dir,
+        web_renderer=web_renderer,
+        route_url_strategy=route_url_strategy,
+        event_workers=event_workers,
+        framing=framing,
+        compression=compression,
+    )
+
+    url_prefix = os.getenv("FLET_DISPLAY_URL_PREFIX")
+    if url_prefix is not None:
+        print(url_prefix, conn.page_url)
+    else:
+        logging.info(f"App URL: {conn.page_url}")
+
+    logging.info("Connected to Flet app and handling user sessions...")
+
+    fvp = None
+
+    try:
+        if (
+            (view == FLET_APP or view == FLET_APP_HIDDEN)
+            and not is_linux_server()
+            and url_prefix is None
+        ):
+            fvp = _open_flet_view(conn.page_url, view == FLET_APP_HIDDEN)
+            await asyncio.get_running_loop().run_in_executor(None, fvp.wait)
+        else:
+            if view == WEB_BROWSER and url_prefix is None:
+                open_in_browser(conn.page_url)
+            # serve sessions until cancelled
+            await asyncio.Event().wait()
+    finally:
+        await conn.close_async()
+
+        if fvp is not None and not is_windows():
+            try:
+                logging.debug(f"Flet View process {fvp.pid}")
+                os.kill(fvp.pid + 1, signal.SIGKILL)
+            except:
+                pass
+
+
 def _connect_internal(
     page_name=None,
     host=None,
@@ -168,29 +283,23 @@ def _connect_internal(
     upload_dir=None,
     web_renderer=None,
     route_url_strategy=None,
+    event_workers=None,
+    framing=None,
+    compression=None,
 ):
-    if share and server is None:
-        server = constants.HOSTED_SERVICE_URL
-    elif server is None:
-        # local mode
-        env_port = os.getenv("FLET_SERVER_PORT")
-        if env_port is not None and env_port:
-            port = env_port
-
-        # page with a custom port starts detached process
-        attached = False if not is_app and port != 0 else True
-
-        server_ip = host if host not in [None, "", "*"] else "127.0.0.1"
-        port = _start_flet_server(
-            host,
-            port,
-            attached,
-            assets_dir,
-            upload_dir,
-            web_renderer,
-            route_url_strategy,
-        )
-        server = f"http://{server_ip}:{port}"
+    started = time.monotonic()
+    server = _get_server_url(
+        host,
+        port,
+        is_app,
+        share,
+        server,
+        assets_dir,
+        upload_dir,
+        web_renderer,
+        route_url_strategy,
+    )
+    server_ready = time.monotonic()
 
     connected = threading.Event()
 
@@ -204,7 +313,7 @@ def _connect_internal(
                 del conn.sessions[e.sessionID]
 
     def on_session_created(conn, session_data):
-        page = Page(conn, session_data.sessionID)
+        page = Page(conn, session_data.sessionID, session_data.pageDetails)
         conn.sessions[session_data.sessionID] = page
         logging.info(f"Session started: {session_data.sessionID}")
         try:
@@ -218,14 +327,20 @@ def _connect_internal(
             page.error(f"There was an error while processing your request: {e}")
 
     ws_url = _get_ws_url(server)
-    ws = ReconnectingWebSocket(ws_url)
-    conn = Connection(ws)
+    ws = ReconnectingWebSocket(
+        ws_url,
+        compression_threshold=constants.WS_COMPRESSION_THRESHOLD
+        if _use_compression(compression, ws_url)
+        else None,
+    )
+    conn = Connection(ws, event_workers, framing=framing)
     conn.on_event = on_event
 
     if session_handler is not None:
         conn.on_session_created = on_session_created
 
     def _on_ws_connect():
+        ws_connected = time.monotonic()
         if conn.page_name is None:
             conn.page_name = page_name
         assert conn.page_name is not None
@@ -238,6 +353,8 @@ def _connect_internal(
         if conn.page_name != constants.INDEX_PAGE:
             assert conn.page_url is not None
             conn.page_url += f"/{conn.page_name}"
+        if not connected.is_set():
+            _log_startup_timing(started, server_ready, ws_connected)
         connected.set()
 
     def _on_ws_failed_connect():
@@ -248,10 +365,7 @@ def _connect_internal(
     ws.on_connect = _on_ws_connect
     ws.on_failed_connect = _on_ws_failed_connect
     ws.connect()
-    for n in range(0, constants.CONNECT_TIMEOUT_SECONDS):
-        if not connected.is_set():
-            sleep(1)
-    if not connected.is_set():
+    if not connected.wait(constants.CONNECT_TIMEOUT_SECONDS):
         ws.close()
         raise Exception(
             f"Could not connected to Flet server in {constants.CONNECT_TIMEOUT_SECONDS} seconds."
@@ -260,6 +374,192 @@ def _connect_internal(
     return conn
 
 
+def _is_main_reimported():
+    # processes started by multiprocessing with "spawn" or "forkserver"
+    # method, e.g. renderers of PlotlyChart, run the main script of the app
+    # again, which must not start another app
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_code is multiprocessing.spawn._fixup_main_from_path.__code__:
+            return True
+        frame = frame.f_back
+    return False
+
+
+def _use_compression(compression, ws_url):
+    # by default messages are compressed for remote servers only
+    if compression is None:
+        return not is_localhost_url(ws_url)
+    return compression
+
+
+def _get_server_url(
+    host,
+    port,
+    is_app,
+    share,
+    server,
+    assets_dir,
+    upload_dir,
+    web_renderer,
+    route_url_strategy,
+):
+    if share and server is None:
+        server = constants.HOSTED_SERVICE_URL
+    elif server is None:
+        # local mode
+        env_port = os.getenv("FLET_SERVER_PORT")
+        if env_port is not None and env_port:
+            port = env_port
+
+        # page with a custom port starts detached process
+        attached = False if not is_app and port != 0 else True
+
+        server_ip = host if host not in [None, "", "*"] else "127.0.0.1"
+        port = _start_flet_server(
+            host,
+            port,
+            attached,
+            assets_dir,
+            upload_dir,
+            web_renderer,
+            route_url_strategy,
+        )
+        server = f"http://{server_ip}:{port}"
+    return server
+
+
+async def _connect_internal_async(
+    page_name=None,
+    host=None,
+    port=0,
+    is_app=False,
+    update=False,
+    share=False,
+    server=None,
+    token=None,
+    permissions=None,
+    session_handler=None,
+    assets_dir=None,
+    upload_dir=None,
+    web_renderer=None,
+    route_url_strategy=None,
+    event_workers=None,
+    framing=None,
+    compression=None,
+):
+    from flet.async_connection import AsyncConnection
+
+    loop = asyncio.get_running_loop()
+    started = time.monotonic()
+    server = await loop.run_in_executor(
+        None,
+        _get_server_url,
+        host,
+        port,
+        is_app,
+        share,
+        server,
+        assets_dir,
+        upload_dir,
+        web_renderer,
+        route_url_strategy,
+    )
+    server_ready = time.monotonic()
+
+    async def on_event(conn, e):
+        if e.sessionID in conn.sessions:
+            await conn.sessions[e.sessionID].on_event_async(
+                Event(e.eventTarget, e.eventName, e.eventData)
+            )
+            if e.eventTarget == "page" and e.eventName == "close":
+                logging.info(f"Session closed: {e.sessionID}")
+                del conn.sessions[e.sessionID]
+
+    async def on_session_created(conn, session_data):
+        if session_data.pageDetails is not None:
+            page = Page(conn, session_data.sessionID, session_data.pageDetails)
+        else:
+            # page constructor fetches page details with sync calls
+            page = await loop.run_in_executor(
+                conn.executor, Page, conn, session_data.sessionID
+            )
+        conn.sessions[session_data.sessionID] = page
+        logging.info(f"Session started: {session_data.sessionID}")
+        try:
+            assert session_handler is not None
+            if asyncio.iscoroutinefunction(session_handler):
+                await session_handler(page)
+            else:
+                await loop.run_in_executor(conn.executor, session_handler, page)
+        except Exception as e:
+            print(
+                f"Unhandled error processing page session {page.session_id}:",
+                traceback.format_exc(),
+            )
+            await page.error_async(
+                f"There was an error while processing your request: {e}"
+            )
+
+    ws_url = _get_ws_url(server)
+    conn = AsyncConnection(
+        ws_url,
+        framing=framing,
+        compression_threshold=constants.WS_COMPRESSION_THRESHOLD
+        if _use_compression(compression, ws_url)
+        else None,
+        event_workers=event_workers,
+    )
+    conn.on_event = on_event
+
+    if session_handler is not None:
+        conn.on_session_created = on_session_created
+
+    deadline = time.monotonic() + constants.CONNECT_TIMEOUT_SECONDS
+    while True:
+        try:
+            await conn.connect()
+            break
+        except OSError:
+            logging.info(f"Failed to connect: {ws_url}")
+            if time.monotonic() > deadline:
+                raise Exception(
+                    f"Could not connected to Flet server in {constants.CONNECT_TIMEOUT_SECONDS} seconds."
+                )
+            await asyncio.sleep(0.1)
+    ws_connected = time.monotonic()
+
+    async def on_connect():
+        assert conn.page_name is not None
+        result = await conn.register_host_client_async(
+            conn.host_client_id, conn.page_name, is_app, update, token, permissions
+        )
+        conn.host_client_id = result.hostClientID
+        conn.page_name = result.pageName
+
+    conn.page_name = page_name
+    await on_connect()
+    # register again when the connection is re-established
+    conn.on_connect = on_connect
+    conn.page_url = server.rstrip("/")
+    if conn.page_name != constants.INDEX_PAGE:
+        assert conn.page_url is not None
+        conn.page_url += f"/{conn.page_name}"
+    _log_startup_timing(started, server_ready, ws_connected)
+
+    return conn
+
+
+def _log_startup_timing(started, server_ready, ws_connected):
+    registered = time.monotonic()
+    logging.debug(
+        f"Startup: server {(server_ready - started) * 1000:.0f} ms, "
+        f"connect {(ws_connected - server_ready) * 1000:.0f} ms, "
+        f"register {(registered - ws_connected) * 1000:.0f} ms, "
+        f"total {(registered - started) * 1000:.0f} ms"
+    )
+
+
 def _start_flet_server(
     host, port, attached, assets_dir, upload_dir, web_renderer, route_url_strategy
 ):
@@ -324,6 +624,14 @@ def _start_flet_server(
         logging.info(f"Route URL strategy configured: {route_url_strategy}")
         fletd_env["FLET_ROUTE_URL_STRATEGY"] = route_url_strategy
 
+    # fletd writes its port to this file once it accepts connections
+    ready_file = os.path.join(
+        tempfile.gettempdir(), f"fletd-{os.getpid()}-{port}.ready"
+    )
+    if os.path.exists(ready_file):
+        os.remove(ready_file)
+    fletd_env["FLET_READY_FILE"] = ready_file
+
     args = [fletd_path, "--port", str(port)]
 
     creationflags = 0
@@ -350,7 +658,7 @@ def _start_flet_server(
         startupinfo = subprocess.STARTUPINFO()
         startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
 
-    subprocess.Popen(
+    p = subprocess.Popen(
         args,
         env=fletd_env,
         creationflags=creationflags,
@@ -359,11 +667,43 @@ def _start_flet_server(
         stderr=subprocess.DEVNULL if log_level >= logging.WARNING else None,
         startupinfo=startupinfo,
     )
+    _wait_flet_server(p, ready_file, port)
 
     return port
 
 
+def _wait_flet_server(p, ready_file, port):
+    started = time.monotonic()
+    deadline = started + constants.CONNECT_TIMEOUT_SECONDS
+    n = 0
+    while time.monotonic() < deadline:
+        if os.path.exists(ready_file):
+            os.remove(ready_file)
+            logging.debug(
+                f"Flet Server is ready in {(time.monotonic() - started) * 1000:.0f} ms"
+            )
+            return
+        if p.poll() is not None:
+            # e.g. a detached server is already running on that port
+            logging.info(f"Flet Server exited with code {p.returncode}")
+            return
+        n += 1
+        if n % 10 == 0 and _is_port_open(port):
+            # fletd which doesn't support ready file
+            return
+        sleep(0.01)
+
+
+def _is_port_open(port):
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(0.1)
+        return sock.connect_ex(("127.0.0.1", port)) == 0
+
+
 def _open_flet_view(page_url, hidden):
+    import tarfile
+    import zipfile
+
     logging.info(f"Starting Flet View app...")
 
     args = []
@@ -456,6 +796,10 @@ def _get_ws_url(server: str):
 
 
 def _download_fletd():
+    import tarfile
+    import urllib.request
+    import zipfile
+
     ver = version.version
     flet_exe = "fletd.exe" if is_windows() else "fletd"
 
@@ -490,6 +834,8 @@ def _download_fletd():
 
 
 def _download_flet_client(file_name):
+    import urllib.request
+
     ver = version.version
     temp_arch = Path(tempfile.gettempdir()).joinpath(file_name)
     logging.info(f"Downloading Flet v{ver} to {temp_arch}")
@@ -500,6 +846,8 @@ def _download_flet_client(file_name):
 
 # not currently used, but maybe useful in the future
 def _get_latest_flet_release():
+    import urllib.request
+
     releases = json.loads(
         urllib.request.urlopen(
             f"https://api.github.com/repos/flet-dev/flet/releases?per_page=5"
@@ -524,161 +872,8 @@ def _get_free_tcp_port():
 #    signal.signal(signal.SIGINT, signal.SIG_DFL)
 
 
-class Handler(FileSystemEventHandler):
-    def __init__(self, args, script_path, port, web, hidden) -> None:
-        super().__init__()
-        self.args = args
-        self.script_path = script_path
-        self.port = port
-        self.web = web
-        self.hidden = hidden
-        self.last_time = time.time()
-        self.is_running = False
-        self.fvp = None
-        self.page_url_prefix = f"PAGE_URL_{time.time()}"
-        self.page_url = None
-        self.terminate = threading.Event()
-        self.start_process()
-
-    def start_process(self):
-        p_env = {**os.environ}
-        if self.port is not None:
-            p_env["FLET_SERVER_PORT"] = str(self.port)
-        p_env["FLET_DISPLAY_URL_PREFIX"] = self.page_url_prefix
-
-        self.p = subprocess.Popen(self.args, env=p_env, stdout=subprocess.PIPE)
-        self.is_running = True
-        th = threading.Thread(target=self.print_output, args=[self.p], daemon=True)
-        th.start()
-
-    def on_any_event(self, event):
-        if (
-            self.script_path is None or event.src_path == self.script_path
-        ) and not event.is_directory:
-            current_time = time.time()
-            if (current_time - self.last_time) > 0.5 and self.is_running:
-                self.last_time = current_time
-                th = threading.Thread(target=self.restart_program, args=(), daemon=True)
-                th.start()
-
-    def print_output(self, p):
-        while True:
-            line = p.stdout.readline()
-            if not line:
-                break
-            line = line.decode("utf-8").rstrip("\r\n")
-            if line.startswith(self.page_url_prefix):
-                if not self.page_url:
-                    self.page_url = line[len(self.page_url_prefix) + 1 :]
-                    print(self.page_url)
-                    if self.web:
-                        open_in_browser(self.page_url)
-                    else:
-                        th = threading.Thread(
-                            target=self.open_flet_view_and_wait, args=(), daemon=True
-                        )
-                        th.start()
-            else:
-                print(line)
-
-    def open_flet_view_and_wait(self):
-        self.fvp = _open_flet_view(self.page_url, self.hidden)
-        self.fvp.wait()
-        self.p.kill()
-        self.terminate.set()
-
-    def restart_program(self):
-        self.is_running = False
-        self.p.kill()
-        self.p.wait()
-        sleep(0.5)
-        self.start_process()
-
-
 def main():
-    parser = argparse.ArgumentParser(
-        description="Runs Flet app in Python with hot reload."
-    )
-    parser.add_argument("script", type=str, help="path to a Python script")
-    parser.add_argument(
-        "--port",
-        "-p",
-        dest="port",
-        type=int,
-        default=None,
-        help="custom TCP port to run Flet app on",
-    )
-    parser.add_argument(
-        "--directory",
-        "-d",
-        dest="directory",
-        action="store_true",
-        default=False,
-        help="watch script directory",
-    )
-    parser.add_argument(
-        "--recursive",
-        "-r",
-        dest="recursive",
-        action="store_true",
-        default=False,
-        help="watch script directory and all sub-directories recursively",
-    )
-    parser.add_argument(
-        "--hidden",
-        "-n",
-        dest="hidden",
-        action="store_true",
-        default=False,
-        help="application window is hidden on startup",
-    )
-    parser.add_argument(
-        "--web",
-        "-w",
-        dest="web",
-        action="store_true",
-        default=False,
-        help="open app in a web browser",
-    )
-
-    # logging.basicConfig(level=logging.DEBUG)
-
-    args = parser.parse_args()
-
-    script_path = args.script
-    if not os.path.isabs(args.script):
-        script_path = str(Path(os.getcwd()).joinpath(args.script).resolve())
+    # watchdog is imported only when hot reload is used
+    from flet.hot_reload import main
 
-    script_dir = os.path.dirname(script_path)
-
-    port = args.port
-    if args.port is None:
-        port = _get_free_tcp_port()
-
-    my_event_handler = Handler(
-        [sys.executable, "-u", script_path],
-        None if args.directory or args.recursive else script_path,
-        port,
-        args.web,
-        args.hidden,
-    )
-
-    my_observer = Observer()
-    my_observer.schedule(my_event_handler, script_dir, recursive=args.recursive)
-    my_observer.start()
-
-    try:
-        while True:
-            if my_event_handler.terminate.wait(1):
-                break
-    except KeyboardInterrupt:
-        pass
-
-    if my_event_handler.fvp is not None and not is_windows():
-        try:
-            logging.debug(f"Flet View process {my_event_handler.fvp.pid}")
-            os.kill(my_event_handler.fvp.pid + 1, signal.SIGKILL)
-        except:
-            pass
-    my_observer.stop()
-    my_observer.join()
+    main()
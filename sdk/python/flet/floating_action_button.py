@@ -9,6 +9,8 @@ from flet.types import AnimationValue, OffsetValue, RotateValue, ScaleValue
 
 
 class FloatingActionButton(ConstrainedControl):
+    __slots__ = ("__content",)
+
     def __init__(
         self,
         text: Optional[str] = None,
@@ -36,6 +38,7 @@ class FloatingActionButton(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -71,6 +74,7 @@ class FloatingActionButton(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.text = text
@@ -17,6 +17,20 @@ from flet.types import (
 
 
 class FormFieldControl(ConstrainedControl):
+    __slots__ = (
+        "__prefix",
+        "__suffix",
+        "__label_style",
+        "__hint_style",
+        "__helper_style",
+        "__counter_style",
+        "__error_style",
+        "__prefix_style",
+        "__suffix_style",
+        "__border_radius",
+        "__content_padding",
+    )
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
@@ -43,6 +57,7 @@ class FormFieldControl(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # FormField specific
         #
@@ -105,6 +120,7 @@ class FormFieldControl(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.__prefix: Optional[Control] = None
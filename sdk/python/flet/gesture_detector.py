@@ -52,6 +52,36 @@ class MouseCursor(Enum):
 
 
 class GestureDetector(ConstrainedControl):
+    __slots__ = (
+        "__on_tap_down",
+        "__on_tap_up",
+        "__on_secondary_tap_down",
+        "__on_secondary_tap_up",
+        "__on_long_press_start",
+        "__on_long_press_end",
+        "__on_secondary_long_press_start",
+        "__on_secondary_long_press_end",
+        "__on_double_tap_down",
+        "__on_horizontal_drag_start",
+        "__on_horizontal_drag_update",
+        "__on_horizontal_drag_end",
+        "__on_vertical_drag_start",
+        "__on_vertical_drag_update",
+        "__on_vertical_drag_end",
+        "__on_pan_start",
+        "__on_pan_update",
+        "__on_pan_end",
+        "__on_scale_start",
+        "__on_scale_update",
+        "__on_scale_end",
+        "__on_hover",
+        "__on_enter",
+        "__on_exit",
+        "__content",
+    )
+
+    _coalesced_events = ("hover",)
+
     def __init__(
         self,
         content: Optional[Control] = None,
@@ -78,6 +108,7 @@ class GestureDetector(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -138,6 +169,7 @@ class GestureDetector(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.__on_tap_down = EventHandler(lambda e: TapEvent(**json.loads(e.data)))
@@ -9,6 +9,8 @@ from flet.types import AnimationValue, OffsetValue, RotateValue, ScaleValue
 
 
 class Icon(ConstrainedControl):
+    __slots__ = ()
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -30,6 +32,7 @@ class Icon(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -57,6 +60,7 @@ class Icon(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.name = name
@@ -10,6 +10,8 @@ from flet.types import AnimationValue, OffsetValue, RotateValue, ScaleValue
 
 
 class IconButton(ConstrainedControl):
+    __slots__ = ("__style", "__content")
+
     def __init__(
         self,
         icon: Optional[str] = None,
@@ -37,6 +39,7 @@ class IconButton(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -77,6 +80,7 @@ class IconButton(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.icon = icon
@@ -27,6 +27,8 @@ ImageRepeat = Literal[None, "noRepeat", "repeat", "repeatX", "repeatY"]
 
 
 class Image(ConstrainedControl):
+    __slots__ = ("__border_radius",)
+
     def __init__(
         self,
         src: Optional[str] = None,
@@ -54,6 +56,7 @@ class Image(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -93,6 +96,7 @@ class Image(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.src = src
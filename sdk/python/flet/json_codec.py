@@ -0,0 +1,93 @@
+import json
+import logging
+import os
+from typing import Any, Callable, Optional
+
+# JSON backend used by the host protocol: "orjson", "msgspec" or "json".
+# Faster backends are optional. Their output decodes to the same values as
+# the one of the standard library, but it's UTF-8 rather than ASCII with
+# escapes and floats may be formatted differently, e.g. "1e16" for "1e+16".
+_backend = "json"
+_orjson: Any = None
+_msgspec: Any = None
+_msgspec_encoder: Any = None
+_msgspec_decoder: Any = None
+
+
+def get_backend() -> str:
+    return _backend
+
+
+def set_backend(name: Optional[str] = None):
+    """Selects JSON backend. With `None` the fastest installed one is used."""
+    global _backend, _orjson, _msgspec, _msgspec_encoder, _msgspec_decoder
+    if name is None:
+        for name in ["orjson", "msgspec", "json"]:
+            try:
+                set_backend(name)
+                return
+            except ImportError:
+                pass
+    elif name == "orjson":
+        import orjson
+
+        _orjson = orjson
+    elif name == "msgspec":
+        import msgspec
+
+        _msgspec = msgspec
+        _msgspec_encoder = msgspec.json.Encoder()
+        _msgspec_decoder = msgspec.json.Decoder()
+    elif name != "json":
+        raise ValueError(f"Unknown JSON backend: {name}")
+    _backend = name
+    logging.debug(f"JSON backend: {name}")
+
+
+def dumps(obj, default: Callable[[Any], Any]) -> str:
+    """Serializes `obj` into compact JSON.
+
+    `default` converts objects JSON doesn't support, like `default()` method
+    of `json.JSONEncoder`."""
+    if _backend == "orjson":
+        try:
+            return _orjson.dumps(
+                obj, default=default, option=_orjson.OPT_PASSTHROUGH_DATACLASS
+            ).decode()
+        except TypeError:
+            # e.g. non-string dict keys or big integers; the standard
+            # library either handles them or raises a proper error
+            pass
+    elif _backend == "msgspec":
+        try:
+            return _msgspec_encoder.encode(_to_builtins(obj, default)).decode()
+        except (TypeError, ValueError, _msgspec.EncodeError):
+            pass
+    return json.dumps(obj, default=default, separators=(",", ":"))
+
+
+def loads(s):
+    if _backend == "orjson":
+        return _orjson.loads(s)
+    elif _backend == "msgspec":
+        return _msgspec_decoder.decode(s)
+    return json.loads(s)
+
+
+def _to_builtins(obj, default):
+    # msgspec serializes dataclasses on its own, so they are converted
+    # with `default` in advance
+    t = obj.__class__
+    if obj is None or t is str or t is int or t is float or t is bool:
+        return obj
+    elif t is list or t is tuple:
+        return [_to_builtins(v, default) for v in obj]
+    elif t is dict:
+        return {k: _to_builtins(v, default) for k, v in obj.items()}
+    elif isinstance(obj, (str, int, float)):
+        # str-based enums and alike
+        return obj
+    return _to_builtins(default(obj), default)
+
+
+set_backend(os.getenv("FLET_JSON_BACKEND"))
@@ -15,6 +15,14 @@ from flet.types import (
 
 
 class ListTile(ConstrainedControl):
+    __slots__ = (
+        "__content_padding",
+        "__leading",
+        "__title",
+        "__subtitle",
+        "__trailing",
+    )
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
@@ -41,6 +49,7 @@ class ListTile(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -82,6 +91,7 @@ class ListTile(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.content_padding = content_padding
@@ -1,4 +1,4 @@
-from typing import Any, List, Optional, Union
+from typing import Any, Callable, List, Optional, Union
 
 from beartype import beartype
 
@@ -12,9 +12,12 @@ from flet.types import (
     RotateValue,
     ScaleValue,
 )
+from flet.virtual_items import DEFAULT_CACHE_SIZE, VirtualItems
 
 
 class ListView(ConstrainedControl):
+    __slots__ = ("__controls", "__padding", "__virtual_items")
+
     def __init__(
         self,
         controls: Optional[List[Control]] = None,
@@ -41,6 +44,7 @@ class ListView(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -51,6 +55,9 @@ class ListView(ConstrainedControl):
         divider_thickness: OptionalNumber = None,
         padding: PaddingValue = None,
         auto_scroll: Optional[bool] = None,
+        item_count: Optional[int] = None,
+        item_builder: Optional[Callable[[int], Control]] = None,
+        item_cache_size: Optional[int] = None,
     ):
         ConstrainedControl.__init__(
             self,
@@ -77,9 +84,11 @@ class ListView(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.__controls: List[Control] = []
+        self.__virtual_items = VirtualItems(self)
         self.controls = controls
         self.horizontal = horizontal
         self.spacing = spacing
@@ -88,6 +97,9 @@ class ListView(ConstrainedControl):
         self.first_item_prototype = first_item_prototype
         self.padding = padding
         self.auto_scroll = auto_scroll
+        self.item_count = item_count
+        self.item_builder = item_builder
+        self.item_cache_size = item_cache_size
 
     def _get_control_name(self):
         return "listview"
@@ -95,9 +107,10 @@ class ListView(ConstrainedControl):
     def _before_build_command(self):
         super()._before_build_command()
         self._set_attr_json("padding", self.__padding)
+        self.__virtual_items.before_build_command()
 
     def _get_children(self):
-        return self.__controls
+        return self.__virtual_items.get_children(self.__controls)
 
     def clean(self):
         Control.clean(self)
@@ -181,3 +194,36 @@ class ListView(ConstrainedControl):
     @beartype
     def auto_scroll(self, value: Optional[bool]):
         self._set_attr("autoScroll", value)
+
+    # item_count
+    @property
+    def item_count(self) -> Optional[int]:
+        return self._get_attr("itemCount")
+
+    @item_count.setter
+    @beartype
+    def item_count(self, value: Optional[int]):
+        self._set_attr("itemCount", value)
+        self.__virtual_items.item_count = value or 0
+
+    # item_builder
+    @property
+    def item_builder(self) -> Optional[Callable[[int], Control]]:
+        return self.__virtual_items.item_builder
+
+    @item_builder.setter
+    def item_builder(self, value: Optional[Callable[[int], Control]]):
+        self.__virtual_items.item_builder = value
+        self.__virtual_items.reset()
+
+    # item_cache_size
+    @property
+    def item_cache_size(self) -> Optional[int]:
+        return self.__virtual_items.cache_size
+
+    @item_cache_size.setter
+    @beartype
+    def item_cache_size(self, value: Optional[int]):
+        self.__virtual_items.cache_size = (
+            value if value is not None else DEFAULT_CACHE_SIZE
+        )
@@ -18,6 +18,8 @@ MarkdownExtensionSet = Literal[
 
 
 class Markdown(ConstrainedControl):
+    __slots__ = ()
+
     def __init__(
         self,
         value: Optional[str] = None,
@@ -45,6 +47,7 @@ class Markdown(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -78,6 +81,7 @@ class Markdown(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.value = value
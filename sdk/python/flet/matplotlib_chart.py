@@ -21,6 +21,17 @@ except ImportError:
 
 
 class MatplotlibChart(Container):
+    __slots__ = (
+        "__figure",
+        "__figure_stale_callback",
+        "__fingerprint",
+        "__img",
+        "__rendering",
+        "__original_size",
+        "__isolated",
+        "__maintain_aspect_ratio",
+    )
+
     def __init__(
         self,
         figure: Optional[Figure] = None,
@@ -42,6 +53,7 @@ class MatplotlibChart(Container):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -69,8 +81,11 @@ class MatplotlibChart(Container):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
+        self.__figure = None
+        self.__rendering = False
         self.figure = figure
         self.isolated = isolated
         self.original_size = original_size
@@ -86,9 +101,22 @@ class MatplotlibChart(Container):
     def _before_build_command(self):
         super()._before_build_command()
         if self.__figure is not None:
+            fingerprint = self.__get_fingerprint()
+            if fingerprint == self.__fingerprint and not self.__figure.stale:
+                # nothing changed since the last render, so neither
+                # the image is rendered nor its "src" is sent again
+                return
+
             s = io.StringIO()
-            self.__figure.savefig(s, format="svg")
+            self.__rendering = True
+            try:
+                self.__figure.savefig(s, format="svg")
+            finally:
+                self.__rendering = False
             svg = s.getvalue()
+            # changing any artist makes the figure stale again
+            self.__figure.stale = False
+            self.__fingerprint = fingerprint
 
             if not self.__original_size:
                 root = ET.fromstring(svg)
@@ -97,6 +125,19 @@ class MatplotlibChart(Container):
                 self.__img.aspect_ratio = w / h
             self.__img.src = svg
 
+    def invalidate(self):
+        """Renders the figure on the next update.
+
+        Changes made through artist methods are picked up automatically,
+        also by `page.update()`; call this method after changing figure data
+        in place, e.g. NumPy arrays passed to `plot()`."""
+        self.__fingerprint = None
+        self._mark_dirty()
+
+    def __get_fingerprint(self):
+        f = self.__figure
+        return (id(f), tuple(f.get_size_inches()), f.dpi, self.__original_size)
+
     # original_size
     @property
     def original_size(self):
@@ -122,7 +163,20 @@ class MatplotlibChart(Container):
 
     @figure.setter
     def figure(self, value):
+        if self.__figure is not None:
+            self.__figure.stale_callback = self.__figure_stale_callback
         self.__figure = value
+        self.__fingerprint = None
+        if value is not None:
+            # changing any artist makes the figure stale
+            self.__figure_stale_callback = value.stale_callback
+            value.stale_callback = self.__on_figure_stale
+
+    def __on_figure_stale(self, figure, stale):
+        if self.__figure_stale_callback is not None:
+            self.__figure_stale_callback(figure, stale)
+        if not self.__rendering:
+            self._mark_dirty()
 
     # maintain_aspect_ratio
     @property
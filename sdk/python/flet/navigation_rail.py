@@ -23,6 +23,13 @@ NavigationRailLabelType = Literal[None, "none", "all", "selected"]
 
 
 class NavigationRailDestination(Control):
+    __slots__ = (
+        "__icon_content",
+        "__selected_icon_content",
+        "__label_content",
+        "__padding",
+    )
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
@@ -33,8 +40,9 @@ class NavigationRailDestination(Control):
         label: Optional[str] = None,
         label_content: Optional[Control] = None,
         padding: PaddingValue = None,
+        key: Any = None,
     ):
-        Control.__init__(self, ref=ref)
+        Control.__init__(self, ref=ref, key=key)
         self.label = label
         self.icon = icon
         self.__icon_content: Optional[Control] = None
@@ -137,6 +145,8 @@ class NavigationRailDestination(Control):
 
 
 class NavigationRail(ConstrainedControl):
+    __slots__ = ("__leading", "__trailing", "__destinations")
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
@@ -162,6 +172,7 @@ class NavigationRail(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # NavigationRail-specific
         destinations: Optional[List[NavigationRailDestination]] = None,
@@ -202,6 +213,7 @@ class NavigationRail(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.destinations = destinations
@@ -1,10 +1,14 @@
+import asyncio
 import json
 import logging
 import threading
 import time
 import uuid
+from concurrent.futures import Future
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import urlparse
 
 from beartype import beartype
@@ -12,7 +16,6 @@ from beartype.typing import Dict, List, Optional
 
 from flet import constants
 from flet.app_bar import AppBar
-from flet.auth.authorization import Authorization
 from flet.auth.oauth_provider import OAuthProvider
 from flet.banner import Banner
 from flet.client_storage import ClientStorage
@@ -24,6 +27,7 @@ from flet.control import (
     MainAxisAlignment,
     OptionalNumber,
     ScrollMode,
+    _batch_unattached_controls,
 )
 from flet.control_event import ControlEvent
 from flet.event import Event
@@ -38,6 +42,10 @@ from flet.theme import Theme
 from flet.types import PaddingValue
 from flet.view import View
 
+if TYPE_CHECKING:
+    # requests and oauthlib are imported on the first login
+    from flet.auth.authorization import Authorization
+
 try:
     from typing import Literal
 except ImportError:
@@ -47,10 +55,69 @@ except ImportError:
 PageDesign = Literal[None, "material", "cupertino", "fluent", "macos", "adaptive"]
 ThemeMode = Literal[None, "system", "light", "dark"]
 
+# page properties the host client gets from the client at session start
+_PAGE_DETAILS = (
+    "route",
+    "pwa",
+    "web",
+    "platform",
+    "width",
+    "height",
+    "windowWidth",
+    "windowHeight",
+    "windowTop",
+    "windowLeft",
+)
+
 
 class Page(Control):
-    def __init__(self, conn: Connection, session_id):
-        Control.__init__(self)
+    __slots__ = (
+        "__conn",
+        "__query",
+        "_session_id",
+        "_index",
+        "_last_event",
+        "_event_available",
+        "__views",
+        "__default_view",
+        "_controls",
+        "__fonts",
+        "__offstage",
+        "__theme",
+        "__dark_theme",
+        "__pubsub",
+        "__client_storage",
+        "__session_storage",
+        "__authorization",
+        "__on_close",
+        "__on_resize",
+        "__last_route",
+        "__on_login",
+        "__on_logout",
+        "__on_route_change",
+        "__on_view_pop",
+        "__on_keyboard_event",
+        "__method_calls",
+        "__method_call_results",
+        "__on_window_event",
+        "__on_connect",
+        "__on_disconnect",
+        "__on_error",
+        "__batch",
+        "__auto_batch",
+        "__async_lock",
+    )
+
+    _coalesced_events = ("resize",)
+
+    def __init__(
+        self,
+        conn: Connection,
+        session_id,
+        page_details: Optional[Dict[str, str]] = None,
+        key: Any = None,
+    ):
+        Control.__init__(self, key=key)
 
         self._id = "page"
         self._Control__uid = "page"
@@ -60,7 +127,15 @@ class Page(Control):
         self._index = {self._Control__uid: self}  # index with all page controls
         self._last_event = None
         self._event_available = threading.Event()
-        self._fetch_page_details()
+        self.__batch: ContextVar[Optional[List[Control]]] = ContextVar(
+            "flet_page_batch", default=None
+        )
+        self.__auto_batch = False
+        self.__async_lock = None
+        if page_details is not None:
+            self._set_page_details(page_details)
+        else:
+            self._fetch_page_details()
 
         self.__views = [View()]
         self.__default_view = self.__views[0]
@@ -159,33 +234,13 @@ class Page(Control):
         assert self.__conn.page_name is not None
         values = self.__conn.send_commands(
             self._session_id,
-            [
-                Command(0, "get", ["page", "route"]),
-                Command(
-                    0,
-                    "get",
-                    ["page", "pwa"],
-                ),
-                Command(0, "get", ["page", "web"]),
-                Command(0, "get", ["page", "platform"]),
-                Command(0, "get", ["page", "width"]),
-                Command(0, "get", ["page", "height"]),
-                Command(0, "get", ["page", "windowWidth"]),
-                Command(0, "get", ["page", "windowHeight"]),
-                Command(0, "get", ["page", "windowTop"]),
-                Command(0, "get", ["page", "windowLeft"]),
-            ],
+            [Command(0, "get", ["page", name]) for name in _PAGE_DETAILS],
         ).results
-        self._set_attr("route", values[0], False)
-        self._set_attr("pwa", values[1], False)
-        self._set_attr("web", values[2], False)
-        self._set_attr("platform", values[3], False)
-        self._set_attr("width", values[4], False)
-        self._set_attr("height", values[5], False)
-        self._set_attr("windowWidth", values[6], False)
-        self._set_attr("windowHeight", values[7], False)
-        self._set_attr("windowTop", values[8], False)
-        self._set_attr("windowLeft", values[9], False)
+        self._set_page_details(dict(zip(_PAGE_DETAILS, values)))
+
+    def _set_page_details(self, details: Dict[str, str]):
+        for name in _PAGE_DETAILS:
+            self._set_attr(name, details.get(name, ""), False)
 
     def update(self, *controls):
         with self._lock:
@@ -194,7 +249,113 @@ class Page(Control):
             else:
                 return self.__update(*controls)
 
+    async def update_async(self, *controls):
+        if len(controls) == 0:
+            controls = (self,)
+        async with self.__get_async_lock():
+            async with self._lock_async():
+                if self.__defer_update(controls):
+                    return
+                commands, added_controls = self.__prepare_update(*controls)
+            if len(commands) == 0:
+                return
+            results = (
+                await self.__conn.send_commands_async(self._session_id, commands)
+            ).results
+            async with self._lock_async():
+                self.__update_added_controls(added_controls, results)
+
+    def __get_async_lock(self):
+        # created on first use, so it's bound to the running event loop
+        if self.__async_lock is None:
+            self.__async_lock = asyncio.Lock()
+        return self.__async_lock
+
+    @asynccontextmanager
+    async def _lock_async(self):
+        # The event loop must not block on the page lock: a sync handler
+        # running in a worker thread holds it while waiting for the loop
+        # to send its commands.
+        lock = self._lock
+        if not lock.acquire(blocking=False):
+            acquired = asyncio.get_running_loop().run_in_executor(None, lock.acquire)
+            try:
+                await asyncio.shield(acquired)
+            except asyncio.CancelledError:
+                acquired.add_done_callback(lambda _: lock.release())
+                raise
+        try:
+            yield
+        finally:
+            lock.release()
+
+    @contextmanager
+    def batch(self):
+        """Defers updates made in the current thread or task until the end of
+        the block and sends them to the client in a single batch.
+
+        Controls can be updated before they are added to the page in the
+        same batch."""
+        if self.__batch.get() is not None:
+            # nested batch
+            yield
+            return
+        token = self.__batch.set([])
+        unattached_token = _batch_unattached_controls.set([])
+        try:
+            yield
+        finally:
+            controls = self.__batch.get()
+            unattached = _batch_unattached_controls.get()
+            self.__batch.reset(token)
+            _batch_unattached_controls.reset(unattached_token)
+            if len(controls) > 0:
+                self.update(*controls)
+        for control in unattached:
+            control._check_attached()
+
+    @asynccontextmanager
+    async def batch_async(self):
+        if self.__batch.get() is not None:
+            # nested batch
+            yield
+            return
+        token = self.__batch.set([])
+        unattached_token = _batch_unattached_controls.set([])
+        try:
+            yield
+        finally:
+            controls = self.__batch.get()
+            unattached = _batch_unattached_controls.get()
+            self.__batch.reset(token)
+            _batch_unattached_controls.reset(unattached_token)
+            if len(controls) > 0:
+                await self.update_async(*controls)
+        for control in unattached:
+            control._check_attached()
+
+    def __defer_update(self, controls):
+        pending = self.__batch.get()
+        if pending is None:
+            return False
+        for control in controls:
+            if not any(control is c for c in pending):
+                pending.append(control)
+        return True
+
     def __update(self, *controls):
+        if self.__defer_update(controls):
+            return
+
+        commands, added_controls = self.__prepare_update(*controls)
+        if len(commands) == 0:
+            return
+
+        # execute commands
+        results = self.__conn.send_commands(self._session_id, commands).results
+        self.__update_added_controls(added_controls, results)
+
+    def __prepare_update(self, *controls):
         added_controls = []
         commands = []
 
@@ -202,89 +363,166 @@ class Page(Control):
         for control in controls:
             control.build_update_commands(self._index, added_controls, commands)
 
-        if len(commands) == 0:
-            return
+        if len(controls) > 1:
+            commands = _merge_set_commands(commands)
 
-        # execute commands
-        results = self.__conn.send_commands(self._session_id, commands).results
+        return commands, added_controls
 
-        if len(results) > 0:
-            n = 0
-            for line in results:
-                for id in line.split(" "):
-                    added_controls[n]._Control__uid = id
-                    added_controls[n].page = self
+    def __update_added_controls(self, added_controls, results):
+        ids = (id for line in results for id in line.split(" "))
+        for ctrl in added_controls:
+            # controls which took place of controls with the same key
+            # are already in the index
+            if self._index.get(ctrl._Control__uid) is not ctrl:
+                id = next(ids, None)
+                if id is None:
+                    break
+                ctrl._Control__uid = id
 
-                    # add to index
-                    self._index[id] = added_controls[n]
+                # add to index
+                self._index[id] = ctrl
 
-                    # call Control.did_mount
-                    added_controls[n].did_mount()
+            ctrl.page = self
 
-                    n += 1
+            # call Control.did_mount
+            ctrl.did_mount()
 
     def add(self, *controls):
         with self._lock:
             self._controls.extend(controls)
+            self.__default_view._mark_dirty()
             return self.__update(self)
 
+    async def add_async(self, *controls):
+        async with self._lock_async():
+            self._controls.extend(controls)
+            self.__default_view._mark_dirty()
+        await self.update_async()
+
     def insert(self, at, *controls):
         with self._lock:
             n = at
             for control in controls:
                 self._controls.insert(n, control)
                 n += 1
+            self.__default_view._mark_dirty()
             return self.__update(self)
 
     def remove(self, *controls):
         with self._lock:
             for control in controls:
                 self._controls.remove(control)
+            self.__default_view._mark_dirty()
             return self.__update(self)
 
     def remove_at(self, index):
         with self._lock:
             self._controls.pop(index)
+            self.__default_view._mark_dirty()
             return self.__update(self)
 
     def clean(self):
         with self._lock:
-            self._previous_children.clear()
-            for child in self._get_children():
-                self._remove_control_recursively(self._index, child)
-            self._controls.clear()
+            self.__clean_controls()
             assert self.uid is not None
             return self._send_command("clean", [self.uid])
 
+    async def clean_async(self):
+        async with self._lock_async():
+            self.__clean_controls()
+        assert self.uid is not None
+        return await self._send_command_async("clean", [self.uid])
+
+    def __clean_controls(self):
+        self._previous_children.clear()
+        for child in self._get_children():
+            self._remove_control_recursively(self._index, child)
+        self._controls.clear()
+
     def error(self, message=""):
         with self._lock:
             self._send_command("error", [message])
 
+    async def error_async(self, message=""):
+        await self._send_command_async("error", [message])
+
     def on_event(self, e: Event):
         logging.info(f"page.on_event: {e.target} {e.name} {e.data}")
 
         with self._lock:
-            if e.target == "page" and e.name == "change":
-                for props in json.loads(e.data):
-                    id = props["i"]
-                    if id in self._index:
-                        for name in props:
-                            if name != "i":
-                                self._index[id]._set_attr(
-                                    name, props[name], dirty=False
-                                )
-
-            elif e.target in self._index:
-                self._last_event = ControlEvent(
-                    e.target, e.name, e.data, self._index[e.target], self
+            handler, evt = self.__process_event(e)
+        if handler:
+            self.__run_event_handler(handler, evt)
+
+    async def on_event_async(self, e: Event):
+        logging.info(f"page.on_event_async: {e.target} {e.name} {e.data}")
+
+        async with self._lock_async():
+            handler, evt = self.__process_event(e)
+        if handler:
+            if isinstance(getattr(handler, "__self__", None), EventHandler):
+                handler = handler.__self__.handler_async
+            if asyncio.iscoroutinefunction(handler):
+                if self.__auto_batch:
+                    async with self.batch_async():
+                        await handler(evt)
+                else:
+                    await handler(evt)
+            else:
+                await asyncio.get_running_loop().run_in_executor(
+                    self.__conn.executor, self.__run_event_handler, handler, evt
                 )
-                handler = self._index[e.target].event_handlers.get(e.name)
-                if handler:
-                    t = threading.Thread(
-                        target=handler, args=(self._last_event,), daemon=True
-                    )
-                    t.start()
-                self._event_available.set()
+
+    def _get_control_event_mailbox(self, target, event_name):
+        ctrl = self._index.get(target)
+        return ctrl._get_event_mailbox(event_name) if ctrl is not None else None
+
+    def __process_event(self, e: Event):
+        if e.target == "page" and e.name == "change":
+            for props in json.loads(e.data):
+                id = props["i"]
+                if id in self._index:
+                    for name in props:
+                        if name != "i":
+                            self._index[id]._set_attr(name, props[name], dirty=False)
+
+        elif e.target in self._index:
+            self._last_event = ControlEvent(
+                e.target, e.name, e.data, self._index[e.target], self
+            )
+            handler = self._index[e.target].event_handlers.get(e.name)
+            self._event_available.set()
+            return handler, self._last_event
+        return None, None
+
+    def __run_event_handler(self, handler, e):
+        if asyncio.iscoroutinefunction(handler):
+            # coroutine handler of a sync app
+            asyncio.run(handler(e))
+        elif self.__auto_batch:
+            with self.batch():
+                handler(e)
+        else:
+            handler(e)
+
+    def run_thread(self, handler, *args) -> threading.Thread:
+        """Runs `handler(*args)` in a new thread.
+
+        Event handlers of a session run one at a time in arrival order, so a
+        handler which loops until another event arrives, e.g. a "Stop" button
+        click, blocks that event and takes a worker from all sessions.
+        Start such loops with this method and return from the handler."""
+        th = threading.Thread(target=handler, args=args, daemon=True)
+        th.start()
+        return th
+
+    def run_task(self, handler, *args) -> Future:
+        """Runs coroutine `handler(*args)` as a task on the event loop of
+        an async app, outside of the session's event queue."""
+        loop = getattr(self.__conn, "_loop", None)
+        if loop is None:
+            raise Exception("run_task() requires an async app, use run_thread().")
+        return asyncio.run_coroutine_threadsafe(handler(*args), loop)
 
     def wait_event(self) -> ControlEvent:
         self._event_available.clear()
@@ -327,6 +565,8 @@ class Page(Control):
         complete_page_html: Optional[str] = None,
         redirect_to_page=False,
     ):
+        from flet.auth.authorization import Authorization
+
         self.__authorization = Authorization(
             provider,
             fetch_user=fetch_user,
@@ -405,6 +645,22 @@ class Page(Control):
             Command(indent=0, name=name, values=values if values is not None else [], attrs=attrs or {}),
         )
 
+    async def _send_command_async(
+        self,
+        name: str,
+        values: Optional[List[str]] = None,
+        attrs: Optional[Dict[str, str]] = None,
+    ):
+        return await self.__conn.send_command_async(
+            self._session_id,
+            Command(
+                indent=0,
+                name=name,
+                values=values if values is not None else [],
+                attrs=attrs or {},
+            ),
+        )
+
     @beartype
     def set_clipboard(self, value: str):
         self.__offstage.clipboard.set_data(value)
@@ -537,6 +793,16 @@ class Page(Control):
     def session_id(self):
         return self._session_id
 
+    # auto_batch
+    @property
+    def auto_batch(self) -> bool:
+        return self.__auto_batch
+
+    @auto_batch.setter
+    @beartype
+    def auto_batch(self, value: bool):
+        self.__auto_batch = value
+
     # auth
     @property
     def auth(self):
@@ -1189,12 +1455,37 @@ class Page(Control):
         self.__on_error.subscribe(handler)
 
 
+def _merge_set_commands(commands):
+    # combine "set" commands for the same control into the first one
+    result = []
+    set_commands = {}
+    for cmd in commands:
+        if cmd.name == "set" and len(cmd.values) == 1:
+            first = set_commands.get(cmd.values[0])
+            if first is not None:
+                first.attrs.update(cmd.attrs)
+                continue
+            set_commands[cmd.values[0]] = cmd
+        result.append(cmd)
+    return result
+
+
 class Offstage(Control):
+    __slots__ = (
+        "__controls",
+        "__clipboard",
+        "__banner",
+        "__snack_bar",
+        "__dialog",
+        "__splash",
+    )
+
     def __init__(
         self,
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
     ):
 
         Control.__init__(
@@ -1202,6 +1493,7 @@ class Offstage(Control):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.__controls: List[Control] = []
@@ -1,6 +1,11 @@
-import io
+import contextlib
+import functools
+import logging
+import multiprocessing
 import re
+import threading
 import xml.etree.ElementTree as ET
+from concurrent.futures import Executor, ProcessPoolExecutor
 from typing import Any, Optional, Union
 
 from beartype import beartype
@@ -9,6 +14,7 @@ from flet import alignment
 from flet.container import Container
 from flet.control import OptionalNumber
 from flet.image import Image
+from flet.progress_ring import ProgressRing
 from flet.ref import Ref
 from flet.types import AnimationValue, OffsetValue, RotateValue, ScaleValue
 
@@ -17,8 +23,59 @@ try:
 except ImportError:
     raise Exception('Install "plotly" Python package to use PlotlyChart control.')
 
+# renderer processes are started with the first chart and kept running,
+# so kaleido starts once per process and charts render in parallel
+_render_pool: Optional[Executor] = None
+_render_pool_lock = threading.Lock()
+
+
+# plain figures report their changes by calling these methods, which keep
+# FigureWidget in sync with its view and do nothing otherwise
+_FIGURE_CHANGE_METHODS = (
+    "_send_addTraces_msg",
+    "_send_animate_msg",
+    "_send_deleteTraces_msg",
+    "_send_moveTraces_msg",
+    "_send_relayout_msg",
+    "_send_restyle_msg",
+    "_send_update_msg",
+)
+
+
+def _get_render_pool() -> Executor:
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            # processes forked from the app would inherit locks held by its
+            # threads; new processes run the app script again, which doesn't
+            # start the app then
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context("forkserver")
+            else:
+                context = multiprocessing.get_context("spawn")
+            _render_pool = ProcessPoolExecutor(mp_context=context)
+        return _render_pool
+
+
+def _render_svg(figure_json: str) -> str:
+    import plotly.io as pio
+
+    return pio.from_json(figure_json).to_image(format="svg").decode("utf-8")
+
 
 class PlotlyChart(Container):
+    __slots__ = (
+        "__figure",
+        "__figure_json",
+        "__figure_methods",
+        "__img",
+        "__rendered",
+        "__rendering",
+        "__original_size",
+        "__isolated",
+        "__maintain_aspect_ratio",
+    )
+
     def __init__(
         self,
         figure: Optional[Figure] = None,
@@ -40,6 +97,7 @@ class PlotlyChart(Container):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -67,8 +125,10 @@ class PlotlyChart(Container):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
+        self.__figure = None
         self.figure = figure
         self.isolated = isolated
         self.original_size = original_size
@@ -79,19 +139,53 @@ class PlotlyChart(Container):
     def _build(self):
         self.alignment = alignment.center
         self.__img = Image(fit="fill")
-        self.content = self.__img
+        self.__rendered = None
+        self.__rendering = None
+        self.content = ProgressRing()
 
     def _before_build_command(self):
         super()._before_build_command()
         if self.__figure is not None:
-            svg = self.__figure.to_image(format="svg").decode("utf-8")
-
+            if self.__figure_json is None:
+                self.__figure_json = self.__figure.to_json()
+            figure_json = self.__figure_json
+            if figure_json == self.__rendered:
+                # drops the render of a newer figure which was reverted
+                self.__rendering = None
+                return
+            elif figure_json == self.__rendering:
+                return
+
+            # the previous image (or a progress ring) stays until the new
+            # one is rendered, so the page update doesn't wait for it
+            self.__rendering = figure_json
+            fut = _get_render_pool().submit(_render_svg, figure_json)
+            fut.add_done_callback(lambda f: self.__on_rendered(figure_json, f))
+
+    def __on_rendered(self, figure_json, fut):
+        # called in a thread of the render pool while the page may be updated
+        page = self.page
+        with page._lock if page is not None else contextlib.nullcontext():
+            if figure_json != self.__rendering:
+                # the figure was changed while it was rendered
+                return
+            self.__rendering = None
+            try:
+                svg = fut.result()
+            except Exception:
+                logging.exception("Error rendering Plotly chart")
+                return
+
+            self.__rendered = figure_json
             if not self.__original_size:
                 root = ET.fromstring(svg)
                 w = float(re.findall(r"\d+", root.attrib["width"])[0])
                 h = float(re.findall(r"\d+", root.attrib["height"])[0])
                 self.__img.aspect_ratio = w / h
             self.__img.src = svg
+            self.content = self.__img
+        if page is not None:
+            self.update()
 
     # original_size
     @property
@@ -118,7 +212,22 @@ class PlotlyChart(Container):
 
     @figure.setter
     def figure(self, value):
+        if self.__figure is not None:
+            for name, method in self.__figure_methods.items():
+                setattr(self.__figure, name, method)
         self.__figure = value
+        self.__figure_json = None
+        if value is not None:
+            self.__figure_methods = {
+                name: getattr(value, name) for name in _FIGURE_CHANGE_METHODS
+            }
+            for name, method in self.__figure_methods.items():
+                setattr(value, name, functools.partial(self.__on_figure_change, method))
+
+    def __on_figure_change(self, method, *args, **kwargs):
+        self.__figure_json = None
+        self._mark_dirty()
+        return method(*args, **kwargs)
 
     # maintain_aspect_ratio
     @property
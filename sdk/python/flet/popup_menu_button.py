@@ -10,6 +10,8 @@ from flet.types import AnimationValue, OffsetValue, RotateValue, ScaleValue
 
 
 class PopupMenuItem(Control):
+    __slots__ = ("__content",)
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
@@ -19,8 +21,9 @@ class PopupMenuItem(Control):
         content: Optional[Control] = None,
         on_click=None,
         data: Any = None,
+        key: Any = None,
     ):
-        Control.__init__(self, ref=ref)
+        Control.__init__(self, ref=ref, key=key)
 
         self.checked = checked
         self.icon = icon
@@ -88,6 +91,8 @@ class PopupMenuItem(Control):
 
 
 class PopupMenuButton(ConstrainedControl):
+    __slots__ = ("__content", "__items")
+
     def __init__(
         self,
         content: Optional[Control] = None,
@@ -115,6 +120,7 @@ class PopupMenuButton(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # PopupMenuButton-specific
         items: Optional[List[PopupMenuItem]] = None,
@@ -148,6 +154,7 @@ class PopupMenuButton(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.items = items
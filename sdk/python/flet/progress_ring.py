@@ -9,6 +9,8 @@ from flet.types import AnimationValue, OffsetValue, RotateValue, ScaleValue
 
 
 class ProgressRing(ConstrainedControl):
+    __slots__ = ()
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
@@ -35,6 +37,7 @@ class ProgressRing(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -69,6 +72,7 @@ class ProgressRing(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
         self.value = value
         self.stroke_width = stroke_width
@@ -4,27 +4,116 @@ from typing import Any, List, Optional
 
 from beartype.typing import Dict
 
+from flet import json_codec
+
+
+def _encode_default(obj):
+    if isinstance(obj, Message):
+        return obj.__dict__
+    elif isinstance(obj, Command):
+        d = {}
+        if obj.indent > 0:
+            d["i"] = obj.indent
+        if obj.name is not None:
+            d["n"] = obj.name
+        if obj.values and len(obj.values) > 0:
+            d["v"] = obj.values
+        if obj.attrs and len(obj.attrs) > 0:
+            d["a"] = obj.attrs
+        if obj.commands and len(obj.commands) > 0:
+            d["c"] = obj.commands
+        return d
+    return obj.__dict__
+
 
 class CommandEncoder(json.JSONEncoder):
     def default(self, obj):
-        if isinstance(obj, Message):
-            return obj.__dict__
-        elif isinstance(obj, Command):
-            d = {}
-            if obj.indent > 0:
-                d["i"] = obj.indent
-            if obj.name is not None:
-                d["n"] = obj.name
-            if obj.values and len(obj.values) > 0:
-                d["v"] = obj.values
-            if obj.attrs and len(obj.attrs) > 0:
-                d["a"] = obj.attrs
-            if obj.commands and len(obj.commands) > 0:
-                d["c"] = obj.commands
-            return d
-        elif isinstance(obj, object):
-            return obj.__dict__
-        return json.JSONEncoder.default(self, obj)
+        return _encode_default(obj)
+
+
+class AttrNameTable:
+    """Attribute names declared to the server once per connection and then
+    referred to by their indexes."""
+
+    # shorter names are not worth replacing with an index
+    MIN_NAME_LENGTH = 4
+
+    def __init__(self):
+        self.__ids: Dict[str, str] = {}
+
+    def encode_payload(self, payload):
+        """Returns page command(s) request payload with attribute names
+        replaced by indexes, and the new names listed in "attrNames"."""
+        names = []
+        if isinstance(payload, PageCommandRequestPayload):
+            d = {
+                "pageName": payload.pageName,
+                "sessionID": payload.sessionID,
+                "command": self.__encode_command(payload.command, names),
+            }
+        else:
+            d = {
+                "pageName": payload.pageName,
+                "sessionID": payload.sessionID,
+                "commands": [
+                    self.__encode_command(cmd, names) for cmd in payload.commands
+                ],
+            }
+        if names:
+            d["attrNames"] = names
+        return d
+
+    def __encode_command(self, cmd: "Command", names: List[str]):
+        d = _encode_default(cmd)
+        if "a" in d:
+            ids = self.__ids
+            attrs = {}
+            for name, value in cmd.attrs.items():
+                id = ids.get(name)
+                if id is None:
+                    if len(name) < self.MIN_NAME_LENGTH:
+                        attrs[name] = value
+                        continue
+                    id = ids[name] = str(len(ids))
+                    names.append(name)
+                attrs[id] = value
+            d["a"] = attrs
+        if "c" in d:
+            d["c"] = [self.__encode_command(c, names) for c in cmd.commands]
+        return d
+
+
+MSGPACK_FRAMING = "msgpack"
+
+_msgpack: Any = None
+
+
+def _get_msgpack():
+    global _msgpack
+    if _msgpack is None:
+        try:
+            import msgpack
+        except ImportError:
+            raise Exception(
+                'Install "msgpack" Python package to use MessagePack framing.'
+            )
+        _msgpack = msgpack
+    return _msgpack
+
+
+def encode_message(msg) -> str:
+    return json_codec.dumps(msg, _encode_default)
+
+
+def encode_message_msgpack(msg) -> bytes:
+    return _get_msgpack().packb(msg, default=_encode_default)
+
+
+def decode_message(data) -> "Message":
+    if isinstance(data, bytes):
+        # binary frames are MessagePack
+        return Message(**_get_msgpack().unpackb(data))
+    return Message(**json_codec.loads(data))
 
 
 class Actions:
@@ -94,6 +183,9 @@ class RegisterHostClientRequestPayload:
     update: bool
     authToken: Optional[str]
     permissions: Optional[str]
+    framing: Optional[str] = None
+    attrTable: bool = False
+    blobs: bool = False
 
 
 @dataclass
@@ -102,9 +194,14 @@ class RegisterHostClientResponsePayload:
     pageName: str
     sessionID: str
     error: str
+    framing: Optional[str] = None
+    attrTable: bool = False
+    blobs: bool = False
 
 
 @dataclass
 class PageSessionCreatedPayload:
     pageName: str
     sessionID: str
+    # older servers don't send page details
+    pageDetails: Optional[Dict[str, str]] = None
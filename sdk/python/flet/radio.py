@@ -19,6 +19,8 @@ LabelPosition = Literal[None, "right", "left"]
 
 
 class Radio(ConstrainedControl):
+    __slots__ = ("__fill_color",)
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
@@ -45,6 +47,7 @@ class Radio(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -82,6 +85,7 @@ class Radio(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
         self.value = value
         self.label = label
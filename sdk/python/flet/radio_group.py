@@ -7,6 +7,8 @@ from flet.ref import Ref
 
 
 class RadioGroup(Control):
+    __slots__ = ("__content",)
+
     def __init__(
         self,
         content: Optional[Control] = None,
@@ -18,6 +20,7 @@ class RadioGroup(Control):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -32,6 +35,7 @@ class RadioGroup(Control):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.content = content
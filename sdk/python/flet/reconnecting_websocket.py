@@ -1,6 +1,8 @@
 import logging
 import random
 import threading
+import zlib
+from typing import Optional
 
 import websocket
 
@@ -9,10 +11,22 @@ from flet.utils import is_localhost_url
 _REMOTE_CONNECT_TIMEOUT_SEC = 5
 _LOCAL_CONNECT_TIMEOUT_SEC = 0.2
 
+# websocket-client can't decompress incoming messages, so the server is
+# asked not to keep compression context and it doesn't compress messages
+# to host clients
+_PERMESSAGE_DEFLATE = (
+    "permessage-deflate; client_no_context_takeover; server_no_context_takeover"
+)
+_DEFLATE_TAIL = b"\x00\x00\xff\xff"
+
 
 class ReconnectingWebSocket:
-    def __init__(self, url) -> None:
+    def __init__(self, url, compression_threshold: Optional[int] = None) -> None:
+        """`compression_threshold` enables permessage-deflate compression of
+        outgoing messages of that size or larger."""
         self._url = url
+        self._compression_threshold = compression_threshold
+        self._deflate = False
         self._on_connect_handler = None
         self._on_failed_connect_handler = None
         self._on_message_handler = None
@@ -50,6 +64,11 @@ class ReconnectingWebSocket:
 
     def _on_open(self, wsapp) -> None:
         logging.info(f"Successfully connected to {self._url}")
+        extensions = wsapp.sock.getheaders().get("sec-websocket-extensions", "")
+        self._deflate = (
+            self._compression_threshold is not None
+            and "permessage-deflate" in extensions
+        )
         websocket.setdefaulttimeout(self.default_timeout)
         self.connected.set()
         self.retry = 0
@@ -63,14 +82,38 @@ class ReconnectingWebSocket:
 
     def connect(self) -> None:
         self.wsapp = websocket.WebSocketApp(
-            self._url, on_message=self._on_message, on_open=self._on_open
+            self._url,
+            header=[f"Sec-WebSocket-Extensions: {_PERMESSAGE_DEFLATE}"]
+            if self._compression_threshold is not None
+            else None,
+            on_message=self._on_message,
+            on_open=self._on_open,
         )
         th = threading.Thread(target=self._connect_loop, args=(), daemon=True)
         th.start()
 
     def send(self, message) -> None:
         self.connected.wait()
-        self.wsapp.send(message)
+        opcode = (
+            websocket.ABNF.OPCODE_BINARY
+            if isinstance(message, bytes)
+            else websocket.ABNF.OPCODE_TEXT
+        )
+        if self._deflate and len(message) >= self._compression_threshold:
+            self.wsapp.sock.send_frame(self._deflate_frame(message, opcode))
+        else:
+            self.wsapp.send(message, opcode)
+
+    @staticmethod
+    def _deflate_frame(message, opcode):
+        if isinstance(message, str):
+            message = message.encode()
+        c = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        data = c.compress(message) + c.flush(zlib.Z_SYNC_FLUSH)
+        if data.endswith(_DEFLATE_TAIL):
+            data = data[: -len(_DEFLATE_TAIL)]
+        # RSV1 bit marks compressed message
+        return websocket.ABNF(1, 1, 0, 0, opcode, 1, data)
 
     def close(self) -> None:
         self.exit.set()
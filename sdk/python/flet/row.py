@@ -15,6 +15,8 @@ from flet.types import AnimationValue, OffsetValue, RotateValue, ScaleValue
 
 
 class Row(ConstrainedControl):
+    __slots__ = ("__controls", "__scroll")
+
     def __init__(
         self,
         controls: Optional[List[Control]] = None,
@@ -41,6 +43,7 @@ class Row(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Row specific
         #
@@ -78,6 +81,7 @@ class Row(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.__controls: List[Control] = []
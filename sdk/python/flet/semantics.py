@@ -7,6 +7,8 @@ from flet.ref import Ref
 
 
 class Semantics(Control):
+    __slots__ = ("__content",)
+
     def __init__(
         self,
         content: Optional[Control] = None,
@@ -14,6 +16,7 @@ class Semantics(Control):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -25,6 +28,7 @@ class Semantics(Control):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.content = content
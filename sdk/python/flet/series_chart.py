@@ -0,0 +1,263 @@
+from typing import Any, Optional, Tuple, Union
+
+from beartype import beartype
+
+from flet import downsample
+from flet.constrained_control import ConstrainedControl
+from flet.control import OptionalNumber
+from flet.ref import Ref
+from flet.types import AnimationValue, OffsetValue, RotateValue, ScaleValue
+
+try:
+    from typing import Literal
+except:
+    from typing_extensions import Literal
+
+DownsampleMethod = Literal["lttb", "minmax"]
+
+# used until the client has reported the width of the chart
+DEFAULT_PIXEL_WIDTH = 1000
+
+
+class SeriesChart(ConstrainedControl):
+    """Line chart of a large series, e.g. NumPy arrays.
+
+    The whole series stays on the host; the client gets it downsampled to
+    the width of the chart in pixels, so the size of updates doesn't depend
+    on the size of the series. The series is downsampled again when the chart
+    is resized or `x_range` is changed. `x` values must be ascending."""
+
+    __slots__ = ("__x", "__y", "__x_range", "__method", "__pixel_width", "__stale")
+
+    # the chart is downsampled to the latest width only
+    _coalesced_events = ("resize",)
+
+    def __init__(
+        self,
+        y: Any = None,
+        x: Any = None,
+        ref: Optional[Ref] = None,
+        width: OptionalNumber = None,
+        height: OptionalNumber = None,
+        left: OptionalNumber = None,
+        top: OptionalNumber = None,
+        right: OptionalNumber = None,
+        bottom: OptionalNumber = None,
+        expand: Union[None, bool, int] = None,
+        opacity: OptionalNumber = None,
+        rotate: RotateValue = None,
+        scale: ScaleValue = None,
+        offset: OffsetValue = None,
+        aspect_ratio: OptionalNumber = None,
+        animate_opacity: AnimationValue = None,
+        animate_size: AnimationValue = None,
+        animate_position: AnimationValue = None,
+        animate_rotation: AnimationValue = None,
+        animate_scale: AnimationValue = None,
+        animate_offset: AnimationValue = None,
+        on_animation_end=None,
+        tooltip: Optional[str] = None,
+        visible: Optional[bool] = None,
+        disabled: Optional[bool] = None,
+        data: Any = None,
+        key: Any = None,
+        #
+        # Specific
+        #
+        method: DownsampleMethod = "lttb",
+        x_range: Optional[Tuple[float, float]] = None,
+        color: Optional[str] = None,
+        bgcolor: Optional[str] = None,
+        stroke_width: OptionalNumber = None,
+        min_y: OptionalNumber = None,
+        max_y: OptionalNumber = None,
+    ):
+        ConstrainedControl.__init__(
+            self,
+            ref=ref,
+            width=width,
+            height=height,
+            left=left,
+            top=top,
+            right=right,
+            bottom=bottom,
+            expand=expand,
+            opacity=opacity,
+            rotate=rotate,
+            scale=scale,
+            offset=offset,
+            aspect_ratio=aspect_ratio,
+            animate_opacity=animate_opacity,
+            animate_size=animate_size,
+            animate_position=animate_position,
+            animate_rotation=animate_rotation,
+            animate_scale=animate_scale,
+            animate_offset=animate_offset,
+            on_animation_end=on_animation_end,
+            tooltip=tooltip,
+            visible=visible,
+            disabled=disabled,
+            data=data,
+            key=key,
+        )
+
+        self.__x = None
+        self.__y = None
+        self.__pixel_width: Optional[int] = None
+        self.__stale = True
+        self._add_event_handler("resize", self.__on_resize)
+        self.method = method
+        self.x_range = x_range
+        self.color = color
+        self.bgcolor = bgcolor
+        self.stroke_width = stroke_width
+        self.min_y = min_y
+        self.max_y = max_y
+        if y is not None:
+            self.set_data(y, x)
+
+    def _get_control_name(self):
+        return "serieschart"
+
+    def _before_build_command(self):
+        super()._before_build_command()
+        if self.__stale:
+            self.__stale = False
+            self.__build_points()
+
+    def set_data(self, y, x=None):
+        """Sets the series; `x` defaults to indexes of `y` values."""
+        np = downsample._get_numpy()
+        self.__y = np.asarray(y, dtype=float)
+        self.__x = (
+            np.arange(len(self.__y), dtype=float)
+            if x is None
+            else np.asarray(x, dtype=float)
+        )
+        if len(self.__x) != len(self.__y):
+            raise ValueError("x and y must have the same length")
+        self.__stale = True
+        self._mark_dirty()
+
+    def __on_resize(self, e):
+        self.__pixel_width = max(int(float(e.data)), 1)
+        self.__stale = True
+        self.update()
+
+    def __build_points(self):
+        x, y = self.__x, self.__y
+        if x is None or y is None or len(y) == 0:
+            self._set_attr("points", None)
+            self._set_attr("minX", None)
+            self._set_attr("maxX", None)
+            return
+
+        np = downsample._get_numpy()
+        if self.__x_range is not None:
+            x0, x1 = self.__x_range
+            # one point on each side, so the line reaches the edges
+            start = max(int(np.searchsorted(x, x0, side="right")) - 1, 0)
+            end = int(np.searchsorted(x, x1, side="left")) + 1
+            x, y = x[start:end], y[start:end]
+        else:
+            x0, x1 = float(x[0]), float(x[-1])
+
+        pixels = self.__pixel_width or int(self.width or DEFAULT_PIXEL_WIDTH)
+        if self.__method == "minmax":
+            x, y = downsample.min_max(x, y, pixels)
+        else:
+            x, y = downsample.lttb(x, y, pixels)
+
+        points = np.empty(2 * len(x))
+        points[0::2] = x
+        points[1::2] = y
+        self._set_attr("points", " ".join(np.char.mod("%.6g", points)))
+        self._set_attr("minX", x0)
+        self._set_attr("maxX", x1)
+
+    # x
+    @property
+    def x(self):
+        return self.__x
+
+    # y
+    @property
+    def y(self):
+        return self.__y
+
+    # pixel_width
+    @property
+    def pixel_width(self) -> Optional[int]:
+        """Width of the chart reported by the client."""
+        return self.__pixel_width
+
+    # method
+    @property
+    def method(self) -> DownsampleMethod:
+        return self.__method
+
+    @method.setter
+    @beartype
+    def method(self, value: DownsampleMethod):
+        self.__method = value
+        self.__stale = True
+        self._mark_dirty()
+
+    # x_range
+    @property
+    def x_range(self) -> Optional[Tuple[float, float]]:
+        return self.__x_range
+
+    @x_range.setter
+    def x_range(self, value: Optional[Tuple[float, float]]):
+        self.__x_range = value
+        self.__stale = True
+        self._mark_dirty()
+
+    # color
+    @property
+    def color(self):
+        return self._get_attr("color")
+
+    @color.setter
+    def color(self, value):
+        self._set_attr("color", value)
+
+    # bgcolor
+    @property
+    def bgcolor(self):
+        return self._get_attr("bgcolor")
+
+    @bgcolor.setter
+    def bgcolor(self, value):
+        self._set_attr("bgcolor", value)
+
+    # stroke_width
+    @property
+    def stroke_width(self) -> OptionalNumber:
+        return self._get_attr("strokeWidth")
+
+    @stroke_width.setter
+    @beartype
+    def stroke_width(self, value: OptionalNumber):
+        self._set_attr("strokeWidth", value)
+
+    # min_y
+    @property
+    def min_y(self) -> OptionalNumber:
+        return self._get_attr("minY")
+
+    @min_y.setter
+    @beartype
+    def min_y(self, value: OptionalNumber):
+        self._set_attr("minY", value)
+
+    # max_y
+    @property
+    def max_y(self) -> OptionalNumber:
+        return self._get_attr("maxY")
+
+    @max_y.setter
+    @beartype
+    def max_y(self, value: OptionalNumber):
+        self._set_attr("maxY", value)
@@ -16,6 +16,8 @@ from flet.types import (
 
 
 class ShaderMask(ConstrainedControl):
+    __slots__ = ("__content", "__shader", "__border_radius")
+
     def __init__(
         self,
         content: Optional[Control] = None,
@@ -43,6 +45,7 @@ class ShaderMask(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -76,6 +79,7 @@ class ShaderMask(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.content = content
@@ -9,6 +9,10 @@ from flet.types import AnimationValue, OffsetValue, RotateValue, ScaleValue
 
 
 class Slider(ConstrainedControl):
+    __slots__ = ()
+
+    _coalesced_events = ("change",)
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
@@ -35,6 +39,7 @@ class Slider(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -74,6 +79,7 @@ class Slider(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
         self.value = value
         self.label = label
@@ -7,6 +7,8 @@ from flet.ref import Ref
 
 
 class SnackBar(Control):
+    __slots__ = ("__content",)
+
     def __init__(
         self,
         content: Control,
@@ -14,6 +16,7 @@ class SnackBar(Control):
         disabled: Optional[bool] = None,
         visible: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -31,6 +34,7 @@ class SnackBar(Control):
             disabled=disabled,
             visible=visible,
             data=data,
+            key=key,
         )
 
         self.open = open
@@ -14,6 +14,8 @@ except ImportError:
 
 
 class Stack(ConstrainedControl):
+    __slots__ = ("__controls",)
+
     def __init__(
         self,
         controls: Optional[List[Control]] = None,
@@ -40,6 +42,7 @@ class Stack(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Stack-specific
         #
@@ -70,6 +73,7 @@ class Stack(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.__controls: List[Control] = []
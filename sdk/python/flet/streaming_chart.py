@@ -0,0 +1,232 @@
+import math
+from collections import deque
+from typing import Any, Iterable, List, Optional, Union
+
+from beartype import beartype
+
+from flet.constrained_control import ConstrainedControl
+from flet.control import OptionalNumber
+from flet.ref import Ref
+from flet.types import AnimationValue, OffsetValue, RotateValue, ScaleValue
+
+try:
+    from typing import Literal
+except:
+    from typing_extensions import Literal
+
+StreamingChartType = Literal[None, "line", "bar"]
+
+
+class StreamingChart(ConstrainedControl):
+    """Line or bar chart of a stream of numbers.
+
+    The chart keeps the latest `capacity` values. Values added with
+    `append()` are sent to the client on the next update and the client
+    keeps the rest of the series, so updates don't grow with the history.
+    Values are sent with 6 significant digits."""
+
+    __slots__ = ("__values", "__count", "__pending")
+
+    def __init__(
+        self,
+        values: Optional[Iterable[float]] = None,
+        ref: Optional[Ref] = None,
+        width: OptionalNumber = None,
+        height: OptionalNumber = None,
+        left: OptionalNumber = None,
+        top: OptionalNumber = None,
+        right: OptionalNumber = None,
+        bottom: OptionalNumber = None,
+        expand: Union[None, bool, int] = None,
+        opacity: OptionalNumber = None,
+        rotate: RotateValue = None,
+        scale: ScaleValue = None,
+        offset: OffsetValue = None,
+        aspect_ratio: OptionalNumber = None,
+        animate_opacity: AnimationValue = None,
+        animate_size: AnimationValue = None,
+        animate_position: AnimationValue = None,
+        animate_rotation: AnimationValue = None,
+        animate_scale: AnimationValue = None,
+        animate_offset: AnimationValue = None,
+        on_animation_end=None,
+        tooltip: Optional[str] = None,
+        visible: Optional[bool] = None,
+        disabled: Optional[bool] = None,
+        data: Any = None,
+        key: Any = None,
+        #
+        # Specific
+        #
+        capacity: int = 1000,
+        chart_type: StreamingChartType = None,
+        color: Optional[str] = None,
+        bgcolor: Optional[str] = None,
+        stroke_width: OptionalNumber = None,
+        min_y: OptionalNumber = None,
+        max_y: OptionalNumber = None,
+    ):
+        ConstrainedControl.__init__(
+            self,
+            ref=ref,
+            width=width,
+            height=height,
+            left=left,
+            top=top,
+            right=right,
+            bottom=bottom,
+            expand=expand,
+            opacity=opacity,
+            rotate=rotate,
+            scale=scale,
+            offset=offset,
+            aspect_ratio=aspect_ratio,
+            animate_opacity=animate_opacity,
+            animate_size=animate_size,
+            animate_position=animate_position,
+            animate_rotation=animate_rotation,
+            animate_scale=animate_scale,
+            animate_offset=animate_offset,
+            on_animation_end=on_animation_end,
+            tooltip=tooltip,
+            visible=visible,
+            disabled=disabled,
+            data=data,
+            key=key,
+        )
+
+        self.__values = deque(maxlen=capacity)
+        self.__count = 0  # values appended over the lifetime of the chart
+        self.__pending = deque(maxlen=capacity)
+        self.capacity = capacity
+        self.chart_type = chart_type
+        self.color = color
+        self.bgcolor = bgcolor
+        self.stroke_width = stroke_width
+        self.min_y = min_y
+        self.max_y = max_y
+        if values is not None:
+            self.append(values)
+
+    def _get_control_name(self):
+        return "streamingchart"
+
+    def _build(self):
+        # added chart gets the whole series at once
+        self.__pending.clear()
+        self._set_attr(
+            "data", _encode_values(self.__count - len(self.__values), self.__values)
+        )
+        self._set_attr("append", None)
+
+    def _before_build_command(self):
+        super()._before_build_command()
+        if self.__pending:
+            self._set_attr(
+                "append",
+                _encode_values(self.__count - len(self.__pending), self.__pending),
+            )
+            self.__pending.clear()
+
+    def append(self, values: Iterable[float]):
+        """Adds values to the end of the series, dropping the oldest ones."""
+        values = [float(v) for v in values]
+        self.__values.extend(values)
+        self.__pending.extend(values)
+        self.__count += len(values)
+        self._mark_dirty()
+
+    def clear(self):
+        self.__values.clear()
+        self.__pending.clear()
+        self._set_attr("data", _encode_values(self.__count, []))
+
+    # values
+    @property
+    def values(self) -> List[float]:
+        return list(self.__values)
+
+    # capacity
+    @property
+    def capacity(self) -> int:
+        return self.__values.maxlen  # type: ignore
+
+    @capacity.setter
+    @beartype
+    def capacity(self, value: int):
+        if value < 1:
+            raise ValueError("capacity must be positive")
+        if value != self.__values.maxlen:
+            self.__values = deque(self.__values, maxlen=value)
+            self.__pending = deque(maxlen=value)
+            # the client might have dropped values a bigger chart would show
+            self._set_attr(
+                "data",
+                _encode_values(self.__count - len(self.__values), self.__values),
+            )
+        self._set_attr("capacity", value)
+
+    # chart_type
+    @property
+    def chart_type(self) -> StreamingChartType:
+        return self._get_attr("chartType")
+
+    @chart_type.setter
+    @beartype
+    def chart_type(self, value: StreamingChartType):
+        self._set_attr("chartType", value)
+
+    # color
+    @property
+    def color(self):
+        return self._get_attr("color")
+
+    @color.setter
+    def color(self, value):
+        self._set_attr("color", value)
+
+    # bgcolor
+    @property
+    def bgcolor(self):
+        return self._get_attr("bgcolor")
+
+    @bgcolor.setter
+    def bgcolor(self, value):
+        self._set_attr("bgcolor", value)
+
+    # stroke_width
+    @property
+    def stroke_width(self) -> OptionalNumber:
+        return self._get_attr("strokeWidth")
+
+    @stroke_width.setter
+    @beartype
+    def stroke_width(self, value: OptionalNumber):
+        self._set_attr("strokeWidth", value)
+
+    # min_y
+    @property
+    def min_y(self) -> OptionalNumber:
+        return self._get_attr("minY")
+
+    @min_y.setter
+    @beartype
+    def min_y(self, value: OptionalNumber):
+        self._set_attr("minY", value)
+
+    # max_y
+    @property
+    def max_y(self) -> OptionalNumber:
+        return self._get_attr("maxY")
+
+    @max_y.setter
+    @beartype
+    def max_y(self, value: OptionalNumber):
+        self._set_attr("maxY", value)
+
+
+def _encode_values(start: int, values: Iterable[float]) -> str:
+    # "<index of the first value> <value> <value>..."
+    return " ".join(
+        [str(start), *[f"{v:.6g}" if math.isfinite(v) else "nan" for v in values]]
+    )
@@ -17,6 +17,8 @@ LabelPosition = Literal[None, "right", "left"]
 
 
 class Switch(ConstrainedControl):
+    __slots__ = ()
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
@@ -43,6 +45,7 @@ class Switch(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -80,6 +83,7 @@ class Switch(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
         self.value = value
         self.label = label
@@ -10,6 +10,8 @@ from flet.types import AnimationValue, OffsetValue, RotateValue, ScaleValue
 
 
 class Tab(Control):
+    __slots__ = ("__content", "__tab_content")
+
     def __init__(
         self,
         text: Optional[str] = None,
@@ -17,8 +19,9 @@ class Tab(Control):
         tab_content: Optional[Control] = None,
         ref: Optional[Ref] = None,
         icon: Optional[str] = None,
+        key: Any = None,
     ):
-        Control.__init__(self, ref=ref)
+        Control.__init__(self, ref=ref, key=key)
         self.text = text
         self.icon = icon
         self.__content: Optional[Control] = None
@@ -77,6 +80,8 @@ class Tab(Control):
 
 
 class Tabs(ConstrainedControl):
+    __slots__ = ("__tabs",)
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
@@ -102,6 +107,7 @@ class Tabs(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Tabs-specific
         tabs: Optional[List[Tab]] = None,
@@ -135,6 +141,7 @@ class Tabs(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.tabs = tabs
@@ -34,6 +34,8 @@ TextThemeStyle = Literal[
 
 
 class Text(ConstrainedControl):
+    __slots__ = ()
+
     def __init__(
         self,
         value: Optional[str] = None,
@@ -61,6 +63,7 @@ class Text(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # text-specific
         #
@@ -105,6 +108,7 @@ class Text(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.value = value
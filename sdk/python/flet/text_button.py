@@ -10,6 +10,8 @@ from flet.types import AnimationValue, OffsetValue, RotateValue, ScaleValue
 
 
 class TextButton(ConstrainedControl):
+    __slots__ = ("__style", "__content")
+
     def __init__(
         self,
         text: Optional[str] = None,
@@ -37,6 +39,7 @@ class TextButton(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # Specific
         #
@@ -75,6 +78,7 @@ class TextButton(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.text = text
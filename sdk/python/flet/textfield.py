@@ -40,6 +40,8 @@ TextCapitalization = Literal[None, "none", "characters", "words", "sentences"]
 
 
 class TextField(FormFieldControl):
+    __slots__ = ()
+
     def __init__(
         self,
         ref: Optional[Ref] = None,
@@ -62,6 +64,7 @@ class TextField(FormFieldControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
         #
         # FormField specific
         #
@@ -145,6 +148,7 @@ class TextField(FormFieldControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
             #
             # FormField
             #
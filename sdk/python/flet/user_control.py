@@ -5,6 +5,8 @@ from flet.stack import Stack
 
 
 class UserControl(Stack):
+    __slots__ = ()
+
     def build(self):
         pass
 
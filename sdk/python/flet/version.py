@@ -1,7 +1,5 @@
 import subprocess as sp
 
-from pkg_resources import parse_version
-
 from flet.utils import which
 
 # this value will be replaced by CI
@@ -16,6 +14,8 @@ def update_version():
     ).stdout.startswith("On branch ")
 
     if in_repo:
+        from pkg_resources import parse_version
+
         # NOTE: this may break if there is a tag name starting with
         #         "v" that isn't a version number
         tags = sp.run(
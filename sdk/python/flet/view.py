@@ -1,7 +1,9 @@
+from typing import Any
+
 from beartype import beartype
 from beartype.typing import List, Optional
 
-from flet import Control
+from flet.control import Control
 from flet.app_bar import AppBar
 from flet.control import (
     CrossAxisAlignment,
@@ -14,6 +16,8 @@ from flet.types import PaddingValue
 
 
 class View(Control):
+    __slots__ = ("__controls", "__appbar", "__fab", "__padding", "__scroll")
+
     def __init__(
         self,
         route: Optional[str] = None,
@@ -27,8 +31,9 @@ class View(Control):
         bgcolor: Optional[str] = None,
         scroll: ScrollMode = None,
         auto_scroll: Optional[bool] = None,
+        key: Any = None,
     ):
-        Control.__init__(self)
+        Control.__init__(self, key=key)
 
         self.controls = controls if controls is not None else []
         self.route = route
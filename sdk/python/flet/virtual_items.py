@@ -0,0 +1,113 @@
+from typing import Callable, List, Optional, Tuple
+
+from flet.control import Control
+
+DEFAULT_CACHE_SIZE = 100
+
+
+class VirtualItems:
+    """Keeps a bounded, contiguous window of controls produced by
+    `item_builder(index)` around the item range requested by a client.
+
+    With `control` given, its "request_items" events are handled: the
+    requested range is loaded by `before_build_command()` of the control,
+    so the window is moved while the control is being built only."""
+
+    __slots__ = (
+        "item_builder",
+        "item_count",
+        "cache_size",
+        "__control",
+        "__start",
+        "__items",
+        "__requested",
+    )
+
+    def __init__(self, control: Optional[Control] = None):
+        self.item_builder: Optional[Callable[[int], Control]] = None
+        self.item_count: int = 0
+        self.cache_size: int = DEFAULT_CACHE_SIZE
+        self.__control = control
+        self.__start = 0
+        self.__items: List[Control] = []
+        self.__requested: Optional[Tuple[int, int]] = None
+        if control is not None:
+            control._add_event_handler("request_items", self.__on_request_items)
+
+    @property
+    def first_index(self) -> int:
+        return self.__start
+
+    @property
+    def controls(self) -> List[Control]:
+        return self.__items
+
+    def reset(self):
+        self.__start = 0
+        self.__items = []
+        self.__requested = None
+
+    def get_children(self, controls: List[Control]) -> List[Control]:
+        return self.__items if self.item_builder is not None else controls
+
+    def before_build_command(self):
+        if self.item_builder is not None and self.__control is not None:
+            self.ensure_loaded()
+            self.__control._set_attr("firstItemIndex", self.__start)
+
+    def __on_request_items(self, e):
+        first, last = map(int, e.data.split())
+        self.__requested = (first, last)
+        if self.__get_window(first, last) != (
+            self.__start,
+            self.__start + len(self.__items),
+        ):
+            assert self.__control is not None
+            self.__control._mark_dirty()
+            self.__control.update()
+
+    def ensure_loaded(self):
+        if self.__start + len(self.__items) > self.item_count:
+            # the list has shrunk
+            self.__items = self.__items[: max(0, self.item_count - self.__start)]
+        if self.__requested is not None:
+            self.request(*self.__requested)
+        if len(self.__items) == 0:
+            at = min(self.__start, self.item_count - 1)
+            self.request(at, at)
+
+    def __get_window(self, first: int, last: int) -> Optional[Tuple[int, int]]:
+        first = max(0, first)
+        last = min(last, self.item_count - 1)
+        if first > last:
+            return None
+        size = max(self.cache_size, last - first + 1)
+        start = max(0, min((first + last + 1) // 2 - size // 2, self.item_count - size))
+        return start, min(self.item_count, start + size)
+
+    def request(self, first: int, last: int) -> bool:
+        """Moves the window so it covers items `first`..`last` (inclusive).
+        Returns `True` if the window has changed."""
+        if self.item_builder is None:
+            return False
+        window = self.__get_window(first, last)
+        if window is None:
+            return False
+        start, end = window
+
+        prev_start = self.__start
+        prev_items = self.__items
+        prev_end = prev_start + len(prev_items)
+        if start == prev_start and end == prev_end:
+            return False
+
+        items = []
+        for i in range(start, end):
+            if prev_start <= i < prev_end:
+                items.append(prev_items[i - prev_start])
+            else:
+                items.append(self.item_builder(i))
+
+        self.__start = start
+        self.__items = items
+        return True
@@ -7,6 +7,8 @@ from flet.types import AnimationValue, OffsetValue, RotateValue, ScaleValue
 
 
 class WindowDragArea(ConstrainedControl):
+    __slots__ = ("__content",)
+
     def __init__(
         self,
         content: Optional[Control] = None,
@@ -34,6 +36,7 @@ class WindowDragArea(ConstrainedControl):
         visible: Optional[bool] = None,
         disabled: Optional[bool] = None,
         data: Any = None,
+        key: Any = None,
     ):
 
         ConstrainedControl.__init__(
@@ -62,6 +65,7 @@ class WindowDragArea(ConstrainedControl):
             visible=visible,
             disabled=disabled,
             data=data,
+            key=key,
         )
 
         self.__content: Optional[Control] = None
@@ -1,7 +1,38 @@
-import flet
 import pytest
-from flet import Control
-from flet import Text
+
+import flet
+from flet import Control, Text
+from flet.page import Page
+from flet.protocol import PageCommandsBatchResponsePayload
+from flet.pubsub import PubSubHub
+
+
+class FakeConnection:
+    """Records sent commands and answers them like Flet server."""
+
+    def __init__(self):
+        self.page_name = "test"
+        self.pubsubhub = PubSubHub()
+        self.executor = None
+        self.batches = []
+        self.next_id = 0
+
+    def send_commands(self, session_id, commands):
+        self.batches.append(commands)
+        results = []
+        for cmd in commands:
+            if cmd.name == "get":
+                results.append("")
+            elif cmd.name == "add":
+                ids = []
+                for _ in cmd.commands:
+                    ids.append(f"_{self.next_id}")
+                    self.next_id += 1
+                results.append(" ".join(ids))
+        return PageCommandsBatchResponsePayload(results=results, error="")
+
+    async def send_commands_async(self, session_id, commands):
+        return self.send_commands(session_id, commands)
 
 
 @pytest.fixture
@@ -19,4 +50,16 @@ def control_type_tree():
         else:
             return type(control)
 
-    return func
\ No newline at end of file
+    return func
+
+
+@pytest.fixture
+def fake_conn():
+    return FakeConnection()
+
+
+@pytest.fixture
+def fake_page(fake_conn):
+    page = Page(fake_conn, "session1")
+    fake_conn.batches.clear()
+    return page
@@ -0,0 +1,116 @@
+import base64
+
+from flet import Column, Container, Image
+from flet.blob_store import BlobStore
+from flet.protocol import (
+    Command,
+    PageCommandRequestPayload,
+    PageCommandsBatchRequestPayload,
+)
+
+PNG = base64.b64encode(b"\x89PNG" + bytes(range(256)) * 8).decode()
+SVG = base64.b64encode(b"<svg>" + b" " * 2000 + b"</svg>").decode()
+
+
+def _add(*controls):
+    commands = []
+    for control in controls:
+        commands.extend(control._build_add_commands())
+    return [Command(0, "add", [], {"to": "page", "at": "0"}, commands)]
+
+
+def _set(control):
+    control._Control__uid = "_1"
+    command = control._build_command(update=True)
+    command.name = "set"
+    return [command]
+
+
+def test_base64_is_replaced_with_blob_url():
+    store = BlobStore()
+    commands = _add(Column(), Image(src_base64=PNG))
+
+    encoded = store.encode_commands(commands)
+
+    put, add = encoded
+    assert put.name == "putblob"
+    assert put.attrs["data"] == PNG
+    url = add.commands[1].attrs["srcblob"]
+    assert url == f"/api/blob/{put.values[0]}"
+    assert add.commands[1].attrs["srcbase64"] == ""
+    # commands are not modified, unchanged ones are reused
+    assert commands[0].commands[1].attrs["srcbase64"] == PNG
+    assert add.commands[0] is commands[0].commands[0]
+
+    # known blob is not uploaded again
+    encoded = store.encode_commands(_set(Image(src_base64=PNG)))
+    assert [c.name for c in encoded] == ["set"]
+    assert encoded[0].attrs["srcblob"] == url
+    assert len(store) == 1
+
+
+def test_small_data_is_sent_inline():
+    store = BlobStore()
+    encoded = store.encode_commands(_set(Container(image_src_base64="aGVsbG8=")))
+    assert encoded[0].attrs == {"imagesrcbase64": "aGVsbG8=", "imagesrcblob": ""}
+    assert len(store) == 0
+
+
+def test_svg_blob_url():
+    [_, add] = BlobStore().encode_commands(_add(Image(src_base64=SVG)))
+    assert add.commands[0].attrs["srcblob"].endswith(".svg")
+
+
+def test_least_recently_used_blobs_are_released():
+    store = BlobStore(max_size=3000)
+    blobs = [base64.b64encode(bytes([i]) * 1200).decode() for i in range(3)]
+    hashes = []
+    for b in blobs:
+        encoded = store.encode_commands(_set(Image(src_base64=b)))
+        hashes.append(encoded[-2].values[0])
+    assert [(c.name, c.values) for c in encoded[:2]] == [
+        ("delblob", [hashes[0]]),
+        ("putblob", [hashes[2]]),
+    ]
+    assert len(store) == 2
+    assert store.size == 2400
+
+    # uses the second blob, so the third one is released
+    encoded = store.encode_commands(_set(Image(src_base64=blobs[1])))
+    assert [c.name for c in encoded] == ["set"]
+    encoded = store.encode_commands(_set(Image(src_base64=blobs[0])))
+    assert [(c.name, c.values) for c in encoded[:2]] == [
+        ("delblob", [hashes[2]]),
+        ("putblob", [hashes[0]]),
+    ]
+
+    # blobs used by the same commands are not released
+    encoded = store.encode_commands(_add(*[Image(src_base64=b) for b in blobs]))
+    assert [c.name for c in encoded] == ["putblob", "add"]
+    assert store.size == 3600
+
+
+def test_blobs_are_uploaded_again_after_invalidation():
+    store = BlobStore()
+    store.encode_commands(_set(Image(src_base64=PNG)))
+    store.invalidate()
+
+    encoded = store.encode_commands(_set(Image(src_base64=PNG)))
+    assert [c.name for c in encoded] == ["putblob", "set"]
+    encoded = store.encode_commands(_set(Image(src_base64=PNG)))
+    assert [c.name for c in encoded] == ["set"]
+
+
+def test_single_command_blobs_are_sent_in_batch_ahead():
+    store = BlobStore()
+    [command] = _set(Image(src_base64=PNG))
+
+    batch, payload = store.encode_payload(
+        PageCommandRequestPayload("test", "s1", command)
+    )
+    assert isinstance(batch, PageCommandsBatchRequestPayload)
+    assert [c.name for c in batch.commands] == ["putblob"]
+    assert payload.command.attrs["srcblob"].startswith("/api/blob/")
+
+    payload = PageCommandRequestPayload("test", "s1", Command(0, "clean", ["_1"]))
+    assert store.encode_payload(payload) == [payload]
@@ -0,0 +1,403 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from flet import Image
+from flet.connection import Connection
+from flet.protocol import Command, PageCommandRequestPayload
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.on_message = None
+        self.sent = []
+
+    def send(self, message):
+        self.sent.append(json.loads(message))
+
+    def close(self):
+        pass
+
+    def reply(self, msg, result="ok"):
+        self.on_message(
+            json.dumps(
+                {
+                    "id": msg["id"],
+                    "action": msg["action"],
+                    "payload": {"result": result, "error": ""},
+                }
+            )
+        )
+
+
+def _connect(**kwargs):
+    ws = FakeWebSocket()
+    conn = Connection(ws, **kwargs)
+    conn.page_name = "test"
+    return conn, ws
+
+
+def test_requests_are_pipelined():
+    conn, ws = _connect(request_timeout=5)
+    results = {}
+
+    def send(n):
+        results[n] = conn.send_command("s1", Command(0, "get", [str(n)])).result
+
+    threads = [threading.Thread(target=send, args=(n,)) for n in range(3)]
+    for th in threads:
+        th.start()
+    deadline = time.monotonic() + 5
+    while len(ws.sent) < 3:
+        assert time.monotonic() < deadline, "requests were not sent"
+        time.sleep(0.001)
+
+    # all requests are in flight before any response arrives
+    assert conn.request_metrics.in_flight == 3
+    assert sorted(m["id"] for m in ws.sent) == ["1", "2", "3"]
+
+    # reply out of order
+    for msg in reversed(ws.sent):
+        ws.reply(msg, msg["payload"]["command"]["v"][0])
+    for th in threads:
+        th.join()
+
+    assert results == {0: "0", 1: "1", 2: "2"}
+    metrics = conn.request_metrics.get_metrics()
+    assert metrics["in_flight"] == 0
+    assert metrics["requests"] == 3
+    assert "p99_latency_ms" in metrics
+    conn.close()
+
+
+def test_request_timeout():
+    conn, ws = _connect(request_timeout=0.05)
+
+    with pytest.raises(TimeoutError):
+        conn.send_command("s1", Command(0, "get", ["x"]))
+
+    assert conn._ws_callbacks == {}
+    assert conn.request_metrics.get_metrics()["timeouts"] == 1
+
+    # late response is ignored
+    ws.reply(ws.sent[0])
+    assert conn.request_metrics.in_flight == 0
+    conn.close()
+
+
+def test_cancel_request():
+    conn, ws = _connect()
+
+    fut = conn._send_message("pageCommandFromHost", {})
+    assert fut.cancel()
+
+    assert conn._ws_callbacks == {}
+    assert conn.request_metrics.get_metrics()["cancelled"] == 1
+    ws.reply(ws.sent[0])
+    conn.close()
+
+
+def test_send_command_async_timeout():
+    conn, ws = _connect()
+
+    async def main():
+        with pytest.raises(TimeoutError):
+            await conn.send_command_async("s1", Command(0, "get", ["x"]), timeout=0.05)
+
+    asyncio.run(main())
+    assert conn._ws_callbacks == {}
+    assert conn.request_metrics.get_metrics()["timeouts"] == 1
+    conn.close()
+
+
+def test_send_failure_drops_request():
+    conn, ws = _connect()
+
+    def send(message):
+        raise ConnectionError("closed")
+
+    ws.send = send
+    with pytest.raises(ConnectionError):
+        conn.send_command("s1", Command(0, "get", ["x"]))
+
+    assert conn._ws_callbacks == {}
+    assert conn.request_metrics.in_flight == 0
+    conn.close()
+
+
+def test_msgpack_framing():
+    msgpack = pytest.importorskip("msgpack")
+    conn, ws = _connect(framing="msgpack")
+    sent = []
+    ws.send = sent.append
+
+    def register():
+        return conn.register_host_client(None, "test", True, False, None, None)
+
+    th = threading.Thread(target=register)
+    th.start()
+    deadline = time.monotonic() + 5
+    while len(sent) < 1:
+        assert time.monotonic() < deadline, "request was not sent"
+        time.sleep(0.001)
+
+    # registration is JSON
+    request = json.loads(sent[0])
+    assert request["payload"]["framing"] == "msgpack"
+    ws.on_message(
+        json.dumps(
+            {
+                "id": request["id"],
+                "action": "",
+                "payload": {
+                    "hostClientID": "h1",
+                    "pageName": "test",
+                    "sessionID": "",
+                    "error": "",
+                    "framing": "msgpack",
+                },
+            }
+        )
+    )
+    th.join()
+
+    results = []
+
+    def send():
+        results.append(conn.send_command("s1", Command(0, "get", ["x"])).result)
+
+    th = threading.Thread(target=send)
+    th.start()
+    while len(sent) < 2:
+        assert time.monotonic() < deadline, "request was not sent"
+        time.sleep(0.001)
+
+    # following messages are binary in both directions
+    msg = msgpack.unpackb(sent[1])
+    assert msg["payload"]["command"] == {"n": "get", "v": ["x"]}
+    ws.on_message(
+        msgpack.packb(
+            {"id": msg["id"], "action": "", "payload": {"result": "42", "error": ""}}
+        )
+    )
+    th.join()
+    assert results == ["42"]
+    conn.close()
+
+
+def test_attr_name_table():
+    from flet.protocol import AttrNameTable, PageCommandsBatchRequestPayload
+
+    table = AttrNameTable()
+    cmd = Command(
+        0,
+        "add",
+        [],
+        {"to": "page"},
+        [Command(1, "textfield", [], {"borderradius": "5", "value": "a"})],
+    )
+    payload = table.encode_payload(PageCommandsBatchRequestPayload("p", "s1", [cmd]))
+    assert payload == {
+        "pageName": "p",
+        "sessionID": "s1",
+        "commands": [
+            {
+                "n": "add",
+                "a": {"to": "page"},
+                "c": [{"i": 1, "n": "textfield", "a": {"0": "5", "1": "a"}}],
+            }
+        ],
+        "attrNames": ["borderradius", "value"],
+    }
+
+    # known names are not declared again
+    cmd = Command(0, "set", ["_1"], {"value": "b", "focusedbordercolor": "red"})
+    payload = table.encode_payload(PageCommandRequestPayload("p", "s1", cmd))
+    assert payload["command"] == {"n": "set", "v": ["_1"], "a": {"1": "b", "2": "red"}}
+    assert payload["attrNames"] == ["focusedbordercolor"]
+
+    payload = table.encode_payload(PageCommandRequestPayload("p", "s1", cmd))
+    assert "attrNames" not in payload
+
+
+def test_attr_table_is_negotiated():
+    conn, ws = _connect()
+    ws.send = lambda message: ws.sent.append(json.loads(message))
+
+    def reply_later(payload):
+        deadline = time.monotonic() + 5
+        while len(ws.sent) == 0:
+            assert time.monotonic() < deadline, "request was not sent"
+            time.sleep(0.001)
+        msg = ws.sent.pop()
+        ws.on_message(json.dumps({"id": msg["id"], "action": "", "payload": payload}))
+        return msg
+
+    th = threading.Thread(
+        target=conn.register_host_client, args=(None, "test", True, False, None, None)
+    )
+    th.start()
+    request = reply_later(
+        {
+            "hostClientID": "h1",
+            "pageName": "test",
+            "sessionID": "",
+            "error": "",
+            "attrTable": True,
+        }
+    )
+    th.join()
+    assert request["payload"]["attrTable"] is True
+
+    th = threading.Thread(
+        target=conn.send_command, args=("s1", Command(0, "set", ["_1"], {"value": "x"}))
+    )
+    th.start()
+    msg = reply_later({"result": "", "error": ""})
+    th.join()
+    assert msg["payload"]["command"]["a"] == {"0": "x"}
+    assert msg["payload"]["attrNames"] == ["value"]
+    conn.close()
+
+
+def test_blobs_are_negotiated():
+    conn, ws = _connect(attr_table=False)
+    ws.send = lambda message: ws.sent.append(json.loads(message))
+
+    def reply_later(payload):
+        deadline = time.monotonic() + 5
+        while len(ws.sent) == 0:
+            assert time.monotonic() < deadline, "request was not sent"
+            time.sleep(0.001)
+        msg = ws.sent.pop()
+        ws.on_message(json.dumps({"id": msg["id"], "action": "", "payload": payload}))
+        return msg
+
+    th = threading.Thread(
+        target=conn.register_host_client, args=(None, "test", True, False, None, None)
+    )
+    th.start()
+    request = reply_later(
+        {
+            "hostClientID": "h1",
+            "pageName": "test",
+            "sessionID": "",
+            "error": "",
+            "blobs": True,
+        }
+    )
+    th.join()
+    assert request["payload"]["blobs"] is True
+
+    data = "A" * 2000
+    image = Image(src_base64=data)
+    th = threading.Thread(
+        target=conn.send_commands,
+        args=(
+            "s1",
+            [Command(0, "add", [], {"to": "page"}, image._build_add_commands())],
+        ),
+    )
+    th.start()
+    msg = reply_later({"results": [""], "error": ""})
+    th.join()
+    put, add = msg["payload"]["commands"]
+    assert put["n"] == "putblob"
+    assert put["a"] == {"data": data}
+    assert add["c"][0]["a"]["srcblob"] == "/api/blob/" + put["v"][0]
+
+    # blobs are uploaded again after reconnecting
+    th = threading.Thread(
+        target=conn.register_host_client, args=("h1", "test", True, False, None, None)
+    )
+    th.start()
+    reply_later(
+        {
+            "hostClientID": "h1",
+            "pageName": "test",
+            "sessionID": "",
+            "error": "",
+            "blobs": True,
+        }
+    )
+    th.join()
+
+    # single command is sent after a batch with its blobs
+    image = Image(src_base64=data)
+    image._Control__uid = "_1"
+    command = image._build_command(update=True)
+    command.name = "set"
+    th = threading.Thread(target=conn.send_command, args=("s1", command))
+    th.start()
+    msg = reply_later({"result": "", "error": ""})
+    th.join()
+    [batch] = ws.sent
+    assert batch["action"] == "pageCommandsBatchFromHost"
+    assert [c["n"] for c in batch["payload"]["commands"]] == ["putblob"]
+    assert msg["payload"]["command"]["a"]["srcblob"] == add["c"][0]["a"]["srcblob"]
+    conn.close()
+
+
+def test_long_running_handler_does_not_block_events():
+    from flet import ElevatedButton, FilePicker
+    from flet.event import Event
+    from flet.page import Page
+
+    conn, ws = _connect(event_workers=1)
+    page = Page(conn, "s1", {})
+    conn.sessions["s1"] = page
+    conn.on_event = lambda conn, e: conn.sessions[e.sessionID].on_event(
+        Event(e.eventTarget, e.eventName, e.eventData)
+    )
+    running = threading.Event()
+    stopped = threading.Event()
+    picked = []
+
+    def loop():
+        running.set()
+        while running.is_set():
+            time.sleep(0.01)
+        stopped.set()
+
+    start = ElevatedButton(on_click=lambda e: page.run_thread(loop))
+    stop = ElevatedButton(on_click=lambda e: running.clear())
+    picker = FilePicker(on_result=lambda e: picked.append(running.is_set()))
+    for n, ctrl in enumerate([start, stop, picker]):
+        ctrl._Control__uid = f"_{n}"
+        page._index[ctrl.uid] = ctrl
+
+    def event(target, name, data=""):
+        conn._on_message(
+            json.dumps(
+                {
+                    "id": "",
+                    "action": "pageEventToHost",
+                    "payload": {
+                        "pageName": "test",
+                        "sessionID": "s1",
+                        "eventTarget": target,
+                        "eventName": name,
+                        "eventData": data,
+                    },
+                }
+            )
+        )
+
+    # the only worker is free while the loop runs
+    event(start.uid, "click")
+    assert running.wait(5)
+    event(stop.uid, "click")
+    assert stopped.wait(5)
+
+    # file picker result is a user event, delivered in order
+    stopped.clear()
+    event(start.uid, "click")
+    assert running.wait(5)
+    event(picker.uid, "result", json.dumps({"path": None, "files": None}))
+    event(stop.uid, "click")
+    assert stopped.wait(5)
+    conn.close()
+    assert picked == [True]
@@ -0,0 +1,372 @@
+import pytest
+
+from flet import Column, Text
+from flet.protocol import Command
+
+
+def _mount(control):
+    added_controls = []
+    control._build_add_commands(index={}, added_controls=added_controls)
+    for n, ctrl in enumerate(added_controls):
+        ctrl._Control__uid = f"_{n}"
+    return added_controls
+
+
+def test_reorder_children_keeps_stable_controls():
+    items = [Text(str(i)) for i in range(5)]
+    col = Column(controls=list(items))
+    _mount(col)
+
+    # move the last item to the front
+    col.controls = [items[4], items[0], items[1], items[2], items[3]]
+    commands = []
+    col.build_update_commands({}, [], commands)
+
+    assert commands == [Command(0, "move", [items[4].uid], {"at": "0"})]
+
+
+def test_consecutive_moves_are_merged():
+    items = [Text(str(i)) for i in range(6)]
+    col = Column(controls=list(items))
+    _mount(col)
+
+    col.controls = [items[4], items[5], items[0], items[1], items[2], items[3]]
+    items[5].value = "changed"
+    commands = []
+    col.build_update_commands({}, [], commands)
+
+    assert commands == [
+        Command(0, "move", [items[4].uid, items[5].uid], {"at": "0"}),
+        Command(0, "set", [items[5].uid], {"value": "changed"}),
+    ]
+
+
+def test_insert_and_remove_children():
+    items = [Text(str(i)) for i in range(4)]
+    col = Column(controls=list(items))
+    _mount(col)
+
+    new_item = Text("new")
+    col.controls = [items[0], new_item, items[2], items[3]]
+    commands = []
+    col.build_update_commands({}, [], commands)
+
+    assert commands[0] == Command(0, "remove", [items[1].uid])
+    assert commands[1].name == "add"
+    assert commands[1].attrs == {"to": col.uid, "at": "1"}
+    assert commands[1].commands[0].attrs == {"value": "new"}
+
+
+def test_same_key_control_takes_place_of_previous_one():
+    col = Column(controls=[Text("a", key="a"), Text("b", key="b", size=10)])
+    _mount(col)
+    old_b = col.controls[1]
+
+    new_b = Text("b2", key="b")
+    col.controls = [col.controls[0], new_b]
+    index = {old_b.uid: old_b}
+    commands = []
+    col.build_update_commands(index, [], commands)
+
+    assert commands == [Command(0, "set", [old_b.uid], {"value": "b2", "size": ""})]
+    assert new_b.uid == old_b.uid
+    assert index == {new_b.uid: new_b}
+
+
+def test_same_key_children_are_reconciled():
+    x, y = Text("x", key="x"), Text("y")
+    old = Column(key="col", controls=[x, y])
+    root = Column(controls=[old])
+    _mount(root)
+
+    new_x, z = Text("x2", key="x"), Text("z")
+    root.controls = [Column(key="col", controls=[new_x, z])]
+    commands = []
+    root.build_update_commands({}, [], commands)
+
+    assert [(c.name, c.values) for c in commands] == [
+        ("remove", [y.uid]),
+        ("set", [x.uid]),
+        ("add", []),
+    ]
+    assert commands[1].attrs == {"value": "x2"}
+    assert commands[2].attrs == {"to": old.uid, "at": "1"}
+
+
+def test_same_key_different_control_is_recreated():
+    col = Column(controls=[Text("a", key="a"), Text("b", key="b")])
+    _mount(col)
+    old_b = col.controls[1]
+
+    col.controls = [col.controls[0], Column(key="b")]
+    commands = []
+    col.build_update_commands({}, [], commands)
+
+    assert commands[0] == Command(0, "remove", [old_b.uid])
+    assert commands[1].attrs == {"to": col.uid, "at": "1"}
+
+
+def _apply_commands(children, commands):
+    # applies children commands the way Flet server and client do
+    children = list(children)
+    for cmd in commands:
+        if cmd.name == "remove":
+            children = [c for c in children if c not in cmd.values]
+        elif cmd.name == "move":
+            children = [c for c in children if c not in cmd.values]
+            at = min(int(cmd.attrs["at"]), len(children))
+            children[at:at] = cmd.values
+        elif cmd.name == "add":
+            children.insert(int(cmd.attrs["at"]), cmd.commands[0])
+    return children
+
+
+@pytest.mark.parametrize(
+    "previous, current",
+    [
+        ("ABC", "BCXA"),
+        ("FBEGCH", "EGHCB"),
+        ("ABCDE", "EDCBA"),
+        ("ABCDEF", "XDAYBZ"),
+    ],
+)
+def test_reorder_commands_produce_current_order(previous, current):
+    _check_reorder(list(previous), list(current))
+
+
+def test_reorder_commands_produce_current_order_random():
+    import random
+
+    rnd = random.Random(7)
+    for _ in range(500):
+        previous = rnd.sample("ABCDEFGHIJ", rnd.randint(0, 10))
+        current = rnd.sample("ABCDEFGHIJKLMNOP", rnd.randint(0, 12))
+        _check_reorder(previous, current)
+
+
+def _check_reorder(previous, current):
+    items = {name: Text(name, key=name) for name in previous}
+    col = Column(controls=[items[name] for name in previous])
+    _mount(col)
+    uids = {items[name].uid: name for name in previous}
+
+    col.controls = [items.get(name) or Text(name, key=name) for name in current]
+    commands = []
+    col.build_update_commands({}, [], commands)
+
+    for cmd in commands:
+        if cmd.name == "add":
+            # name of added control instead of its commands
+            cmd.commands[0] = cmd.commands[0].attrs["value"]
+    result = _apply_commands([items[name].uid for name in previous], commands)
+    assert [uids.get(c, c) for c in result] == current, commands
+
+
+def test_views_are_reordered_by_key():
+    from flet import AppBar, View
+
+    assert AppBar(key="bar").key == "bar"
+
+    views = [View(route=r, key=r) for r in ["/", "/a", "/b"]]
+    root = Column(controls=views)
+    _mount(root)
+    uids = [v.uid for v in views]
+
+    root.controls = [View(route="/", key="/"), views[2], views[1]]
+    commands = []
+    root.build_update_commands({}, [], commands)
+    assert [c.name for c in commands] == ["move"]
+    assert root.controls[0].uid == uids[0]
+
+
+def test_longest_increasing_subsequence():
+    from flet.control import _longest_increasing_subsequence
+
+    assert _longest_increasing_subsequence([]) == set()
+    assert _longest_increasing_subsequence([None, None]) == set()
+    assert _longest_increasing_subsequence([4, 0, 1, 2, 3]) == {1, 2, 3, 4}
+    assert _longest_increasing_subsequence([2, None, 0, 1]) == {2, 3}
+
+
+def test_update_skips_clean_subtrees():
+    rows = [Column(controls=[Text(f"{r}:{c}") for c in range(3)]) for r in range(3)]
+    col = Column(controls=rows)
+    _mount(col)
+
+    visited = []
+    for row in rows:
+        for t in row.controls:
+            t._before_build_command = lambda t=t: visited.append(t)
+
+    rows[1].controls[2].value = "changed"
+    commands = []
+    col.build_update_commands({}, [], commands)
+
+    assert commands == [
+        Command(0, "set", [rows[1].controls[2].uid], {"value": "changed"})
+    ]
+    assert visited == [rows[1].controls[2]]
+
+    # nothing has changed since the last update
+    visited.clear()
+    commands = []
+    col.build_update_commands({}, [], commands)
+    assert commands == []
+    assert visited == []
+
+
+def test_children_list_mutation_marks_control_dirty():
+    row = Column(controls=[Text("a")])
+    col = Column(controls=[row])
+    _mount(col)
+
+    row.controls.append(Text("b"))
+    commands = []
+    col.build_update_commands({}, [], commands)
+
+    assert [c.name for c in commands] == ["add"]
+    assert commands[0].attrs == {"to": row.uid, "at": "1"}
+
+
+def test_changes_through_other_references_are_sent():
+    from flet import Container, padding
+
+    items = [Text("a")]
+    p = padding.only(left=10)
+    col = Column(controls=items)
+    box = Container(padding=p)
+    root = Column(controls=[col, box])
+    _mount(root)
+    root.build_update_commands({}, [], [])
+
+    items.append(Text("b"))
+    p.left = 20
+    commands = []
+    root.build_update_commands({}, [], commands)
+    assert [c.name for c in commands] == ["add", "set"]
+    assert commands[0].attrs == {"to": col.uid, "at": "1"}
+    assert '"l":20' in commands[1].attrs["padding"].replace(" ", "")
+
+    commands = []
+    root.build_update_commands({}, [], commands)
+    assert commands == []
+
+
+def test_validation_can_be_disabled():
+    from flet.control import _is_validated, set_validation
+
+    def setter():
+        # the setter is wrapped to track changes
+        return Text.__dict__["size"].fset.__wrapped__
+
+    validated = Text._Control__members["size"].fset
+    assert _is_validated(validated)
+    assert setter() is validated
+
+    set_validation(False)
+    try:
+        # validating wrappers are replaced with undecorated setters
+        assert setter() is validated.__wrapped__
+        assert not _is_validated(setter())
+    finally:
+        set_validation(True)
+    assert setter() is validated
+
+
+def test_disable_validation():
+    from beartype.roar import BeartypeCallHintParamViolation
+
+    from flet.control import set_validation
+
+    with pytest.raises(BeartypeCallHintParamViolation):
+        Text(size="large")
+
+    set_validation(False)
+    try:
+        t = Text(size="large")
+        assert t.size == "large"
+        t.expand = "yes"
+        assert t.expand == "yes"
+    finally:
+        set_validation(True)
+
+    with pytest.raises(BeartypeCallHintParamViolation):
+        Text(expand="yes")
+
+
+def test_page_update_sends_controls_appended_after_update(fake_conn, fake_page):
+    from flet import ListView
+
+    conn, page = fake_conn, fake_page
+    page.add(Text("h"))
+    lv = ListView()
+    page.add(lv)
+    conn.batches.clear()
+
+    lv.controls.append(Text("x"))
+    page.update()
+    assert [(c.name, c.attrs) for c in conn.batches[-1]] == [
+        ("add", {"to": lv.uid, "at": "0"})
+    ]
+
+    t = Text("a")
+    col = Column()
+    page.add(col)
+    col.controls.append(t)
+    page.update()
+    conn.batches.clear()
+
+    # appended control is attached to the page and its changes are tracked
+    t.value = "b"
+    t.update()
+    page.update()
+    assert [(c.name, c.values, c.attrs) for c in conn.batches[0]] == [
+        ("set", [t.uid], {"value": "b"})
+    ]
+    assert len(conn.batches) == 1
+
+
+def test_page_update_adopts_controls_with_same_key(fake_conn, fake_page):
+    conn, page = fake_conn, fake_page
+    mounted = []
+
+    class MountedText(Text):
+        def did_mount(self):
+            mounted.append(self)
+
+    old = MountedText("a", key="a")
+    page.add(old)
+    conn.batches.clear()
+    mounted.clear()
+
+    new, added = MountedText("a2", key="a"), MountedText("b")
+    page.controls[:] = [new, added]
+    page.update()
+
+    assert [(c.name, c.values) for c in conn.batches[0]] == [
+        ("set", [old.uid]),
+        ("add", []),
+    ]
+    assert new.uid == old.uid and added.uid not in (None, old.uid)
+    assert page.index[new.uid] is new and page.index[added.uid] is added
+    assert new.page is page and added.page is page
+    assert mounted == [new, added]
+
+
+def test_dropdown_options_are_reconciled_by_key():
+    from flet import Dropdown, NavigationRailDestination, Tab, dropdown
+
+    assert Tab(key="t").key == "t"
+    assert NavigationRailDestination(key="d").key == "d"
+
+    dd = Dropdown(options=[dropdown.Option("a"), dropdown.Option("b")])
+    _mount(dd)
+    old_a, old_b = dd.options
+
+    dd.options = [dropdown.Option("b", text="B")]
+    commands = []
+    dd.build_update_commands({}, [], commands)
+    assert commands == [
+        Command(0, "remove", [old_a.uid]),
+        Command(0, "set", [old_b.uid], {"text": "B"}),
+    ]
@@ -0,0 +1,54 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+# isort: split
+
+from flet.downsample import lttb, min_max  # noqa: E402
+
+
+def _lttb_reference(x, y, threshold):
+    # straightforward LTTB with the same buckets
+    n = len(y)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    selected = [0]
+    a = 0
+    for i in range(threshold - 2):
+        if i + 1 < threshold - 2:
+            next_bucket = slice(edges[i + 1], edges[i + 2])
+            avg_x, avg_y = x[next_bucket].mean(), y[next_bucket].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+        best = max(
+            range(edges[i], edges[i + 1]),
+            key=lambda j: abs(
+                (x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a])
+            ),
+        )
+        selected.append(best)
+        a = best
+    selected.append(n - 1)
+    return selected
+
+
+def test_lttb():
+    rng = np.random.default_rng(1)
+    x = np.arange(5000.0)
+    y = rng.random(5000)
+    rx, ry = lttb(x, y, 100)
+    assert len(rx) == 100
+    assert list(rx.astype(int)) == _lttb_reference(x, y, 100)
+    assert list(ry) == list(y[rx.astype(int)])
+
+
+def test_min_max():
+    x = np.arange(8.0)
+    y = np.array([5, 1, 3, 9, 2, 2, 8, 0.0])
+    rx, ry = min_max(x, y, 2)
+    assert list(rx) == [1, 3, 6, 7]
+    assert list(ry) == [1, 9, 8, 0]
+
+
+def test_short_series_is_not_reduced():
+    x, y = np.arange(10.0), np.arange(10.0)
+    assert len(lttb(x, y, 100)[0]) == 10
+    assert len(min_max(x, y, 5)[0]) == 10
@@ -0,0 +1,33 @@
+import json
+
+from flet import LinearGradient, border, padding
+from flet.embed_json_encoder import EmbedJsonEncoder, embed_json_dumps
+
+
+def _dumps(value):
+    return json.dumps(value, cls=EmbedJsonEncoder, separators=(",", ":"))
+
+
+def test_cached_json_matches_encoder():
+    for value in [
+        padding.all(10),
+        padding.only(left=1.0, top=True),
+        border.all(1, "red"),
+        LinearGradient(colors=["red", "blue"]),
+        {"Roboto": "fonts/roboto.ttf"},
+        5,
+    ]:
+        assert embed_json_dumps(value) == _dumps(value)
+        assert embed_json_dumps(value) == _dumps(value)
+
+
+def test_cached_json_changes_with_value():
+    g = LinearGradient(colors=["red", "blue"])
+    assert embed_json_dumps(g) == _dumps(g)
+    g.colors.append("green")
+    assert "green" in embed_json_dumps(g)
+
+    p = padding.all(1)
+    assert embed_json_dumps(p) == '{"l":1,"t":1,"r":1,"b":1}'
+    p.left = 1.0
+    assert embed_json_dumps(p) == '{"l":1.0,"t":1,"r":1,"b":1}'
@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import time
+
+from flet.event_dispatcher import AsyncEventDispatcher, EventDispatcher, EventMailbox
+
+
+def test_events_of_same_key_run_in_order():
+    dispatcher = EventDispatcher(max_workers=4)
+    results = {"a": [], "b": []}
+    done = threading.Event()
+    b_done = threading.Event()
+    release = threading.Event()
+
+    def handler(key, n):
+        if key == "a" and n == 0:
+            release.wait()
+        results[key].append(n)
+        if len(results["b"]) == 100:
+            b_done.set()
+        if len(results["a"]) == 100 and len(results["b"]) == 100:
+            done.set()
+
+    for n in range(100):
+        dispatcher.dispatch("a", handler, "a", n)
+        dispatcher.dispatch("b", handler, "b", n)
+
+    # "b" is not blocked by a slow handler of "a"
+    assert b_done.wait(5)
+    assert dispatcher.queue_depth == 99
+    release.set()
+
+    assert done.wait(5)
+    assert results["a"] == list(range(100))
+    assert results["b"] == list(range(100))
+    dispatcher.shutdown()
+
+    metrics = dispatcher.get_metrics()
+    assert metrics["queue_depth"] == 0
+    assert metrics["processed"] == 200
+    assert metrics["max_queue_depth"] >= 100
+
+
+def test_handler_error_does_not_stop_queue():
+    dispatcher = EventDispatcher(max_workers=1)
+    results = []
+
+    def fail():
+        raise ValueError("error")
+
+    dispatcher.dispatch("a", fail)
+    dispatcher.dispatch("a", results.append, 1)
+    dispatcher.shutdown()
+    assert results == [1]
+
+
+def test_busy_handler_gets_latest_event_only():
+    dispatcher = EventDispatcher(max_workers=1)
+    mailbox = EventMailbox()
+    release = threading.Event()
+    results = []
+
+    def handler(n):
+        if n == 0:
+            release.wait()
+        results.append(n)
+
+    for n in range(10):
+        dispatcher.dispatch("a", handler, n, mailbox=mailbox)
+    release.set()
+    dispatcher.shutdown()
+
+    assert results == [0, 9]
+    assert dispatcher.get_metrics()["coalesced"] == 8
+
+
+def test_throttled_event():
+    dispatcher = EventDispatcher(max_workers=1)
+    mailbox = EventMailbox(throttle_ms=100)
+    done = threading.Event()
+    results = []
+
+    def handler(n):
+        results.append(n)
+        if n == 4:
+            done.set()
+
+    for n in range(5):
+        dispatcher.dispatch("a", handler, n, mailbox=mailbox)
+        time.sleep(0.01)
+
+    assert done.wait(5)
+    assert results == [0, 4]
+    dispatcher.shutdown()
+
+
+def test_control_event_policy():
+    from flet import Slider, Text
+
+    assert Slider()._get_event_mailbox("change") is not None
+    assert Slider()._get_event_mailbox("focus") is None
+
+    s = Slider()
+    s.set_event_policy("change", coalesce=False)
+    assert s._get_event_mailbox("change") is None
+
+    t = Text()
+    t.set_event_policy("click", throttle_ms=50)
+    assert t._get_event_mailbox("click").throttle_ms == 50
+
+
+def test_async_events_of_same_key_run_in_order():
+    async def main():
+        dispatcher = AsyncEventDispatcher()
+        mailbox = EventMailbox()
+        release = asyncio.Event()
+        results = {"a": [], "b": []}
+
+        async def handler(key, n):
+            if key == "a" and n == 0:
+                await release.wait()
+            results[key].append(n)
+
+        for n in range(10):
+            dispatcher.dispatch("a", handler, "a", n)
+            dispatcher.dispatch("b", handler, "b", n)
+        # waiting "resize" events of "a" are coalesced
+        for n in range(10, 20):
+            dispatcher.dispatch("a", handler, "a", n, mailbox=mailbox)
+
+        await asyncio.sleep(0.01)
+        # "b" is not blocked by a slow handler of "a"
+        assert results == {"a": [], "b": list(range(10))}
+        release.set()
+        await asyncio.sleep(0.01)
+        assert results["a"] == list(range(10)) + [19]
+        assert dispatcher.get_metrics()["coalesced"] == 9
+        assert dispatcher.queue_depth == 0
+        await dispatcher.shutdown()
+
+    asyncio.run(main())
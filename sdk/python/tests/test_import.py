@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+
+import flet
+
+# modules "import flet" must not import; most apps don't need them
+HEAVY_MODULES = [
+    "flet.auth.authorization",
+    "flet.hot_reload",
+    "flet.icons",
+    "flet.matplotlib_chart",
+    "flet.plotly_chart",
+    "oauthlib",
+    "pkg_resources",
+    "requests",
+    "tarfile",
+    "watchdog",
+]
+
+
+def test_import_flet_is_lazy():
+    code = (
+        "import sys, flet\n"
+        f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    loaded = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.dirname(__file__)),
+    ).stdout.split()
+    assert loaded == []
+
+
+def test_lazy_names():
+    for name, module in flet._lazy_names.items():
+        value = getattr(flet, name)
+        assert value.__module__ == module or sys.modules[module].__dict__[name] is value
+    assert flet.icons.ADD == "add"
+    assert callable(flet.page) and callable(flet.app)
@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+from flet import ButtonStyle, Column, LinearGradient, Text, border, json_codec, padding
+from flet.embed_json_encoder import EmbedJsonEncoder
+from flet.protocol import (
+    Command,
+    CommandEncoder,
+    Message,
+    PageCommandsBatchRequestPayload,
+    decode_message,
+    encode_message,
+)
+
+
+@pytest.fixture(params=["json", "orjson", "msgspec"])
+def backend(request):
+    pytest.importorskip(request.param)
+    prev = json_codec.get_backend()
+    json_codec.set_backend(request.param)
+    yield request.param
+    json_codec.set_backend(prev)
+
+
+def _add_message():
+    col = Column(controls=[Text(f"item {i}", size=i) for i in range(50)])
+    col.controls.append(Text('Привет, "мир"\n', color="#1e5f00"))
+    added_controls = []
+    commands = col._build_add_commands(index={}, added_controls=added_controls)
+    cmd = Command(0, "add", [], {"to": "page", "at": "0"}, commands)
+    return Message(
+        "1",
+        "pageCommandsBatchFromHost",
+        PageCommandsBatchRequestPayload("page", "s1", [cmd]),
+    )
+
+
+def test_message_matches_stdlib(backend):
+    msg = _add_message()
+    expected = json.dumps(msg, cls=CommandEncoder, separators=(",", ":"))
+    encoded = encode_message(msg)
+    assert json.loads(encoded) == json.loads(expected)
+    if backend == "json":
+        assert encoded == expected
+    else:
+        # fast backends keep UTF-8 instead of escaping it
+        assert 'Привет, \\"мир\\"\\n' in encoded
+
+
+def test_value_objects_match_stdlib(backend):
+    from flet.embed_json_encoder import _json_cache, embed_json_dumps
+
+    for value in [
+        padding.only(left=1.0, top=1e-7, right=1e16),
+        border.all(1, "red"),
+        LinearGradient(colors=["red", "blue"], stops=[0.1, 0.9]),
+        ButtonStyle(color="green"),
+        {1: "int key", "big": 2**70},
+    ]:
+        _json_cache.clear()
+        expected = json.dumps(value, cls=EmbedJsonEncoder, separators=(",", ":"))
+        assert json.loads(embed_json_dumps(value)) == json.loads(expected)
+
+
+def test_decode_message(backend):
+    msg = decode_message('{"id":"2","action":"pageEventToHost","payload":{"a":"ü"}}')
+    assert msg == Message("2", "pageEventToHost", {"a": "ü"})
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        json_codec.set_backend("yaml")
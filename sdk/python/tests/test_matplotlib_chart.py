@@ -0,0 +1,70 @@
+import pytest
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("svg")
+# isort: split
+
+from matplotlib.figure import Figure  # noqa: E402
+
+from flet.matplotlib_chart import MatplotlibChart  # noqa: E402
+
+
+def _chart():
+    fig = Figure()
+    ax = fig.subplots()
+    (line,) = ax.plot([1, 2, 3], [1, 4, 9])
+    renders = []
+    savefig = fig.savefig
+    fig.savefig = lambda *args, **kwargs: (renders.append(1), savefig(*args, **kwargs))
+    chart = MatplotlibChart(fig)
+    chart._build_add_commands()
+    return chart, line, renders
+
+
+def test_figure_is_rendered_once():
+    chart, _, renders = _chart()
+    assert len(renders) == 1
+
+    chart._before_build_command()
+    assert len(renders) == 1
+
+
+def test_changed_figure_is_rendered():
+    chart, line, renders = _chart()
+    line.set_ydata([3, 2, 1])
+    chart._before_build_command()
+    assert len(renders) == 2
+
+    chart.figure.set_size_inches(3, 2)
+    chart._before_build_command()
+    assert len(renders) == 3
+
+
+def test_invalidate():
+    chart, line, renders = _chart()
+    line.get_ydata()[0] = 5  # in place, the figure doesn't know
+    chart._before_build_command()
+    assert len(renders) == 1
+
+    chart.invalidate()
+    assert chart._Control__subtree_dirty
+    chart._before_build_command()
+    assert len(renders) == 2
+
+
+def test_changed_figure_marks_chart_dirty():
+    chart, line, _ = _chart()
+    chart._Control__uid = "_1"
+    chart.build_update_commands({}, [], [])
+    assert not chart._Control__subtree_dirty
+
+    line.set_ydata([3, 2, 1])
+    assert chart._Control__subtree_dirty
+
+    # the chart no longer tracks a replaced figure
+    chart._before_build_command()
+    chart._Control__subtree_dirty = False
+    chart.figure = Figure()
+    chart._Control__subtree_dirty = False
+    line.set_ydata([1, 2, 3])
+    assert not chart._Control__subtree_dirty
@@ -0,0 +1,245 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from flet import Text
+from flet.event import Event
+
+
+def test_update_async(fake_conn, fake_page):
+    async def main():
+        conn, page = fake_conn, fake_page
+        t = Text("a")
+        await page.add_async(t)
+        assert t.uid is not None
+
+        t.value = "b"
+        await t.update_async()
+        assert conn.batches[-1][0].attrs == {"value": "b"}
+
+    asyncio.run(main())
+
+
+def test_coroutine_and_sync_handlers(fake_conn, fake_page):
+    async def main():
+        conn, page = fake_conn, fake_page
+        t = Text("a")
+        page.add(t)
+
+        threads = []
+
+        async def on_async(e):
+            threads.append(threading.get_ident())
+            async with page.batch_async():
+                t.value = "async"
+                await t.update_async()
+                t.size = 10
+                await t.update_async()
+
+        def on_sync(e):
+            threads.append(threading.get_ident())
+            t.value = "sync"
+            t.update()
+
+        conn.batches.clear()
+        t._add_event_handler("click", on_async)
+        await page.on_event_async(Event(t.uid, "click", ""))
+        assert len(conn.batches) == 1
+        assert conn.batches[0][0].attrs == {"value": "async", "size": "10"}
+
+        t._add_event_handler("click", on_sync)
+        await page.on_event_async(Event(t.uid, "click", ""))
+        assert conn.batches[1][0].attrs == {"value": "sync"}
+
+        # coroutine handlers run on the loop, sync ones in worker threads
+        assert threads[0] == threading.get_ident()
+        assert threads[1] != threading.get_ident()
+
+    asyncio.run(main())
+
+
+def test_loop_does_not_block_on_page_lock(fake_conn, fake_page):
+    send_commands = fake_conn.send_commands
+    done = []
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        t = Text("a")
+        fake_page.add(t)
+
+        def send_commands_on_loop(session_id, commands):
+            # sync calls of AsyncConnection are sent by the event loop
+            async def send():
+                await asyncio.sleep(0.05)
+                return send_commands(session_id, commands)
+
+            return asyncio.run_coroutine_threadsafe(send(), loop).result(timeout=2)
+
+        async def send_commands_async(session_id, commands):
+            return send_commands(session_id, commands)
+
+        fake_conn.send_commands = send_commands_on_loop
+        fake_conn.send_commands_async = send_commands_async
+
+        def on_sync():
+            t.value = "sync"
+            t.update()
+
+        # the handler holds the page lock while its update is sent
+        handler = loop.run_in_executor(None, on_sync)
+        await asyncio.sleep(0.01)
+        t.size = 10
+        await t.update_async()
+        await handler
+        done.append(True)
+
+    # a blocked loop times out sending the handler's update
+    th = threading.Thread(target=asyncio.run, args=(main(),), daemon=True)
+    th.start()
+    th.join(5)
+    assert done == [True]
+    assert fake_conn.batches[-1][0].attrs == {"size": "10"}
+
+
+def test_run_task(fake_conn, fake_page):
+    with pytest.raises(Exception, match="run_thread"):
+        fake_page.run_task(asyncio.sleep, 0)
+
+    async def main():
+        fake_conn._loop = asyncio.get_running_loop()
+        stop = asyncio.Event()
+
+        async def loop():
+            await stop.wait()
+            return "stopped"
+
+        # the task runs outside of the event handler
+        fut = fake_page.run_task(loop)
+        await asyncio.sleep(0.01)
+        assert not fut.done()
+        stop.set()
+        return await asyncio.wrap_future(fut)
+
+    assert asyncio.run(main()) == "stopped"
+
+
+def test_async_connection():
+    websockets = pytest.importorskip("websockets")
+    from flet.async_connection import AsyncConnection
+    from flet.protocol import Command
+
+    async def handler(ws):
+        async for data in ws:
+            msg = json.loads(data)
+            await ws.send(
+                json.dumps(
+                    {
+                        "id": msg["id"],
+                        "action": "",
+                        "payload": {"results": ["ok"], "error": ""},
+                    }
+                )
+            )
+
+    async def main():
+        async with websockets.serve(handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            conn = AsyncConnection(f"ws://127.0.0.1:{port}")
+            conn.page_name = "test"
+            await conn.connect()
+
+            result = await conn.send_commands_async("0", [Command(0, "get", [])])
+            assert result.results == ["ok"]
+
+            # sync calls are allowed from worker threads only
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                None, conn.send_commands, "0", [Command(0, "get", [])]
+            )
+            assert result.results == ["ok"]
+            with pytest.raises(RuntimeError):
+                conn.send_commands("0", [Command(0, "get", [])])
+
+            await conn.close_async()
+
+    asyncio.run(main())
+
+
+def test_async_connection_compression_threshold():
+    websockets = pytest.importorskip("websockets")
+    from websockets.frames import Frame, Opcode
+
+    from flet.async_connection import AsyncConnection, _ThresholdDeflateFactory
+    from flet.protocol import Command
+
+    deflate = _ThresholdDeflateFactory(100).process_response_params([], [])
+    small = deflate.encode(Frame(Opcode.TEXT, b"x" * 99))
+    large = deflate.encode(Frame(Opcode.TEXT, b"x" * 100))
+    assert not small.rsv1 and small.data == b"x" * 99
+    assert large.rsv1 and len(large.data) < 100
+
+    received = []
+
+    async def handler(ws):
+        async for data in ws:
+            received.append(data)
+            msg = json.loads(data)
+            await ws.send(
+                json.dumps(
+                    {
+                        "id": msg["id"],
+                        "action": "",
+                        "payload": {"results": ["ok"], "error": ""},
+                    }
+                )
+            )
+
+    async def main():
+        async with websockets.serve(handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            conn = AsyncConnection(f"ws://127.0.0.1:{port}", compression_threshold=100)
+            conn.page_name = "test"
+            await conn.connect()
+            for value in ["a", "a" * 1000]:
+                await conn.send_commands_async("0", [Command(0, "get", [value])])
+            await conn.close_async()
+
+    asyncio.run(main())
+    assert [json.loads(m)["payload"]["commands"][0]["v"] for m in received] == [
+        ["a"],
+        ["a" * 1000],
+    ]
+
+
+def test_async_connection_reconnects():
+    websockets = pytest.importorskip("websockets")
+    from flet.async_connection import AsyncConnection
+
+    connections = []
+
+    async def handler(ws):
+        connections.append(ws)
+        if len(connections) == 1:
+            await ws.close()
+            return
+        await ws.wait_closed()
+
+    async def main():
+        async with websockets.serve(handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            conn = AsyncConnection(f"ws://127.0.0.1:{port}")
+            reconnected = asyncio.Event()
+
+            async def on_connect():
+                reconnected.set()
+
+            conn.on_connect = on_connect
+            await conn.connect()
+            await asyncio.wait_for(reconnected.wait(), 5)
+            assert len(connections) == 2
+
+            await conn.close_async()
+
+    asyncio.run(main())
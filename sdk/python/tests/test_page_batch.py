@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from flet import Column, Text
+
+
+def test_batch_sends_single_message(fake_conn, fake_page):
+    conn, page = fake_conn, fake_page
+    t1 = Text("a")
+    t2 = Text("b")
+    page.add(Column(controls=[t1, t2]))
+    conn.batches.clear()
+
+    with page.batch():
+        t1.value = "a1"
+        t1.update()
+        t2.value = "b1"
+        t2.update()
+        t1.size = 20
+        t1.update()
+        page.update()
+        assert conn.batches == []
+
+    assert len(conn.batches) == 1
+    assert [(c.name, c.values, c.attrs) for c in conn.batches[0]] == [
+        ("set", [t1.uid], {"value": "a1", "size": "20"}),
+        ("set", [t2.uid], {"value": "b1"}),
+    ]
+
+
+def test_auto_batch_flushes_per_handler(fake_conn, fake_page):
+    conn, page = fake_conn, fake_page
+    t1 = Text("a")
+    t2 = Text("b")
+    page.add(t1, t2)
+    conn.batches.clear()
+
+    def handler(e):
+        t1.value = "a1"
+        t1.update()
+        t2.value = "b1"
+        t2.update()
+
+    page.auto_batch = True
+    page._Page__run_event_handler(handler, None)
+    assert len(conn.batches) == 1
+    assert len(conn.batches[0]) == 2
+
+
+def test_update_of_control_added_in_batch(fake_conn, fake_page):
+    t = Text("a")
+    with fake_page.batch():
+        fake_page.add(t)
+        t.value = "b"
+        t.update()
+
+    assert len(fake_conn.batches) == 1
+    assert fake_conn.batches[0][0].commands[-1].attrs == {"value": "b"}
+    assert t.uid is not None
+
+
+def test_update_of_control_not_added_in_batch(fake_conn, fake_page):
+    with pytest.raises(Exception, match="must be added to the page"):
+        with fake_page.batch():
+            Text("a").update()
+
+
+def test_update_async_of_control_added_in_batch(fake_conn, fake_page):
+    async def main():
+        t = Text("a")
+        async with fake_page.batch_async():
+            await fake_page.add_async(t)
+            await t.update_async()
+        assert len(fake_conn.batches) == 1
+        assert t.uid is not None
+
+    asyncio.run(main())
@@ -0,0 +1,100 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("plotly")
+# isort: split
+
+import plotly.graph_objects as go  # noqa: E402
+
+from flet import Image, ProgressRing, plotly_chart  # noqa: E402
+from flet.plotly_chart import PlotlyChart  # noqa: E402
+
+SVG = '<svg width="200px" height="100px"></svg>'
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    pool = ThreadPoolExecutor()
+    renders = []
+
+    def render(figure_json):
+        event = threading.Event()
+        renders.append(event)
+        assert event.wait(5)
+        return SVG
+
+    monkeypatch.setattr(plotly_chart, "_get_render_pool", lambda: pool)
+    monkeypatch.setattr(plotly_chart, "_render_svg", render)
+    yield renders
+    for event in renders:
+        event.set()
+    pool.shutdown()
+
+
+def _wait(predicate):
+    for _ in range(500):
+        if predicate():
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError("timed out")
+
+
+def test_chart_is_rendered_in_background(renders):
+    chart = PlotlyChart(go.Figure(go.Bar(y=[1, 2, 3])))
+    chart._build_add_commands()
+    assert isinstance(chart.content, ProgressRing)
+
+    _wait(lambda: len(renders) == 1)
+    renders[0].set()
+    _wait(lambda: isinstance(chart.content, Image))
+    assert chart.content.src == SVG
+    assert chart.content.aspect_ratio == 2
+
+    # unchanged figure is not rendered again
+    chart._before_build_command()
+    assert len(renders) == 1
+
+
+def test_outdated_render_is_dropped(renders):
+    chart = PlotlyChart(go.Figure(go.Bar(y=[1, 2, 3])))
+    chart._build_add_commands()
+    _wait(lambda: len(renders) == 1)
+
+    chart.figure = go.Figure(go.Bar(y=[3, 2, 1]))
+    chart._before_build_command()
+    _wait(lambda: len(renders) == 2)
+
+    renders[0].set()
+    threading.Event().wait(0.05)
+    assert isinstance(chart.content, ProgressRing)
+
+    renders[1].set()
+    _wait(lambda: isinstance(chart.content, Image))
+
+
+def test_figure_is_serialized_after_changes_only(renders, monkeypatch):
+    figure = go.Figure(go.Bar(y=[1, 2, 3]))
+    to_json = figure.to_json
+    calls = []
+    monkeypatch.setattr(figure, "to_json", lambda: calls.append(1) or to_json())
+
+    chart = PlotlyChart(figure)
+    chart._build_add_commands()
+    chart._build_command(update=True)
+    chart._Control__subtree_dirty = False
+    chart._before_build_command()
+    assert len(calls) == 1
+
+    figure.update_layout(title="changed")
+    assert chart._Control__subtree_dirty
+    chart._before_build_command()
+    assert len(calls) == 2
+    _wait(lambda: len(renders) == 2)
+
+    # changes of the previous figure are not tracked
+    chart.figure = None
+    chart._Control__subtree_dirty = False
+    figure.update_layout(title="again")
+    assert not chart._Control__subtree_dirty
@@ -0,0 +1,58 @@
+import asyncio
+import threading
+import zlib
+
+import pytest
+import websocket
+
+from flet.reconnecting_websocket import ReconnectingWebSocket
+
+
+def test_deflate_frame():
+    message = '{"action":"pageCommandsBatchFromHost"}' * 100
+    frame = ReconnectingWebSocket._deflate_frame(message, websocket.ABNF.OPCODE_TEXT)
+
+    assert frame.rsv1 == 1
+    assert len(frame.data) < len(message)
+    d = zlib.decompressobj(wbits=-zlib.MAX_WBITS)
+    assert d.decompress(frame.data + b"\x00\x00\xff\xff").decode() == message
+
+
+def test_compressed_messages_to_server():
+    websockets = pytest.importorskip("websockets")
+    received = []
+    done = threading.Event()
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    port = []
+
+    async def handler(ws, *args):
+        async for message in ws:
+            received.append(message)
+            if len(received) == 2:
+                done.set()
+
+    async def serve():
+        server = await websockets.serve(handler, "127.0.0.1", 0)
+        port.append(server.sockets[0].getsockname()[1])
+        started.set()
+        await server.wait_closed()
+
+    th = threading.Thread(target=loop.run_until_complete, args=(serve(),))
+    th.daemon = True
+    th.start()
+    assert started.wait(5)
+
+    ws = ReconnectingWebSocket(f"ws://127.0.0.1:{port[0]}", compression_threshold=100)
+    ws.connect()
+    try:
+        assert ws.connected.wait(5)
+        assert ws._deflate
+
+        large = "x" * 1000
+        ws.send("small")
+        ws.send(large)
+        assert done.wait(5)
+        assert received == ["small", large]
+    finally:
+        ws.close()
@@ -0,0 +1,58 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+# isort: split
+
+from flet import SeriesChart  # noqa: E402
+from flet.control_event import ControlEvent  # noqa: E402
+
+
+def _points(chart):
+    return [float(v) for v in chart._get_attr("points").split()]
+
+
+def test_series_is_downsampled_to_width():
+    chart = SeriesChart(np.sin(np.arange(1_000_000) / 100), width=300)
+    cmd = chart._build_add_commands()[0]
+    assert len(cmd.attrs["points"].split()) == 2 * 300
+    assert cmd.attrs["minx"] == "0.0"
+    assert cmd.attrs["maxx"] == "999999.0"
+
+
+def test_resize_and_zoom(monkeypatch):
+    chart = SeriesChart(np.arange(100_000.0), method="minmax")
+    chart._build_add_commands()
+    chart._Control__uid = "_1"
+    monkeypatch.setattr(chart, "update", lambda: None)
+
+    chart._get_event_handler("resize")(ControlEvent("_1", "resize", "50", chart, None))
+    assert chart.pixel_width == 50
+    chart._before_build_command()
+    assert len(_points(chart)) == 2 * 100
+
+    chart.x_range = (1000.5, 1999.5)
+    chart._before_build_command()
+    x = _points(chart)[0::2]
+    # one point on each side of the range
+    assert x[0] == 1000 and x[-1] == 2000
+    assert chart._get_attr("minX") == 1000.5
+
+
+def test_unchanged_series_is_not_resent():
+    chart = SeriesChart([1, 2, 3])
+    chart._build_add_commands()
+    chart._Control__uid = "_1"
+    assert chart._build_command(update=True).attrs == {}
+
+
+def test_changes_mark_chart_dirty():
+    chart = SeriesChart([1, 2, 3])
+    chart._build_add_commands()
+    for name, value in [("method", "minmax"), ("x_range", (0, 1))]:
+        chart._build_command(update=True)
+        chart._Control__subtree_dirty = False
+        type(chart).__dict__[name].fset.__wrapped__(chart, value)
+        assert chart._Control__subtree_dirty
+
+    # only the latest of resize events arrived while busy is handled
+    assert chart._get_event_mailbox("resize") is not None
@@ -0,0 +1,44 @@
+from flet.page import Page
+
+
+def test_page_details_from_session_created(fake_conn):
+    conn = fake_conn
+    page = Page(
+        conn,
+        "session1",
+        {"route": "/store", "web": "true", "width": "800", "height": "600"},
+    )
+    assert conn.batches == []
+    assert page.route == "/store"
+    assert page.web
+    assert page.width == 800
+    assert page.height == 600
+    assert page.window_width == 0
+
+
+def test_page_details_fetched_from_older_server(fake_conn):
+    conn = fake_conn
+    Page(conn, "session1")
+    assert len(conn.batches) == 1
+    assert [cmd.values[1] for cmd in conn.batches[0]] == [
+        "route",
+        "pwa",
+        "web",
+        "platform",
+        "width",
+        "height",
+        "windowWidth",
+        "windowHeight",
+        "windowTop",
+        "windowLeft",
+    ]
+
+
+def test_session_created_payload_page_details():
+    from flet.protocol import PageSessionCreatedPayload
+
+    assert PageSessionCreatedPayload("p", "s").pageDetails is None
+    payload = PageSessionCreatedPayload(
+        **{"pageName": "p", "sessionID": "s", "pageDetails": {"route": "/"}}
+    )
+    assert payload.pageDetails == {"route": "/"}
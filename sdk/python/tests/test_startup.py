@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+import time
+
+from flet import flet
+
+
+def test_wait_for_ready_file(tmp_path):
+    ready_file = str(tmp_path / "fletd.ready")
+    # stands for fletd writing the ready file once it listens
+    p = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import sys, time; time.sleep(0.2); open(sys.argv[1], 'w').write('1')",
+            ready_file,
+        ]
+    )
+    try:
+        started = time.monotonic()
+        flet._wait_flet_server(p, ready_file, 0)
+        elapsed = time.monotonic() - started
+    finally:
+        p.wait()
+    assert 0.15 < elapsed < 1
+    assert not os.path.exists(ready_file)
+
+
+def test_server_exited(tmp_path):
+    p = subprocess.Popen([sys.executable, "-c", "raise SystemExit(1)"])
+    started = time.monotonic()
+    flet._wait_flet_server(p, str(tmp_path / "fletd.ready"), 0)
+    assert time.monotonic() - started < 5
+
+
+def test_app_is_not_started_by_spawned_processes(tmp_path):
+    script = tmp_path / "app.py"
+    script.write_text(
+        """
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import flet
+from flet import flet as flet_module
+
+
+def connect(**kwargs):
+    print("app started in", multiprocessing.current_process().name)
+    raise SystemExit(0)
+
+
+flet_module._connect_internal = connect
+
+if __name__ == "__main__":
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(1, mp_context=context) as pool:
+        print("pid", pool.submit(os.getpid).result() != os.getpid())
+
+flet.app(target=print)
+"""
+    )
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(flet.__file__)))
+    out = subprocess.run(
+        [sys.executable, str(script)],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        env=env,
+    )
+    assert out.stdout.split("\n") == ["pid True", "app started in MainProcess", ""]
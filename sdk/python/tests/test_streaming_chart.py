@@ -0,0 +1,47 @@
+from flet import StreamingChart
+
+
+def _attrs(chart, update=True):
+    return chart._build_command(update=update).attrs
+
+
+def test_added_chart_sends_whole_series():
+    chart = StreamingChart([1, 2.5], capacity=3)
+    chart.append([3, 4])
+    cmd = chart._build_add_commands()[0]
+    assert cmd.attrs["data"] == "1 2.5 3 4"
+    assert "append" not in cmd.attrs
+    assert chart.values == [2.5, 3.0, 4.0]
+
+
+def test_append_sends_new_values_only():
+    chart = StreamingChart([1, 2], capacity=3)
+    chart._build_add_commands()
+    chart._Control__uid = "_1"
+
+    chart.append([3])
+    chart.append([float("nan"), 1 / 3])
+    assert _attrs(chart) == {"append": "2 3 nan 0.333333"}
+    assert _attrs(chart) == {}
+
+    # values which didn't fit the chart are not sent
+    chart.append(range(10, 15))
+    assert _attrs(chart) == {"append": "7 12 13 14"}
+
+
+def test_clear():
+    chart = StreamingChart([1, 2])
+    chart._build_add_commands()
+    chart._Control__uid = "_1"
+
+    chart.clear()
+    chart.append([3])
+    assert _attrs(chart) == {"data": "2", "append": "2 3"}
+
+
+def test_append_marks_chart_dirty():
+    chart = StreamingChart()
+    chart._build_add_commands()
+    assert not chart._Control__subtree_dirty
+    chart.append([1])
+    assert chart._Control__subtree_dirty
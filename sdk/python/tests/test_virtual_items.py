@@ -0,0 +1,80 @@
+from flet import GridView, ListView, Text
+from flet.control_event import ControlEvent
+from flet.protocol import Command
+from flet.virtual_items import VirtualItems
+
+
+def test_request_moves_bounded_window():
+    built = []
+
+    def build(i):
+        built.append(i)
+        return Text(str(i))
+
+    items = VirtualItems()
+    items.item_builder = build
+    items.item_count = 1_000_000
+    items.cache_size = 10
+
+    assert items.request(0, 3)
+    assert items.first_index == 0
+    assert [c.value for c in items.controls] == [str(i) for i in range(10)]
+
+    # overlapping items are reused
+    first_controls = items.controls
+    assert items.request(12, 13)
+    assert items.first_index == 8
+    assert items.controls[:2] == first_controls[8:]
+    assert built == list(range(18))
+
+    # same window
+    assert not items.request(12, 13)
+
+    # end of the list
+    assert items.request(999_999, 1_000_005)
+    assert items.first_index == 999_990
+    assert len(items.controls) == 10
+
+
+def test_list_view_sends_only_window():
+    lv = ListView(
+        item_count=1_000_000, item_builder=lambda i: Text(str(i)), item_cache_size=5
+    )
+    added_controls = []
+    commands = lv._build_add_commands(index={}, added_controls=added_controls)
+    for n, ctrl in enumerate(added_controls):
+        ctrl._Control__uid = f"_{n}"
+
+    assert commands[0].attrs["itemcount"] == "1000000"
+    assert commands[0].attrs["firstitemindex"] == "0"
+    assert len(lv._get_children()) == 5
+
+    lv.item_count = 3
+    commands = []
+    lv.build_update_commands({}, [], commands)
+    assert commands[0] == Command(0, "set", [lv.uid], {"itemcount": "3"})
+    assert commands[1] == Command(0, "remove", [c.uid for c in added_controls[4:]])
+
+
+def test_requested_items_are_loaded_on_build():
+    lv = GridView(
+        item_count=1000, item_builder=lambda i: Text(str(i)), item_cache_size=5
+    )
+    lv._build_add_commands(index={}, added_controls=[])
+    lv._Control__uid = "_0"
+    updated = []
+    lv.update = lambda: updated.append(True)
+
+    # the window is moved by the update, not by the event handler
+    lv._get_event_handler("request_items")(ControlEvent("_0", "", "500 501", lv, None))
+    assert updated == [True]
+    assert lv._get_children()[0].value == "0"
+
+    commands = []
+    lv.build_update_commands({}, [], commands)
+    assert commands[0] == Command(0, "set", ["_0"], {"firstitemindex": "499"})
+    assert [c.value for c in lv._get_children()] == [str(i) for i in range(499, 504)]
+
+    # the window already covers requested items
+    lv._get_event_handler("request_items")(ControlEvent("_0", "", "500 502", lv, None))
+    assert updated == [True]
@@ -0,0 +1,154 @@
+// Package blobs implements in-memory content-addressed store of binary
+// data (images, audio) uploaded by host clients and served to web clients
+// by their hash.
+package blobs
+
+import (
+	"crypto/sha256"
+	"encoding/base64"
+	"encoding/hex"
+	"fmt"
+	"sync"
+)
+
+// Store keeps blobs referenced by their owners (host clients). Owners evict
+// blobs themselves, so a blob URL sent by a host client is valid until the
+// client releases it, and a blob is deleted when no owner references it.
+type Store struct {
+	sync.Mutex
+	maxSize int // max total size of blobs of one owner
+	items   map[string][]byte
+	owners  map[string]*owner
+}
+
+type owner struct {
+	size   int
+	hashes map[string]bool
+}
+
+func NewStore(maxSize int) *Store {
+	return &Store{
+		maxSize: maxSize,
+		items:   make(map[string][]byte),
+		owners:  make(map[string]*owner),
+	}
+}
+
+// Hash returns hash of base64-encoded data under which it's stored.
+func Hash(dataBase64 string) string {
+	h := sha256.Sum256([]byte(dataBase64))
+	return hex.EncodeToString(h[:])
+}
+
+// PutBase64 stores base64-encoded data under its hash and adds it to
+// the blobs of the owner.
+func (s *Store) PutBase64(ownerID string, hash string, dataBase64 string) error {
+	if Hash(dataBase64) != hash {
+		return fmt.Errorf("blob hash mismatch: %s", hash)
+	}
+
+	s.Lock()
+	defer s.Unlock()
+
+	o := s.owners[ownerID]
+	if o != nil && o.hashes[hash] {
+		return nil
+	}
+
+	data, ok := s.items[hash]
+	if !ok {
+		var err error
+		data, err = base64.StdEncoding.DecodeString(dataBase64)
+		if err != nil {
+			return fmt.Errorf("error decoding blob %s: %s", hash, err)
+		}
+	}
+
+	size := len(data)
+	if o != nil {
+		size += o.size
+	}
+	if size > s.maxSize {
+		return fmt.Errorf("blobs of %s are larger than blob store (%d bytes)", ownerID, s.maxSize)
+	}
+
+	if o == nil {
+		o = &owner{hashes: make(map[string]bool)}
+		s.owners[ownerID] = o
+	}
+	o.hashes[hash] = true
+	o.size = size
+	s.items[hash] = data
+	return nil
+}
+
+// Release removes blobs from the blobs of the owner.
+func (s *Store) Release(ownerID string, hashes ...string) {
+	s.Lock()
+	defer s.Unlock()
+
+	o := s.owners[ownerID]
+	if o == nil {
+		return
+	}
+	for _, hash := range hashes {
+		if o.hashes[hash] {
+			delete(o.hashes, hash)
+			o.size -= len(s.items[hash])
+			s.deleteUnused(hash)
+		}
+	}
+	if len(o.hashes) == 0 {
+		delete(s.owners, ownerID)
+	}
+}
+
+// ReleaseAll removes all blobs of the owner.
+func (s *Store) ReleaseAll(ownerID string) {
+	s.Lock()
+	defer s.Unlock()
+
+	o := s.owners[ownerID]
+	if o == nil {
+		return
+	}
+	delete(s.owners, ownerID)
+	for hash := range o.hashes {
+		s.deleteUnused(hash)
+	}
+}
+
+func (s *Store) deleteUnused(hash string) {
+	for _, o := range s.owners {
+		if o.hashes[hash] {
+			return
+		}
+	}
+	delete(s.items, hash)
+}
+
+func (s *Store) Get(hash string) ([]byte, bool) {
+	s.Lock()
+	defer s.Unlock()
+
+	data, ok := s.items[hash]
+	return data, ok
+}
+
+// Size returns total size of stored blobs in bytes.
+func (s *Store) Size() int {
+	s.Lock()
+	defer s.Unlock()
+
+	size := 0
+	for _, data := range s.items {
+		size += len(data)
+	}
+	return size
+}
+
+func (s *Store) Len() int {
+	s.Lock()
+	defer s.Unlock()
+	return len(s.items)
+}
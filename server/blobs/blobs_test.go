@@ -0,0 +1,73 @@
+package blobs
+
+import (
+	"encoding/base64"
+	"testing"
+)
+
+func put(t *testing.T, s *Store, owner string, data string) string {
+	b64 := base64.StdEncoding.EncodeToString([]byte(data))
+	hash := Hash(b64)
+	if err := s.PutBase64(owner, hash, b64); err != nil {
+		t.Fatal(err)
+	}
+	return hash
+}
+
+func TestStoreKeepsBlobsUntilReleased(t *testing.T) {
+	s := NewStore(10)
+	a := put(t, s, "host1", "aaaa")
+	b := put(t, s, "host1", "bbbb")
+
+	// blobs of another owner don't evict blobs of host1
+	c := put(t, s, "host2", "cccc")
+	put(t, s, "host2", "bbbb")
+	for _, hash := range []string{a, b, c} {
+		if _, ok := s.Get(hash); !ok {
+			t.Errorf("Get: %s must not be evicted", hash)
+		}
+	}
+	if s.Size() != 12 || s.Len() != 3 {
+		t.Errorf("Size/Len: expected 12/3, actual %d/%d", s.Size(), s.Len())
+	}
+
+	// the same blob is stored once for an owner
+	put(t, s, "host1", "aaaa")
+
+	// the owner has to release blobs to store more of them
+	b64 := base64.StdEncoding.EncodeToString([]byte("eeee"))
+	if err := s.PutBase64("host1", Hash(b64), b64); err == nil {
+		t.Errorf("PutBase64: no error for blobs larger than store")
+	}
+	s.Release("host1", a, b)
+	if _, ok := s.Get(a); ok {
+		t.Errorf("Get: a must be deleted")
+	}
+	if data, ok := s.Get(b); !ok || string(data) != "bbbb" {
+		t.Errorf("Get: b is used by host2, actual %s", data)
+	}
+	put(t, s, "host1", "eeee")
+
+	s.ReleaseAll("host2")
+	if _, ok := s.Get(b); ok {
+		t.Errorf("Get: b must be deleted")
+	}
+	if s.Size() != 4 || s.Len() != 1 {
+		t.Errorf("Size/Len: expected 4/1, actual %d/%d", s.Size(), s.Len())
+	}
+}
+
+func TestStoreRejectsWrongHash(t *testing.T) {
+	s := NewStore(10)
+	b64 := base64.StdEncoding.EncodeToString([]byte("data"))
+	if err := s.PutBase64("host1", Hash("other"), b64); err == nil {
+		t.Errorf("PutBase64: no error for wrong hash")
+	}
+	if err := s.PutBase64("host1", Hash("!!"), "!!"); err == nil {
+		t.Errorf("PutBase64: no error for invalid base64")
+	}
+	big := base64.StdEncoding.EncodeToString([]byte("12345678901"))
+	if err := s.PutBase64("host1", Hash(big), big); err == nil {
+		t.Errorf("PutBase64: no error for blob larger than store")
+	}
+}
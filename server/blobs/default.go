@@ -0,0 +1,20 @@
+package blobs
+
+import (
+	"sync"
+
+	"github.com/flet-dev/flet/server/config"
+)
+
+var (
+	defaultStore     *Store
+	defaultStoreOnce sync.Once
+)
+
+// Default returns the store of blobs uploaded by host clients of the server.
+func Default() *Store {
+	defaultStoreOnce.Do(func() {
+		defaultStore = NewStore(config.BlobStoreSize())
+	})
+	return defaultStore
+}
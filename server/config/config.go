@@ -31,6 +31,12 @@ const (
 	forceSSL                       = "FORCE_SSL"
 	defaultWebSocketMaxMessageSize = 2097152 // 2 MB
 	wsMaxMessageSize               = "WS_MAX_MESSAGE_SIZE"
+	wsCompression                  = "WS_COMPRESSION"
+	defaultWsCompressionThreshold  = 1024
+	wsCompressionThreshold         = "WS_COMPRESSION_THRESHOLD"
+	defaultBlobStoreSize           = 64 * 1024 * 1024
+	blobStoreSize                  = "BLOB_STORE_SIZE"
+	readyFile                      = "READY_FILE"
 
 	// pages/sessions
 	defaultPageLifetimeMinutes = 1440
@@ -104,6 +110,9 @@ func init() {
 	viper.SetDefault(appURL, defaultAppURL)
 	viper.SetDefault(serverPort, defaultServerPort)
 	viper.SetDefault(wsMaxMessageSize, defaultWebSocketMaxMessageSize)
+	viper.SetDefault(wsCompression, true)
+	viper.SetDefault(wsCompressionThreshold, defaultWsCompressionThreshold)
+	viper.SetDefault(blobStoreSize, defaultBlobStoreSize)
 
 	// pages/sessions
 	viper.SetDefault(pageLifetimeMinutes, defaultPageLifetimeMinutes)
@@ -185,6 +194,25 @@ func MaxWebSocketMessageSize() int {
 	return viper.GetInt(wsMaxMessageSize)
 }
 
+func WebSocketCompression() bool {
+	return viper.GetBool(wsCompression)
+}
+
+// messages smaller than the threshold are sent uncompressed
+func WebSocketCompressionThreshold() int {
+	return viper.GetInt(wsCompressionThreshold)
+}
+
+// max total size of blobs uploaded by a host client, in bytes
+func BlobStoreSize() int {
+	return viper.GetInt(blobStoreSize)
+}
+
+// file the server writes its port to once it accepts connections
+func ReadyFile() string {
+	return viper.GetString(readyFile)
+}
+
 func ForceSSL() bool {
 	return viper.GetBool(forceSSL)
 }
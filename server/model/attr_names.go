@@ -0,0 +1,41 @@
+package model
+
+import (
+	"fmt"
+	"strconv"
+)
+
+// AttrNameTable resolves attribute names which a host client has
+// replaced with their indexes in a table it builds up with each request.
+// Attribute names never start with a digit, so a key starting with a digit
+// is an index.
+type AttrNameTable struct {
+	names []string
+}
+
+func (t *AttrNameTable) Add(names []string) {
+	t.names = append(t.names, names...)
+}
+
+func (t *AttrNameTable) Resolve(commands []*Command) error {
+	for _, cmd := range commands {
+		if cmd == nil {
+			continue
+		}
+		for k, v := range cmd.Attrs {
+			if len(k) == 0 || k[0] < '0' || k[0] > '9' {
+				continue
+			}
+			i, err := strconv.Atoi(k)
+			if err != nil || i >= len(t.names) {
+				return fmt.Errorf("unknown attribute name index: %s", k)
+			}
+			delete(cmd.Attrs, k)
+			cmd.Attrs[t.names[i]] = v
+		}
+		if err := t.Resolve(cmd.Commands); err != nil {
+			return err
+		}
+	}
+	return nil
+}
@@ -0,0 +1,41 @@
+package model
+
+import (
+	"reflect"
+	"testing"
+)
+
+func TestAttrNameTable(t *testing.T) {
+	table := &AttrNameTable{}
+	table.Add([]string{"borderradius", "focusedbordercolor"})
+
+	commands := []*Command{
+		{Name: "add", Attrs: map[string]string{"to": "page", "0": "10"}, Commands: []*Command{
+			{Name: "textfield", Attrs: map[string]string{"1": "red", "0": "5"}},
+		}},
+	}
+	if err := table.Resolve(commands); err != nil {
+		t.Fatal(err)
+	}
+
+	expected := []*Command{
+		{Name: "add", Attrs: map[string]string{"to": "page", "borderradius": "10"}, Commands: []*Command{
+			{Name: "textfield", Attrs: map[string]string{"focusedbordercolor": "red", "borderradius": "5"}},
+		}},
+	}
+	if !reflect.DeepEqual(commands, expected) {
+		t.Errorf("Resolve: expected %v, actual %v", expected, commands)
+	}
+
+	// names are added with the following requests
+	table.Add([]string{"animateopacity"})
+	commands = []*Command{{Name: "set", Attrs: map[string]string{"2": "300"}}}
+	table.Resolve(commands)
+	if commands[0].Attrs["animateopacity"] != "300" {
+		t.Errorf("Resolve: name added later was not resolved")
+	}
+
+	if err := table.Resolve([]*Command{{Attrs: map[string]string{"3": ""}}}); err == nil {
+		t.Errorf("Resolve: no error for unknown index")
+	}
+}
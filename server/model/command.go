@@ -13,9 +13,12 @@ const (
 	GetCommand            string = "get"
 	CleanCommand          string = "clean"
 	RemoveCommand         string = "remove"
+	MoveCommand           string = "move"
 	BeginCommand          string = "begin"
 	EndCommand            string = "end"
 	GetUploadUrlCommand   string = "getuploadurl"
+	PutBlobCommand        string = "putblob"
+	DelBlobCommand        string = "delblob"
 	OAuthAuthorizeCommand string = "oauthauthorize"
 	InvokeMethodCommand   string = "invokemethod"
 	CloseCommand          string = "close"
@@ -31,11 +34,14 @@ var (
 		GetCommand:            {Name: GetCommand, ShouldReturn: true},
 		CleanCommand:          {Name: CleanCommand, ShouldReturn: true},
 		RemoveCommand:         {Name: RemoveCommand, ShouldReturn: true},
+		MoveCommand:           {Name: MoveCommand, ShouldReturn: true},
 		BeginCommand:          {Name: BeginCommand, ShouldReturn: false},
 		EndCommand:            {Name: EndCommand, ShouldReturn: true},
 		OAuthAuthorizeCommand: {Name: OAuthAuthorizeCommand, ShouldReturn: true},
 		InvokeMethodCommand:   {Name: InvokeMethodCommand, ShouldReturn: true},
 		GetUploadUrlCommand:   {Name: GetUploadUrlCommand, ShouldReturn: true},
+		PutBlobCommand:        {Name: PutBlobCommand, ShouldReturn: true},
+		DelBlobCommand:        {Name: DelBlobCommand, ShouldReturn: true},
 		CloseCommand:          {Name: CloseCommand, ShouldReturn: false},
 		ErrorCommand:          {Name: ErrorCommand, ShouldReturn: false},
 	}
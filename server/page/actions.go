@@ -34,6 +34,8 @@ const (
 
 	RemoveControlAction = "removeControl"
 
+	MoveControlAction = "moveControl"
+
 	CleanControlAction = "cleanControl"
 
 	PageControlsBatchAction = "pageControlsBatch"
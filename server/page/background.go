@@ -6,6 +6,7 @@ import (
 
 	log "github.com/sirupsen/logrus"
 
+	"github.com/flet-dev/flet/server/blobs"
 	"github.com/flet-dev/flet/server/model"
 	"github.com/flet-dev/flet/server/pubsub"
 	"github.com/flet-dev/flet/server/store"
@@ -75,6 +76,7 @@ func cleanupExpiredPageNameRegistrations() {
 
 func deleteExpiredClient(clientID string, removeExpiredClient bool) {
 	log.Debugln("Delete expired page name:", clientID)
+	blobs.Default().ReleaseAll(clientID)
 	webClients := store.DeleteExpiredClient(clientID, removeExpiredClient)
 	go notifyInactiveWebClients(webClients)
 }
@@ -5,6 +5,7 @@ import (
 	"errors"
 	"fmt"
 	"strings"
+	"sync/atomic"
 	"time"
 
 	log "github.com/sirupsen/logrus"
@@ -43,6 +44,8 @@ type Client struct {
 	pages                map[string]*model.Page
 	pageNames            map[string]bool
 	exitExtendExpiration chan bool
+	msgpack              int32 // 1 if messages to the client are MessagePack
+	attrNames            model.AttrNameTable
 }
 
 func autoID() string {
@@ -125,14 +128,28 @@ func (c *Client) register(role ClientRole) {
 	}()
 }
 
-func (c *Client) readHandler(message []byte) error {
-	log.Debugf("Message from %s: %v\n", c.id, string(message))
+func (c *Client) readHandler(message []byte, binary bool) error {
 
 	// decode message
 	msg := &Message{}
-	err := json.Unmarshal(message, msg)
-	if err != nil {
-		return err
+	if binary {
+		// binary frames are MessagePack, once it's negotiated on registration
+		if atomic.LoadInt32(&c.msgpack) != 1 {
+			return errors.New("MessagePack framing was not negotiated")
+		}
+		// missing payload is decoded as nil
+		packed := &msgpackMessage{Payload: msgpackRaw{0xc0}}
+		if err := msgpackUnmarshal(message, packed); err != nil {
+			return err
+		}
+		msg.ID, msg.Action, msg.packed = packed.ID, packed.Action, packed.Payload
+		log.Debugf("Message from %s: %s (%d bytes of MessagePack)\n", c.id, msg.Action, len(message))
+	} else {
+		log.Debugf("Message from %s: %v\n", c.id, string(message))
+		err := json.Unmarshal(message, msg)
+		if err != nil {
+			return err
+		}
 	}
 
 	switch msg.Action {
@@ -162,13 +179,28 @@ func (c *Client) readHandler(message []byte) error {
 }
 
 func (c *Client) send(message []byte) {
+	// JSON messages from pubsub are sent as they are, in text frames
 	c.conn.Send(message)
 }
 
+// sendMessage sends a message in the framing negotiated with the client.
+func (c *Client) sendMessage(id string, action string, payload interface{}) {
+	if atomic.LoadInt32(&c.msgpack) == 1 {
+		packed, err := newMsgpackMessageData(id, action, payload)
+		if err != nil {
+			log.Errorf("error encoding message to MessagePack: %s", err)
+			return
+		}
+		c.conn.SendBinary(packed)
+		return
+	}
+	c.conn.Send(NewMessageData(id, action, payload))
+}
+
 func (c *Client) registerWebClient(message *Message) {
 	log.Println("registerWebClient()")
 	request := new(RegisterWebClientRequestPayload)
-	json.Unmarshal(message.Payload, request)
+	message.decodePayload(request)
 
 	// register logic
 	session, sessionCreated, response := c.registerWebClientCore(request)
@@ -286,6 +318,19 @@ func (c *Client) registerWebClientCore(request *RegisterWebClientRequestPayload)
 			msg := NewMessageData("", SessionCreatedAction, &SessionCreatedPayload{
 				PageName:  page.Name,
 				SessionID: session.ID,
+				// saves host client a round trip to fetch them
+				PageDetails: map[string]string{
+					"route":        request.PageRoute,
+					"pwa":          request.IsPWA,
+					"web":          request.IsWeb,
+					"platform":     request.Platform,
+					"width":        request.PageWidth,
+					"height":       request.PageHeight,
+					"windowWidth":  request.WindowWidth,
+					"windowHeight": request.WindowHeight,
+					"windowTop":    request.WindowTop,
+					"windowLeft":   request.WindowLeft,
+				},
 			})
 
 			// TODO
@@ -332,7 +377,11 @@ func (c *Client) registerHostClient(message *Message) {
 
 	log.Println("registerHostClient()")
 	request := new(RegisterHostClientRequestPayload)
-	json.Unmarshal(message.Payload, request)
+	message.decodePayload(request)
+
+	// host clients may only be able to compress, but not to decompress
+	// messages; they receive small messages anyway
+	c.conn.SetWriteCompression(false)
 
 	if request.HostClientID != "" {
 		hostClientID, err := c.decryptSensitiveData(request.HostClientID, c.clientIP)
@@ -441,7 +490,18 @@ response:
 
 	go notifyPageNameWaitingWebClients(pageName.String())
 
-	c.send(NewMessageData(message.ID, "", response))
+	if err == nil && request.Framing == MsgpackFraming {
+		response.Framing = MsgpackFraming
+	}
+	response.AttrTable = err == nil && request.AttrTable
+	response.Blobs = err == nil && request.Blobs
+
+	c.sendMessage(message.ID, "", response)
+
+	// the response is still sent as JSON in a text frame
+	if response.Framing == MsgpackFraming {
+		atomic.StoreInt32(&c.msgpack, 1)
+	}
 }
 
 func notifyPageNameWaitingWebClients(pageName string) {
@@ -509,16 +569,23 @@ func (c *Client) executeCommandFromHostClient(message *Message) {
 	log.Debugln("Page command from host client")
 
 	payload := new(PageCommandRequestPayload)
-	json.Unmarshal(message.Payload, payload)
+	message.decodePayload(payload)
 
 	responsePayload := &PageCommandResponsePayload{
 		Result: "",
 		Error:  "",
 	}
 
+	c.attrNames.Add(payload.AttrNames)
+	if err := c.attrNames.Resolve([]*model.Command{payload.Command}); err != nil {
+		responsePayload.Error = err.Error()
+		c.sendMessage(message.ID, "", responsePayload)
+		return
+	}
+
 	if !payload.Command.IsSupported() {
 		responsePayload.Error = fmt.Sprintf("unknown command: %s", payload.Command.Name)
-		c.send(NewMessageData(message.ID, "", responsePayload))
+		c.sendMessage(message.ID, "", responsePayload)
 		return
 	}
 
@@ -529,6 +596,7 @@ func (c *Client) executeCommandFromHostClient(message *Message) {
 		if session != nil {
 			// process command
 			handler := newSessionHandler(session)
+			handler.clientID = c.id
 			result, err := handler.execute(payload.Command)
 			responsePayload.Result = result
 
@@ -549,7 +617,7 @@ func (c *Client) executeCommandFromHostClient(message *Message) {
 	if payload.Command.ShouldReturn() {
 
 		// send response
-		c.send(NewMessageData(message.ID, "", responsePayload))
+		c.sendMessage(message.ID, "", responsePayload)
 	}
 }
 
@@ -557,17 +625,24 @@ func (c *Client) executeCommandsBatchFromHostClient(message *Message) {
 	log.Debugln("Page commands batch from host client")
 
 	payload := new(PageCommandsBatchRequestPayload)
-	json.Unmarshal(message.Payload, payload)
+	message.decodePayload(payload)
 
 	responsePayload := &PageCommandsBatchResponsePayload{
 		Results: make([]string, 0),
 		Error:   "",
 	}
 
+	c.attrNames.Add(payload.AttrNames)
+	if err := c.attrNames.Resolve(payload.Commands); err != nil {
+		responsePayload.Error = err.Error()
+		c.sendMessage(message.ID, "", responsePayload)
+		return
+	}
+
 	for _, command := range payload.Commands {
 		if !command.IsSupported() {
 			responsePayload.Error = fmt.Sprintf("unknown command: %s", command.Name)
-			c.send(NewMessageData(message.ID, "", responsePayload))
+			c.sendMessage(message.ID, "", responsePayload)
 			return
 		}
 	}
@@ -579,6 +654,7 @@ func (c *Client) executeCommandsBatchFromHostClient(message *Message) {
 		if session != nil {
 			// process command
 			handler := newSessionHandler(session)
+			handler.clientID = c.id
 			results, err := handler.executeBatch(payload.Commands)
 			responsePayload.Results = results
 			if err != nil {
@@ -593,7 +669,7 @@ func (c *Client) executeCommandsBatchFromHostClient(message *Message) {
 	}
 
 	// send response
-	c.send(NewMessageData(message.ID, "", responsePayload))
+	c.sendMessage(message.ID, "", responsePayload)
 
 	log.Debugf("Page commands batch response to %s - %v\n", c.id, responsePayload)
 }
@@ -615,7 +691,7 @@ func (c *Client) processPageEventFromWebClient(message *Message) {
 		"PageName:", session.Page.Name, "SessionID:", session.ID)
 
 	payload := new(PageEventPayload)
-	json.Unmarshal(message.Payload, payload)
+	message.decodePayload(payload)
 
 	// add page/session information to payload
 	payload.PageName = session.Page.Name
@@ -639,7 +715,7 @@ func (c *Client) updateControlPropsFromWebClient(message *Message) error {
 	}
 
 	payload := new(UpdateControlPropsPayload)
-	json.Unmarshal(message.Payload, payload)
+	message.decodePayload(payload)
 
 	log.Debugln("Update control props from web browser:", string(message.Payload),
 		"PageName:", session.Page.Name, "SessionID:", session.ID, "Props:", payload.Props)
@@ -671,7 +747,7 @@ func (c *Client) updateControlPropsFromWebClient(message *Message) error {
 
 func (c *Client) handleInactiveAppFromHostClient(message *Message) {
 	payload := new(InactiveAppRequestPayload)
-	json.Unmarshal(message.Payload, payload)
+	message.decodePayload(payload)
 
 	log.Println("Handle inactive app from host client", payload.PageName)
 
@@ -1,8 +1,11 @@
 package connection
 
-type ReadMessageHandler func(message []byte) error
+// ReadMessageHandler processes a message; binary is true for binary frames.
+type ReadMessageHandler func(message []byte, binary bool) error
 
 type Conn interface {
 	Start(handler ReadMessageHandler) bool
 	Send(message []byte)
+	SendBinary(message []byte)
+	SetWriteCompression(enabled bool)
 }
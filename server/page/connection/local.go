@@ -26,7 +26,7 @@ func (c *Local) Start(handler ReadMessageHandler) bool {
 func (c *Local) readLoop(readHandler ReadMessageHandler) {
 	for {
 		message := <-c.readCh
-		err := readHandler(message)
+		err := readHandler(message, false)
 		if err != nil {
 			log.Errorf("error processing message: %v", err)
 			break
@@ -37,3 +37,11 @@ func (c *Local) readLoop(readHandler ReadMessageHandler) {
 func (c *Local) Send(message []byte) {
 	c.writeCh <- message
 }
+
+func (c *Local) SendBinary(message []byte) {
+	c.writeCh <- message
+}
+
+func (c *Local) SetWriteCompression(enabled bool) {
+	// local messages are never compressed
+}
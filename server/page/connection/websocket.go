@@ -1,6 +1,7 @@
 package connection
 
 import (
+	"sync/atomic"
 	"time"
 
 	"github.com/flet-dev/flet/server/config"
@@ -19,17 +20,26 @@ const (
 	pingPeriod = (pongWait * 9) / 10
 )
 
+type outgoingMessage struct {
+	data   []byte
+	binary bool
+}
+
 type WebSocket struct {
-	conn *websocket.Conn
-	send chan []byte
-	done chan bool
+	conn                 *websocket.Conn
+	send                 chan outgoingMessage
+	done                 chan bool
+	compressionThreshold int
+	writeCompression     int32 // 1 if large messages are compressed
 }
 
 func NewWebSocket(conn *websocket.Conn) *WebSocket {
 	cws := &WebSocket{
-		conn: conn,
-		send: make(chan []byte, 10),
-		done: make(chan bool),
+		conn:                 conn,
+		send:                 make(chan outgoingMessage, 10),
+		done:                 make(chan bool),
+		compressionThreshold: config.WebSocketCompressionThreshold(),
+		writeCompression:     1,
 	}
 	return cws
 }
@@ -42,7 +52,22 @@ func (c *WebSocket) Start(handler ReadMessageHandler) bool {
 }
 
 func (c *WebSocket) Send(message []byte) {
-	c.send <- message
+	c.send <- outgoingMessage{data: message}
+}
+
+// SendBinary sends the message in a binary frame.
+func (c *WebSocket) SendBinary(message []byte) {
+	c.send <- outgoingMessage{data: message, binary: true}
+}
+
+// SetWriteCompression allows or disallows compression of outgoing messages
+// if permessage-deflate extension was negotiated with the client.
+func (c *WebSocket) SetWriteCompression(enabled bool) {
+	var v int32
+	if enabled {
+		v = 1
+	}
+	atomic.StoreInt32(&c.writeCompression, v)
 }
 
 func (c *WebSocket) readLoop(readHandler ReadMessageHandler) {
@@ -60,7 +85,7 @@ func (c *WebSocket) readLoop(readHandler ReadMessageHandler) {
 		return nil
 	})
 	for {
-		_, message, err := c.conn.ReadMessage()
+		messageType, message, err := c.conn.ReadMessage()
 
 		if err != nil {
 			if websocket.IsCloseError(err, websocket.CloseNormalClosure) {
@@ -71,7 +96,7 @@ func (c *WebSocket) readLoop(readHandler ReadMessageHandler) {
 			break
 		}
 
-		err = readHandler(message)
+		err = readHandler(message, messageType == websocket.BinaryMessage)
 		if err != nil {
 			log.Errorf("error processing WebSocket message: %v", err)
 			break
@@ -96,12 +121,21 @@ func (c *WebSocket) writeLoop() {
 				return
 			}
 
-			w, err := c.conn.NextWriter(websocket.TextMessage)
+			messageType := websocket.TextMessage
+			if message.binary {
+				messageType = websocket.BinaryMessage
+			}
+
+			// it's a no-op if compression was not negotiated
+			c.conn.EnableWriteCompression(atomic.LoadInt32(&c.writeCompression) == 1 &&
+				len(message.data) >= c.compressionThreshold)
+
+			w, err := c.conn.NextWriter(messageType)
 			if err != nil {
 				log.Errorf("Error creating WebSocket message writer: %v", err)
 				return
 			}
-			_, err = w.Write(message)
+			_, err = w.Write(message.data)
 			if err != nil {
 				log.Errorf("Error writing WebSocket message: %v", err)
 				return
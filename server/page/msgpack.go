@@ -0,0 +1,509 @@
+package page
+
+import (
+	"bytes"
+	"encoding/binary"
+	"errors"
+	"fmt"
+	"math"
+	"reflect"
+	"strings"
+	"sync"
+)
+
+// MessagePack framing of host client messages.
+// Binary frames are decoded straight into message and payload structs and
+// encoded from them, using the same field names as their json tags.
+
+const MsgpackFraming = "msgpack"
+
+var errMsgpackShort = errors.New("msgpack: unexpected end of data")
+
+// msgpackMessage is a Message in a binary frame; its payload is decoded
+// by the handler which knows the payload type.
+type msgpackMessage struct {
+	ID      string     `json:"id"`
+	Action  string     `json:"action"`
+	Payload msgpackRaw `json:"payload"`
+}
+
+// msgpackRaw is an encoded MessagePack value.
+type msgpackRaw []byte
+
+var msgpackRawType = reflect.TypeOf(msgpackRaw(nil))
+
+func newMsgpackMessageData(id string, action string, payload interface{}) ([]byte, error) {
+	packed, err := msgpackMarshal(payload)
+	if err != nil {
+		return nil, err
+	}
+	return msgpackMarshal(&msgpackMessage{ID: id, Action: action, Payload: packed})
+}
+
+func msgpackMarshal(v interface{}) ([]byte, error) {
+	var buf bytes.Buffer
+	if err := msgpackEncode(&buf, reflect.ValueOf(v)); err != nil {
+		return nil, err
+	}
+	return buf.Bytes(), nil
+}
+
+func msgpackUnmarshal(data []byte, v interface{}) error {
+	rv := reflect.ValueOf(v)
+	if rv.Kind() != reflect.Ptr || rv.IsNil() {
+		return fmt.Errorf("msgpack: cannot decode into %T", v)
+	}
+	d := &msgpackDecoder{data: data}
+	if err := d.decode(rv.Elem()); err != nil {
+		return err
+	}
+	if d.pos < len(data) {
+		return fmt.Errorf("msgpack: %d extra bytes", len(data)-d.pos)
+	}
+	return nil
+}
+
+// struct fields by their json names
+
+type msgpackField struct {
+	name      string
+	index     int
+	omitEmpty bool
+}
+
+type msgpackStruct struct {
+	fields []msgpackField
+	byName map[string]int
+}
+
+var msgpackStructs sync.Map // reflect.Type -> *msgpackStruct
+
+func getMsgpackStruct(t reflect.Type) *msgpackStruct {
+	if s, ok := msgpackStructs.Load(t); ok {
+		return s.(*msgpackStruct)
+	}
+	s := &msgpackStruct{byName: make(map[string]int)}
+	for i := 0; i < t.NumField(); i++ {
+		f := t.Field(i)
+		tag := f.Tag.Get("json")
+		if f.PkgPath != "" || tag == "-" {
+			continue
+		}
+		name, opts := tag, ""
+		if n := strings.IndexByte(tag, ','); n >= 0 {
+			name, opts = tag[:n], tag[n:]
+		}
+		if name == "" {
+			name = f.Name
+		}
+		s.byName[name] = len(s.fields)
+		s.fields = append(s.fields, msgpackField{
+			name:      name,
+			index:     i,
+			omitEmpty: strings.Contains(opts, ",omitempty"),
+		})
+	}
+	msgpackStructs.Store(t, s)
+	return s
+}
+
+// encoding
+
+func msgpackEncode(buf *bytes.Buffer, v reflect.Value) error {
+	if !v.IsValid() {
+		buf.WriteByte(0xc0)
+		return nil
+	}
+	if v.Type() == msgpackRawType {
+		if v.Len() == 0 {
+			buf.WriteByte(0xc0)
+		} else {
+			buf.Write(v.Bytes())
+		}
+		return nil
+	}
+	switch v.Kind() {
+	case reflect.Ptr, reflect.Interface:
+		if v.IsNil() {
+			buf.WriteByte(0xc0)
+			return nil
+		}
+		return msgpackEncode(buf, v.Elem())
+	case reflect.Bool:
+		if v.Bool() {
+			buf.WriteByte(0xc3)
+		} else {
+			buf.WriteByte(0xc2)
+		}
+	case reflect.Int, reflect.Int8, reflect.Int16, reflect.Int32, reflect.Int64:
+		msgpackEncodeInt(buf, v.Int())
+	case reflect.Uint, reflect.Uint8, reflect.Uint16, reflect.Uint32, reflect.Uint64:
+		if n := v.Uint(); n <= math.MaxInt64 {
+			msgpackEncodeInt(buf, int64(n))
+		} else {
+			buf.WriteByte(0xcf)
+			binary.Write(buf, binary.BigEndian, n)
+		}
+	case reflect.Float32, reflect.Float64:
+		buf.WriteByte(0xcb)
+		binary.Write(buf, binary.BigEndian, math.Float64bits(v.Float()))
+	case reflect.String:
+		msgpackEncodeString(buf, v.String())
+	case reflect.Slice, reflect.Array:
+		if v.Kind() == reflect.Slice && v.IsNil() {
+			buf.WriteByte(0xc0)
+			return nil
+		}
+		msgpackEncodeHeader(buf, v.Len(), 0x90, 0xdc)
+		for i := 0; i < v.Len(); i++ {
+			if err := msgpackEncode(buf, v.Index(i)); err != nil {
+				return err
+			}
+		}
+	case reflect.Map:
+		if v.Type().Key().Kind() != reflect.String {
+			return fmt.Errorf("msgpack: unsupported map key type %s", v.Type().Key())
+		}
+		if v.IsNil() {
+			buf.WriteByte(0xc0)
+			return nil
+		}
+		msgpackEncodeHeader(buf, v.Len(), 0x80, 0xde)
+		iter := v.MapRange()
+		for iter.Next() {
+			msgpackEncodeString(buf, iter.Key().String())
+			if err := msgpackEncode(buf, iter.Value()); err != nil {
+				return err
+			}
+		}
+	case reflect.Struct:
+		s := getMsgpackStruct(v.Type())
+		n := 0
+		for _, f := range s.fields {
+			if !f.omitEmpty || !v.Field(f.index).IsZero() {
+				n++
+			}
+		}
+		msgpackEncodeHeader(buf, n, 0x80, 0xde)
+		for _, f := range s.fields {
+			fv := v.Field(f.index)
+			if f.omitEmpty && fv.IsZero() {
+				continue
+			}
+			msgpackEncodeString(buf, f.name)
+			if err := msgpackEncode(buf, fv); err != nil {
+				return err
+			}
+		}
+	default:
+		return fmt.Errorf("msgpack: unsupported type %s", v.Type())
+	}
+	return nil
+}
+
+func msgpackEncodeInt(buf *bytes.Buffer, n int64) {
+	switch {
+	case n >= 0 && n <= 127:
+		buf.WriteByte(byte(n))
+	case n < 0 && n >= -32:
+		buf.WriteByte(byte(n))
+	case n >= math.MinInt32 && n <= math.MaxInt32:
+		buf.WriteByte(0xd2)
+		binary.Write(buf, binary.BigEndian, int32(n))
+	default:
+		buf.WriteByte(0xd3)
+		binary.Write(buf, binary.BigEndian, n)
+	}
+}
+
+func msgpackEncodeString(buf *bytes.Buffer, s string) {
+	n := len(s)
+	switch {
+	case n < 32:
+		buf.WriteByte(0xa0 | byte(n))
+	case n <= math.MaxUint8:
+		buf.WriteByte(0xd9)
+		buf.WriteByte(byte(n))
+	case n <= math.MaxUint16:
+		buf.WriteByte(0xda)
+		binary.Write(buf, binary.BigEndian, uint16(n))
+	default:
+		buf.WriteByte(0xdb)
+		binary.Write(buf, binary.BigEndian, uint32(n))
+	}
+	buf.WriteString(s)
+}
+
+// writes array (fix=0x90, code16=0xdc) or map (fix=0x80, code16=0xde) header
+func msgpackEncodeHeader(buf *bytes.Buffer, n int, fix byte, code16 byte) {
+	switch {
+	case n < 16:
+		buf.WriteByte(fix | byte(n))
+	case n <= math.MaxUint16:
+		buf.WriteByte(code16)
+		binary.Write(buf, binary.BigEndian, uint16(n))
+	default:
+		buf.WriteByte(code16 + 1)
+		binary.Write(buf, binary.BigEndian, uint32(n))
+	}
+}
+
+// decoding
+
+type msgpackType int
+
+const (
+	msgpackNil msgpackType = iota
+	msgpackBool
+	msgpackInt
+	msgpackUint
+	msgpackFloat
+	msgpackString
+	msgpackArray
+	msgpackMap
+)
+
+type msgpackDecoder struct {
+	data []byte
+	pos  int
+}
+
+func (d *msgpackDecoder) readUint(size int) (uint64, error) {
+	if len(d.data)-d.pos < size {
+		return 0, errMsgpackShort
+	}
+	var n uint64
+	for _, b := range d.data[d.pos : d.pos+size] {
+		n = n<<8 | uint64(b)
+	}
+	d.pos += size
+	return n, nil
+}
+
+func (d *msgpackDecoder) readBytes(n uint64) ([]byte, error) {
+	if uint64(len(d.data)-d.pos) < n {
+		return nil, errMsgpackShort
+	}
+	b := d.data[d.pos : d.pos+int(n)]
+	d.pos += int(n)
+	return b, nil
+}
+
+// next reads the header of the next value. n is the value of bool and
+// number types (float64 bits for floats) and the length of the others;
+// string bytes and array or map items follow the header.
+func (d *msgpackDecoder) next() (msgpackType, uint64, error) {
+	c, err := d.readUint(1)
+	if err != nil {
+		return 0, 0, err
+	}
+	var t msgpackType
+	var n uint64
+	switch {
+	case c <= 0x7f:
+		return msgpackInt, c, nil
+	case c >= 0xe0:
+		return msgpackInt, uint64(int64(int8(c))), nil
+	case c >= 0x80 && c <= 0x8f:
+		t, n = msgpackMap, c&0x0f
+	case c >= 0x90 && c <= 0x9f:
+		t, n = msgpackArray, c&0x0f
+	case c >= 0xa0 && c <= 0xbf:
+		return msgpackString, c & 0x1f, nil
+	case c == 0xc0:
+		return msgpackNil, 0, nil
+	case c == 0xc2, c == 0xc3:
+		return msgpackBool, c & 1, nil
+	case c == 0xc4, c == 0xd9:
+		t = msgpackString
+		n, err = d.readUint(1)
+	case c == 0xc5, c == 0xda:
+		t = msgpackString
+		n, err = d.readUint(2)
+	case c == 0xc6, c == 0xdb:
+		t = msgpackString
+		n, err = d.readUint(4)
+	case c == 0xca:
+		n, err = d.readUint(4)
+		return msgpackFloat, math.Float64bits(float64(math.Float32frombits(uint32(n)))), err
+	case c == 0xcb:
+		n, err = d.readUint(8)
+		return msgpackFloat, n, err
+	case c >= 0xcc && c <= 0xcf:
+		n, err = d.readUint(1 << (c - 0xcc))
+		return msgpackUint, n, err
+	case c == 0xd0:
+		n, err = d.readUint(1)
+		return msgpackInt, uint64(int64(int8(n))), err
+	case c == 0xd1:
+		n, err = d.readUint(2)
+		return msgpackInt, uint64(int64(int16(n))), err
+	case c == 0xd2:
+		n, err = d.readUint(4)
+		return msgpackInt, uint64(int64(int32(n))), err
+	case c == 0xd3:
+		n, err = d.readUint(8)
+		return msgpackInt, n, err
+	case c == 0xdc, c == 0xde:
+		t = msgpackArray + msgpackType(c-0xdc)/2
+		n, err = d.readUint(2)
+	case c == 0xdd, c == 0xdf:
+		t = msgpackArray + msgpackType(c-0xdd)/2
+		n, err = d.readUint(4)
+	default:
+		return 0, 0, fmt.Errorf("msgpack: unsupported type 0x%x", c)
+	}
+	if err != nil {
+		return 0, 0, err
+	}
+	if n > uint64(len(d.data)-d.pos) {
+		// each byte of a string and each item takes at least one byte
+		return 0, 0, errMsgpackShort
+	}
+	return t, n, nil
+}
+
+func (d *msgpackDecoder) skip() error {
+	t, n, err := d.next()
+	if err != nil {
+		return err
+	}
+	switch t {
+	case msgpackString:
+		_, err = d.readBytes(n)
+		return err
+	case msgpackMap:
+		n *= 2
+		fallthrough
+	case msgpackArray:
+		for i := uint64(0); i < n; i++ {
+			if err := d.skip(); err != nil {
+				return err
+			}
+		}
+	}
+	return nil
+}
+
+func (d *msgpackDecoder) decode(v reflect.Value) error {
+	if v.Type() == msgpackRawType {
+		start := d.pos
+		if err := d.skip(); err != nil {
+			return err
+		}
+		v.SetBytes(d.data[start:d.pos])
+		return nil
+	}
+	t, n, err := d.next()
+	if err != nil {
+		return err
+	}
+	return d.decodeValue(v, t, n)
+}
+
+func (d *msgpackDecoder) decodeValue(v reflect.Value, t msgpackType, n uint64) error {
+	if t == msgpackNil {
+		v.Set(reflect.Zero(v.Type()))
+		return nil
+	}
+	mismatch := func() error {
+		return fmt.Errorf("msgpack: cannot decode type %d into %s", t, v.Type())
+	}
+	switch v.Kind() {
+	case reflect.Ptr:
+		if v.IsNil() {
+			v.Set(reflect.New(v.Type().Elem()))
+		}
+		return d.decodeValue(v.Elem(), t, n)
+	case reflect.Bool:
+		if t != msgpackBool {
+			return mismatch()
+		}
+		v.SetBool(n == 1)
+	case reflect.Int, reflect.Int8, reflect.Int16, reflect.Int32, reflect.Int64:
+		if (t != msgpackInt && t != msgpackUint) || (t == msgpackUint && n > math.MaxInt64) ||
+			v.OverflowInt(int64(n)) {
+			return mismatch()
+		}
+		v.SetInt(int64(n))
+	case reflect.Uint, reflect.Uint8, reflect.Uint16, reflect.Uint32, reflect.Uint64:
+		if (t != msgpackInt && t != msgpackUint) || (t == msgpackInt && int64(n) < 0) ||
+			v.OverflowUint(n) {
+			return mismatch()
+		}
+		v.SetUint(n)
+	case reflect.Float32, reflect.Float64:
+		switch t {
+		case msgpackInt:
+			v.SetFloat(float64(int64(n)))
+		case msgpackUint:
+			v.SetFloat(float64(n))
+		case msgpackFloat:
+			v.SetFloat(math.Float64frombits(n))
+		default:
+			return mismatch()
+		}
+	case reflect.String:
+		if t != msgpackString {
+			return mismatch()
+		}
+		b, err := d.readBytes(n)
+		if err != nil {
+			return err
+		}
+		v.SetString(string(b))
+	case reflect.Slice:
+		if t != msgpackArray {
+			return mismatch()
+		}
+		s := reflect.MakeSlice(v.Type(), int(n), int(n))
+		for i := 0; i < int(n); i++ {
+			if err := d.decode(s.Index(i)); err != nil {
+				return err
+			}
+		}
+		v.Set(s)
+	case reflect.Map:
+		if t != msgpackMap || v.Type().Key().Kind() != reflect.String {
+			return mismatch()
+		}
+		m := reflect.MakeMapWithSize(v.Type(), int(n))
+		for i := 0; i < int(n); i++ {
+			key := reflect.New(v.Type().Key()).Elem()
+			if err := d.decode(key); err != nil {
+				return err
+			}
+			item := reflect.New(v.Type().Elem()).Elem()
+			if err := d.decode(item); err != nil {
+				return err
+			}
+			m.SetMapIndex(key, item)
+		}
+		v.Set(m)
+	case reflect.Struct:
+		if t != msgpackMap {
+			return mismatch()
+		}
+		s := getMsgpackStruct(v.Type())
+		var name string
+		for i := 0; i < int(n); i++ {
+			if err := d.decode(reflect.ValueOf(&name).Elem()); err != nil {
+				return err
+			}
+			f, ok := s.byName[name]
+			var err error
+			if ok {
+				err = d.decode(v.Field(s.fields[f].index))
+			} else {
+				// unknown fields are ignored, like in JSON
+				err = d.skip()
+			}
+			if err != nil {
+				return err
+			}
+		}
+	default:
+		return fmt.Errorf("msgpack: unsupported type %s", v.Type())
+	}
+	return nil
+}
@@ -0,0 +1,110 @@
+package page
+
+import (
+	"encoding/hex"
+	"encoding/json"
+	"reflect"
+	"strings"
+	"testing"
+
+	"github.com/flet-dev/flet/server/model"
+)
+
+func TestMsgpackRoundTrip(t *testing.T) {
+	payload := &PageCommandsBatchRequestPayload{
+		PageName:  "p",
+		SessionID: "s",
+		Commands: []*model.Command{{
+			Name:  "add",
+			Attrs: map[string]string{"to": "page", "at": "0"},
+			Commands: []*model.Command{{
+				Indent: 1,
+				Name:   "text",
+				Attrs:  map[string]string{"value": strings.Repeat("x", 300)},
+			}},
+		}},
+		AttrNames: []string{"value"},
+	}
+
+	packed, err := newMsgpackMessageData("1", PageCommandsBatchFromHostAction, payload)
+	if err != nil {
+		t.Fatal(err)
+	}
+	if data := NewMessageData("1", PageCommandsBatchFromHostAction, payload); len(packed) >= len(data) {
+		t.Errorf("newMsgpackMessageData: %d bytes is not smaller than %d", len(packed), len(data))
+	}
+
+	msg := &msgpackMessage{}
+	if err := msgpackUnmarshal(packed, msg); err != nil {
+		t.Fatal(err)
+	}
+	if msg.ID != "1" || msg.Action != PageCommandsBatchFromHostAction {
+		t.Errorf("msgpackUnmarshal: wrong message %s %s", msg.ID, msg.Action)
+	}
+	actual := &PageCommandsBatchRequestPayload{}
+	if err := (&Message{packed: msg.Payload}).decodePayload(actual); err != nil {
+		t.Fatal(err)
+	}
+	if !reflect.DeepEqual(payload, actual) {
+		t.Errorf("decodePayload: expected %v, actual %v", payload, actual)
+	}
+}
+
+func TestMsgpackDecodeHostMessage(t *testing.T) {
+	// {"id": "1", "action": "pageCommandFromHost", "payload": {"pageName": "p",
+	// "sessionID": "s", "command": {"i": 1, "n": "set", "v": ["_1"],
+	// "a": {"value": "x"}, "c": []}, "attrNames": None, "extra": [-1, 2.5, {"k": True}]}}
+	// packed by msgpack Python package
+	data, _ := hex.DecodeString("83a26964a131a6616374696f6eb370616765436f6d6d616e6446726f6d486f7374a7" +
+		"7061796c6f616485a8706167654e616d65a170a973657373696f6e4944a173a7636f6d6d616e6485a16901a16e" +
+		"a3736574a17691a25f31a16181a576616c7565a178a16390a9617474724e616d6573c0a5657874726193ffcb40" +
+		"0400000000000081a16bc3")
+
+	msg := &msgpackMessage{}
+	if err := msgpackUnmarshal(data, msg); err != nil {
+		t.Fatal(err)
+	}
+	payload := &PageCommandRequestPayload{}
+	if err := msgpackUnmarshal(msg.Payload, payload); err != nil {
+		t.Fatal(err)
+	}
+	expected := &PageCommandRequestPayload{
+		PageName:  "p",
+		SessionID: "s",
+		Command: &model.Command{
+			Indent:   1,
+			Name:     "set",
+			Values:   []string{"_1"},
+			Attrs:    map[string]string{"value": "x"},
+			Commands: []*model.Command{},
+		},
+	}
+	if !reflect.DeepEqual(expected, payload) {
+		t.Errorf("msgpackUnmarshal: expected %v, actual %v", expected, payload)
+	}
+
+	// same result as JSON
+	fromJSON := &PageCommandRequestPayload{}
+	json.Unmarshal([]byte(`{"pageName":"p","sessionID":"s","command":{"i":1,"n":"set","v":["_1"],"a":{"value":"x"},"c":[]},"attrNames":null}`), fromJSON)
+	if !reflect.DeepEqual(fromJSON, payload) {
+		t.Errorf("msgpackUnmarshal: expected %v, actual %v", fromJSON, payload)
+	}
+}
+
+func TestMsgpackDecodeErrors(t *testing.T) {
+	packed, _ := newMsgpackMessageData("1", "", &PageCommandsBatchResponsePayload{Results: []string{"a", "b"}})
+	for i := 0; i < len(packed); i++ {
+		if err := msgpackUnmarshal(packed[:i], &msgpackMessage{}); err == nil {
+			t.Errorf("msgpackUnmarshal: no error for %d of %d bytes", i, len(packed))
+		}
+	}
+	if err := msgpackUnmarshal(append(packed, 0xc0), &msgpackMessage{}); err == nil {
+		t.Errorf("msgpackUnmarshal: no error for extra bytes")
+	}
+
+	// {"results": 1}
+	if err := msgpackUnmarshal([]byte{0x81, 0xa7, 'r', 'e', 's', 'u', 'l', 't', 's', 0x01},
+		&PageCommandsBatchResponsePayload{}); err == nil {
+		t.Errorf("msgpackUnmarshal: no error for wrong type")
+	}
+}
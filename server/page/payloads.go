@@ -10,6 +10,15 @@ type Message struct {
 	ID      string          `json:"id"`
 	Action  string          `json:"action"`
 	Payload json.RawMessage `json:"payload"`
+	packed  msgpackRaw      // payload of a MessagePack message
+}
+
+// decodePayload decodes JSON or MessagePack payload of the message into v.
+func (m *Message) decodePayload(v interface{}) error {
+	if m.packed != nil {
+		return msgpackUnmarshal(m.packed, v)
+	}
+	return json.Unmarshal(m.Payload, v)
 }
 
 func NewMessageData(id string, action string, payload interface{}) []byte {
@@ -38,6 +47,9 @@ type RegisterHostClientRequestPayload struct {
 	Update       bool   `json:"update"`
 	AuthToken    string `json:"authToken"`
 	Permissions  string `json:"permissions"`
+	Framing      string `json:"framing"`
+	AttrTable    bool   `json:"attrTable"`
+	Blobs        bool   `json:"blobs"`
 }
 
 type RegisterHostClientResponsePayload struct {
@@ -45,6 +57,9 @@ type RegisterHostClientResponsePayload struct {
 	SessionID    string `json:"sessionID"`
 	PageName     string `json:"pageName"`
 	Error        string `json:"error"`
+	Framing      string `json:"framing,omitempty"`
+	AttrTable    bool   `json:"attrTable,omitempty"`
+	Blobs        bool   `json:"blobs,omitempty"`
 }
 
 type RegisterWebClientRequestPayload struct {
@@ -74,14 +89,16 @@ type SessionPayload struct {
 }
 
 type SessionCreatedPayload struct {
-	PageName  string `json:"pageName"`
-	SessionID string `json:"sessionID"`
+	PageName    string            `json:"pageName"`
+	SessionID   string            `json:"sessionID"`
+	PageDetails map[string]string `json:"pageDetails"`
 }
 
 type PageCommandRequestPayload struct {
 	PageName  string         `json:"pageName"`
 	SessionID string         `json:"sessionID"`
 	Command   *model.Command `json:"command"`
+	AttrNames []string       `json:"attrNames"`
 }
 
 type PageCommandResponsePayload struct {
@@ -93,6 +110,7 @@ type PageCommandsBatchRequestPayload struct {
 	PageName  string           `json:"pageName"`
 	SessionID string           `json:"sessionID"`
 	Commands  []*model.Command `json:"commands"`
+	AttrNames []string         `json:"attrNames"`
 }
 
 type PageCommandsBatchResponsePayload struct {
@@ -135,6 +153,11 @@ type RemoveControlPayload struct {
 	IDs []string `json:"ids"`
 }
 
+type MoveControlPayload struct {
+	IDs []string `json:"ids"`
+	At  int      `json:"at"`
+}
+
 type CleanControlPayload struct {
 	IDs []string `json:"ids"`
 }
@@ -9,6 +9,7 @@ import (
 	"strings"
 	"time"
 
+	"github.com/flet-dev/flet/server/blobs"
 	"github.com/flet-dev/flet/server/cache"
 	"github.com/flet-dev/flet/server/config"
 	"github.com/flet-dev/flet/server/model"
@@ -33,6 +34,8 @@ type commandHandlerFn = func(*model.Command) (string, error)
 
 type sessionHandler struct {
 	session *model.Session
+	// host client executing commands, owns blobs it puts
+	clientID string
 }
 
 func newSessionHandler(session *model.Session) sessionHandler {
@@ -101,9 +104,12 @@ func (h *sessionHandler) execute(cmd *model.Command) (result string, err error)
 		model.GetCommand:            h.get,
 		model.CleanCommand:          h.clean,
 		model.RemoveCommand:         h.remove,
+		model.MoveCommand:           h.move,
 		model.OAuthAuthorizeCommand: h.oauthAuthorize,
 		model.InvokeMethodCommand:   h.invokeMethod,
 		model.GetUploadUrlCommand:   h.getUploadUrl,
+		model.PutBlobCommand:        h.putBlob,
+		model.DelBlobCommand:        h.delBlob,
 		model.ErrorCommand:          h.sessionCrashed,
 	}
 
@@ -156,6 +162,18 @@ func (h *sessionHandler) executeBatch(commands []*model.Command) (results []stri
 				return nil, err
 			}
 			messages = append(messages, NewMessage("", RemoveControlAction, payload))
+		} else if cmdName == model.MoveCommand {
+			payload, err := h.moveWithMessage(cmd)
+			if err != nil {
+				return nil, err
+			}
+			messages = append(messages, NewMessage("", MoveControlAction, payload))
+		} else if cmdName == model.PutBlobCommand {
+			if _, err := h.putBlob(cmd); err != nil {
+				return nil, err
+			}
+		} else if cmdName == model.DelBlobCommand {
+			h.delBlob(cmd)
 		}
 	}
 
@@ -676,6 +694,72 @@ func (h *sessionHandler) removeInternal(ids []string, at int) (allIDs []string,
 	return allIDs, nil
 }
 
+func (h *sessionHandler) move(cmd *model.Command) (result string, err error) {
+	payload, err := h.moveWithMessage(cmd)
+	if err != nil {
+		return "", err
+	}
+
+	// broadcast command to all connected web clients
+	h.broadcastCommandToWebClients(NewMessage("", MoveControlAction, payload))
+	return "", nil
+}
+
+func (h *sessionHandler) moveWithMessage(cmd *model.Command) (result *MoveControlPayload, err error) {
+
+	// command format:
+	//    move id_1 [id_2] ... at=index
+	// all controls must have the same parent and are placed
+	// one after another starting at the given index
+
+	if len(cmd.Values) == 0 {
+		return nil, errors.New("at least one control ID must be specified")
+	}
+
+	at, err := strconv.Atoi(cmd.Attrs["at"])
+	if err != nil || at < 0 {
+		return nil, errors.New("'at' must be a non-negative integer")
+	}
+
+	err = h.moveInternal(cmd.Values, at)
+	if err != nil {
+		return nil, err
+	}
+
+	return &MoveControlPayload{
+		IDs: cmd.Values,
+		At:  at,
+	}, nil
+}
+
+func (h *sessionHandler) moveInternal(ids []string, at int) error {
+
+	var parentCtrl *model.Control
+	for _, id := range ids {
+		ctrl := h.getControl(id)
+		if ctrl == nil {
+			return fmt.Errorf("control with ID '%s' not found", id)
+		}
+
+		if parentCtrl == nil {
+			parentCtrl = h.getControl(ctrl.ParentID())
+			if parentCtrl == nil {
+				return fmt.Errorf("parent control with id '%s' not found", ctrl.ParentID())
+			}
+		} else if ctrl.ParentID() != parentCtrl.ID() {
+			return errors.New("moved controls must have the same parent")
+		}
+
+		parentCtrl.RemoveChild(id)
+	}
+
+	for i, id := range ids {
+		parentCtrl.InsertChildID(id, at+i)
+	}
+
+	return store.SetSessionControl(h.session, parentCtrl)
+}
+
 func (h *sessionHandler) sessionCrashed(cmd *model.Command) (result string, err error) {
 	errorMessage := sessionCrashedMessage
 
@@ -741,6 +825,20 @@ func (h *sessionHandler) getUploadUrl(cmd *model.Command) (result string, err er
 	return GetUploadUrl(fileName, expires), nil
 }
 
+// putBlob stores blob which controls refer to with /api/blob/{hash} URL.
+func (h *sessionHandler) putBlob(cmd *model.Command) (result string, err error) {
+	if len(cmd.Values) < 1 {
+		return "", fmt.Errorf("putblob command should have blob hash")
+	}
+	return "", blobs.Default().PutBase64(h.clientID, cmd.Values[0], cmd.Attrs["data"])
+}
+
+// delBlob releases blobs the host client doesn't use anymore.
+func (h *sessionHandler) delBlob(cmd *model.Command) (result string, err error) {
+	blobs.Default().Release(h.clientID, cmd.Values...)
+	return "", nil
+}
+
 func (h *sessionHandler) updateControlProps(props []map[string]string) error {
 	sl := h.lockSession()
 	defer sl.Unlock()
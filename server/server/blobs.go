@@ -0,0 +1,31 @@
+package server
+
+import (
+	"net/http"
+	"strings"
+
+	"github.com/flet-dev/flet/server/blobs"
+	"github.com/gin-gonic/gin"
+)
+
+// blobHandler serves blobs uploaded by host clients.
+// The name is a blob hash with optional ".svg" extension.
+func blobHandler(c *gin.Context) {
+	name := c.Param("name")
+	hash := strings.TrimSuffix(name, ".svg")
+
+	data, ok := blobs.Default().Get(hash)
+	if !ok {
+		c.String(http.StatusNotFound, "blob not found")
+		return
+	}
+
+	contentType := http.DetectContentType(data)
+	if hash != name {
+		contentType = "image/svg+xml"
+	}
+
+	// blob content never changes
+	c.Header("Cache-Control", "public, max-age=31536000, immutable")
+	c.Data(http.StatusOK, contentType, data)
+}
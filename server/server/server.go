@@ -6,7 +6,10 @@ import (
 	"fmt"
 	"io"
 	"mime"
+	"net"
 	"net/http"
+	"os"
+	"strconv"
 	"strings"
 	"sync"
 	"time"
@@ -90,6 +93,7 @@ func Start(ctx context.Context, wg *sync.WaitGroup, serverPort int) {
 
 	api.GET("/oauth/redirect", oauthCallbackHandler)
 	api.PUT("/upload", uploadFileAsStream)
+	api.GET("/blob/:name", blobHandler)
 
 	// unknown API routes - 404, all the rest - index.html
 	router.NoRoute(func(c *gin.Context) {
@@ -158,8 +162,11 @@ func Start(ctx context.Context, wg *sync.WaitGroup, serverPort int) {
 	// Initializing the server in a goroutine so that
 	// it won't block the graceful shutdown handling below
 	go func() {
+		var ln net.Listener
 		for i := 1; i < 10; i++ {
-			if err := srv.ListenAndServe(); err != nil && err != http.ErrServerClosed {
+			var err error
+			ln, err = net.Listen("tcp", addr)
+			if err != nil {
 				if i == 9 {
 					log.Fatalf("listen: %s\n", err)
 				}
@@ -168,6 +175,10 @@ func Start(ctx context.Context, wg *sync.WaitGroup, serverPort int) {
 			}
 			break
 		}
+		notifyReady(ln.Addr())
+		if err := srv.Serve(ln); err != nil && err != http.ErrServerClosed {
+			log.Fatalf("serve: %s\n", err)
+		}
 	}()
 
 	go func() {
@@ -189,11 +200,33 @@ func Start(ctx context.Context, wg *sync.WaitGroup, serverPort int) {
 	log.Println("Server exited")
 }
 
+// notifyReady lets the process which started the server know that
+// the server accepts connections by writing its port to FLET_READY_FILE.
+func notifyReady(addr net.Addr) {
+	readyFile := config.ReadyFile()
+	if readyFile == "" {
+		return
+	}
+	port := addr.(*net.TCPAddr).Port
+	// the file appears complete
+	tmpFile := readyFile + ".tmp"
+	if err := os.WriteFile(tmpFile, []byte(strconv.Itoa(port)), 0644); err != nil {
+		log.Errorf("Error writing ready file: %s", err)
+		return
+	}
+	if err := os.Rename(tmpFile, readyFile); err != nil {
+		log.Errorf("Error writing ready file: %s", err)
+		return
+	}
+	log.Debugln("Server is ready, port written to", readyFile)
+}
+
 func websocketHandler(c *gin.Context) {
 
 	upgrader.CheckOrigin = func(r *http.Request) bool {
 		return true
 	}
+	upgrader.EnableCompression = config.WebSocketCompression()
 
 	conn, err := upgrader.Upgrade(c.Writer, c.Request, nil)
 	if err != nil {